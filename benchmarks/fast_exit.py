@@ -0,0 +1,45 @@
+"""benchmark: fast exit mode, on a command building a 5M-object result
+
+$ python benchmarks/fast_exit.py --size 5000000
+
+each run is a subprocess (the teardown is the target), "normal" is the default,
+"fast" is Config(fast_exit=True) (gc.freeze() + gc.disable() and os._exit()).
+"""
+import os
+import subprocess
+import sys
+import time
+from handofcats import as_command
+
+CHILD = """\
+import sys
+from handofcats.config import Config
+from handofcats.driver import Driver
+
+
+def build(*, size: int) -> list:
+    # tuple, str and list per item (+ the outer list)
+    return [(i, str(i), [i]) for i in range(size // 4)]
+
+
+config = Config(fast_exit={fast_exit}, cont=lambda x: print(len(x)))
+Driver(build, config=config).run(["--size", "{size}"])
+"""
+
+
+def _run(*, size: int, fast_exit: bool) -> float:
+    code = CHILD.format(size=size, fast_exit=fast_exit)
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    st = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-c", code], env=env, check=True, stdout=subprocess.DEVNULL
+    )
+    return time.perf_counter() - st
+
+
+@as_command
+def main(*, size: int = 5_000_000, n: int = 3) -> None:
+    for fast_exit in (False, True):
+        elapsed = [_run(size=size, fast_exit=fast_exit) for _ in range(n)]
+        name = "fast" if fast_exit else "normal"
+        print(f"{name:>6}: best={min(elapsed):.3f}s mean={sum(elapsed) / n:.3f}s")
@@ -0,0 +1,53 @@
+"""benchmark: synchronous logging (--logging) vs queue based logging (--logging-queue)
+
+$ python benchmarks/logging_queue.py --size 1000000
+
+each mode is run in a subprocess, logging SIZE lines to a temporary file.
+"call" is the time spent in the command function (the hot path),
+"total" is the time of the whole process (including flushing at exit).
+"""
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from handofcats import as_command
+
+logger = logging.getLogger(__name__)
+
+
+def emit(*, size: int = 1_000_000) -> None:
+    st = time.perf_counter()
+    for i in range(size):
+        logger.info("line %d: %s", i, "hello")
+    print(time.perf_counter() - st)
+
+
+@as_command
+def main(*, size: int = 1_000_000) -> None:
+    here = os.path.dirname(os.path.abspath(__file__))
+    for name, extra in [("sync", []), ("queue", ["--logging-queue"])]:
+        with tempfile.TemporaryDirectory() as d:
+            logfile = os.path.join(d, "log.txt")
+            cmd = [
+                sys.executable,
+                "-m",
+                "handofcats",
+                f"{__file__}:emit",
+                "--logging=INFO",
+                f"--size={size}",
+                *extra,
+            ]
+            st = time.perf_counter()
+            with open(logfile, "w") as wf:
+                p = subprocess.run(
+                    cmd, stdout=subprocess.PIPE, stderr=wf, check=True, cwd=here, text=True
+                )
+            total = time.perf_counter() - st
+            with open(logfile) as rf:
+                lines = sum(1 for _ in rf)
+        call = float(p.stdout.strip())
+        print(
+            f"{name:>5}: call={call:.3f}s total={total:.3f}s lines={lines} ({size / call:,.0f} lines/s in call)"
+        )
@@ -0,0 +1,63 @@
+"""benchmark: registering many sub-commands to MultiDriver
+
+$ python benchmarks/multidriver_registry.py --size 10000
+
+"list" is the previous registry (`fn in functions` check, and append),
+"index" is MultiDriver.register() (name-keyed ordered index).
+"lookup" is finding a function by name (a scan for "list").
+"""
+import time
+from handofcats import as_command
+from handofcats.driver import MultiDriver
+
+
+def _make_functions(size: int):
+    functions = []
+    for i in range(size):
+
+        def fn() -> None:
+            pass
+
+        fn.__name__ = fn.__qualname__ = f"command{i}"
+        functions.append(fn)
+    return functions
+
+
+def _register_list(functions) -> list:
+    registered: list = []
+    for fn in functions:
+        if fn in registered:
+            continue
+        registered.append(fn)
+    return registered
+
+
+def _register_index(functions) -> MultiDriver:
+    driver = MultiDriver()
+    for fn in functions:
+        driver.register(fn)
+    return driver
+
+
+@as_command
+def main(*, size: int = 10_000, lookups: int = 1_000) -> None:
+    functions = _make_functions(size)
+    names = [fn.__name__ for fn in functions[-lookups:]]
+
+    st = time.perf_counter()
+    registered = _register_list(functions)
+    register_time = time.perf_counter() - st
+    st = time.perf_counter()
+    for name in names:
+        next(fn for fn in registered if fn.__name__ == name)
+    lookup_time = time.perf_counter() - st
+    print(f" list: register={register_time:.3f}s lookup={lookup_time:.3f}s")
+
+    st = time.perf_counter()
+    driver = _register_index(functions)
+    register_time = time.perf_counter() - st
+    st = time.perf_counter()
+    for name in names:
+        driver.registry.get(name)
+    lookup_time = time.perf_counter() - st
+    print(f"index: register={register_time:.3f}s lookup={lookup_time:.3f}s")
@@ -0,0 +1,53 @@
+"""benchmark: in-process invocation (the pytest plugin's runner) vs subprocess
+
+$ python benchmarks/pytest_plugin.py -n 100
+
+"subprocess" is `python -c` running the command (as the subprocess-based tests),
+"runner" is handofcats.pytest_plugin.Runner.invoke() (with the cached parser).
+"""
+import os
+import subprocess
+import sys
+import time
+from handofcats import as_command
+
+CHILD = """\
+from handofcats import as_command
+
+
+@as_command(_force=True, argv={argv!r})
+def hello(*, name: str = "world", n: int = 1) -> str:
+    return " ".join([f"hello {{name}}"] * n)
+"""
+
+
+def hello(*, name: str = "world", n: int = 1) -> str:
+    return " ".join([f"hello {name}"] * n)
+
+
+@as_command
+def main(*, n: int = 100) -> None:
+    from handofcats.pytest_plugin import Runner
+
+    argv = ["--name", "foo", "-n", "2"]
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    st = time.perf_counter()
+    for _ in range(n):
+        p = subprocess.run(
+            [sys.executable, "-c", CHILD.format(argv=argv)],
+            env=env,
+            check=True,
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        assert p.stdout == "hello foo hello foo\n"
+    elapsed = time.perf_counter() - st
+    print(f"subprocess: {elapsed:.3f}s ({elapsed / n * 1000:.2f}ms per call)")
+
+    runner = Runner()
+    st = time.perf_counter()
+    for _ in range(n):
+        result = runner.invoke(hello, argv)
+        assert result.stdout == "hello foo hello foo\n"
+    elapsed = time.perf_counter() - st
+    print(f"    runner: {elapsed:.3f}s ({elapsed / n * 1000:.2f}ms per call)")
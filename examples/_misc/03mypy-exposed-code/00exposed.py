@@ -11,6 +11,7 @@ def byebye(*, args: t.List[str]) -> None:
     print(f"byebye, {', '.join(args)}")
 
 
+# handofcats: signature=f6ea07f8adc1cc21
 def main(argv: t.Optional[t.List[str]] = None) -> t.Any:
     import argparse
 
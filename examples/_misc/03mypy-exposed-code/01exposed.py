@@ -11,6 +11,7 @@ def byebye(*, args: t.List[str]) -> None:
     print(f"byebye, {', '.join(args)}")
 
 
+# handofcats: signature=64919c0eafd22f0a
 def main(argv: t.Optional[t.List[str]] = None) -> t.Any:
     import argparse
 
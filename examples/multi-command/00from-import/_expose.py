@@ -9,6 +9,7 @@ def byebye(name):
     print(f"byebye {name}")
 
 
+# handofcats: signature=e90b85b3b86e1d82
 def main(argv: t.Optional[t.List[str]] = None) -> t.Any:
     import argparse
 
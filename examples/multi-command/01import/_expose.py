@@ -9,6 +9,7 @@ def byebye(name):
     print(f"byebye {name}")
 
 
+# handofcats: signature=a8e3e4777b955c68
 def main(argv: t.Optional[t.List[str]] = None) -> t.Any:
     import argparse
 
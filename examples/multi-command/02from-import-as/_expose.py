@@ -9,6 +9,7 @@ def byebye(name):
     print(f"byebye {name}")
 
 
+# handofcats: signature=e2237726fc8f6a32
 def main(argv: t.Optional[t.List[str]] = None) -> t.Any:
     import argparse
 
@@ -9,6 +9,7 @@ def byebye(name):
     print(f"byebye {name}")
 
 
+# handofcats: signature=eb5d70b40e7c867f
 def main(argv: t.Optional[t.List[str]] = None) -> t.Any:
     import argparse
 
@@ -13,6 +13,7 @@ if __name__ == "__main__":
     pass
 
 
+# handofcats: signature=596e79d5eb122789
 def main(argv: t.Optional[t.List[str]] = None) -> t.Any:
     import argparse
 
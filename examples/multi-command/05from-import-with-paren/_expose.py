@@ -9,6 +9,7 @@ def byebye(name):
     print(f"byebye {name}")
 
 
+# handofcats: signature=fdd13eda0563d24a
 def main(argv: t.Optional[t.List[str]] = None) -> t.Any:
     import argparse
 
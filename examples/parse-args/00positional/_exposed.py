@@ -5,6 +5,7 @@ def run(file_name: str) -> None:
     pass
 
 
+# handofcats: signature=08faf6c339c31e55
 def main(argv: t.Optional[t.List[str]] = None) -> t.Any:
     import argparse
 
@@ -5,6 +5,7 @@ def run(*, file_name: str) -> None:
     pass
 
 
+# handofcats: signature=ddd174b64ec85bb4
 def main(argv: t.Optional[t.List[str]] = None) -> t.Any:
     import argparse
 
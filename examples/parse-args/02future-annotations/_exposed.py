@@ -6,6 +6,7 @@ def run(filename: str) -> None:
     pass
 
 
+# handofcats: signature=41f15b18ae882dc3
 def main(argv: t.Optional[t.List[str]] = None) -> t.Any:
     import argparse
 
@@ -5,6 +5,7 @@ def main(name: str) -> None:
     pass
 
 
+# handofcats: signature=29769159eb49807b
 def Main(argv: t.Optional[t.List[str]] = None) -> t.Any:
     import argparse
 
@@ -5,6 +5,7 @@ def run(file_name: str, *, nick_name: Optional[str] = None) -> None:
     pass
 
 
+# handofcats: signature=adbce3958f75e9b2
 def main(argv=None):
     import argparse
 
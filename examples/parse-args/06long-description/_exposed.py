@@ -17,6 +17,7 @@ Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod tempor i
     pass
 
 
+# handofcats: signature=67c97deb55fb6dcd
 def main(argv: t.Optional[t.List[str]] = None) -> t.Any:
     import argparse
 
@@ -7,6 +7,7 @@ def greeting(message: str, is_surprised: bool = False, name: str = "foo") -> Non
     print("{name}: {message}{suffix}".format(name=name, message=message, suffix=suffix))
 
 
+# handofcats: signature=d271f6c400a10542
 def main(argv: t.Optional[t.List[str]] = None) -> t.Any:
     import argparse
 
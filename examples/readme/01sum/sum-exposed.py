@@ -4,6 +4,7 @@ def sum(x: int, y: int) -> None:
     print(f"{x} + {y} = {x + y}")
 
 
+# handofcats: signature=f04fd0b749bc15ec
 def main(argv: t.Optional[t.List[str]] = None) -> t.Any:
     import argparse
 
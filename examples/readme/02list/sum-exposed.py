@@ -9,6 +9,7 @@ def psum(xs: t.List[int], *, ys: t.Optional[t.List[int]] = None):
         print(f"Σ {xs} + Σ {ys} = {sum(xs) + sum(ys)}")
 
 
+# handofcats: signature=be7edd25d9e0ce41
 def main(argv: t.Optional[t.List[str]] = None) -> t.Any:
     import argparse
 
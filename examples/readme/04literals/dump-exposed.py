@@ -35,12 +35,13 @@ def run(*, format: DumpFormat = "json"):
     dump(rows)
 
 
+# handofcats: signature=fd3897fe4c63a2c8
 def main(argv: t.Optional[t.List[str]] = None) -> t.Any:
     import argparse
 
     parser = argparse.ArgumentParser(prog=run.__name__, description=run.__doc__, formatter_class=type('_HelpFormatter', (argparse.ArgumentDefaultsHelpFormatter, argparse.RawTextHelpFormatter), {}))
     parser.print_usage = parser.print_help  # type: ignore
-    parser.add_argument('--format', required=False, default='json', choices=["'json'", "'csv'"], help='-')
+    parser.add_argument('--format', required=False, default='json', choices=dict.fromkeys(['json', 'csv']), help='-')
     args = parser.parse_args(argv)
     params = vars(args).copy()
     action = run
@@ -1,11 +1,24 @@
 import typing as t
 import sys
 import os
+import dataclasses
+from functools import partial
 from .driver import Driver, MultiDriver
 from .types import TargetFunction
 from .config import Config, default_config
+from .invocation import invoke, Failure
+from .injector import register_converter
 
-__all__ = ["as_command", "as_subcommand", "print"]
+__all__ = [
+    "as_command",
+    "as_subcommand",
+    "print",
+    "invoke",
+    "Failure",
+    "register_converter",
+]
+
+DEFAULT_CACHE_SIZE = 64 * 1024 * 1024
 
 
 def _import_symbol_maybe(ob_or_path: str, *, sep: str = ":") -> t.Optional[t.Any]:
@@ -29,10 +42,15 @@ def as_command(
     level=2,
     _force=False,
     config: Config = default_config,
+    cache: t.Union[bool, int] = False,
 ) -> TargetFunction:
     create_driver = _import_symbol_maybe(driver)
     if argv is None:
         argv = sys.argv[1:]
+    if cache:
+        # cache=True or cache=<max size in bytes>
+        cache_size = DEFAULT_CACHE_SIZE if cache is True else int(cache)
+        config = dataclasses.replace(config, cache_size=cache_size)
 
     def call(fn, level=1, argv=argv):
         if not _force:
@@ -61,12 +79,21 @@ handofcats = as_command
 _default_multi_driver = None
 
 
-def as_subcommand(fn: TargetFunction, *, driver=MultiDriver) -> TargetFunction:
+def as_subcommand(
+    fn: t.Optional[TargetFunction] = None,
+    *,
+    driver=MultiDriver,
+    name: t.Optional[str] = None,
+    aliases: t.Sequence[str] = (),
+) -> TargetFunction:
     global _default_multi_driver
+    if fn is None:
+        return partial(as_subcommand, driver=driver, name=name, aliases=aliases)
+
     if _default_multi_driver is None:
         create_driver = _import_symbol_maybe(driver)
         _default_multi_driver = create_driver()
-    _default_multi_driver.register(fn)
+    _default_multi_driver.register(fn, name=name, aliases=aliases)
     return fn
 
 
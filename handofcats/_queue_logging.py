@@ -0,0 +1,79 @@
+import atexit
+import logging
+import logging.handlers
+import queue
+
+
+def queue_logging_config(*, level, format, stream=None):
+    """like logging.basicConfig(), but the root logger has only QueueHandler
+
+    formatting and writing are done by QueueListener's thread, and flushed at exit.
+    """
+    root = logging.getLogger()
+    if root.handlers:  # same as logging.basicConfig()
+        return
+
+    handler = _BufferedStreamHandler(stream)
+    handler.setFormatter(logging.Formatter(format))
+    q = queue.SimpleQueue()
+    listener = _QueueListener(q, handler)
+
+    root.addHandler(_QueueHandler(q))
+    root.setLevel(level)
+    listener.start()
+    atexit.register(listener.stop)  # run before logging.shutdown()
+
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    def prepare(self, record):
+        # merging message in caller's thread (args may be mutated after logging),
+        # the rest of formatting is deferred to listener's thread
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+class _QueueListener(logging.handlers.QueueListener):
+    def dequeue(self, block):
+        try:
+            return self.queue.get_nowait()
+        except queue.Empty:
+            # writing buffered records, when the queue is drained
+            for handler in self.handlers:
+                handler.flush()
+            return self.queue.get(block)
+
+    def stop(self):
+        if self._thread is None:
+            return
+        super().stop()
+        for handler in self.handlers:
+            handler.flush()
+
+
+class _BufferedStreamHandler(logging.StreamHandler):
+    """StreamHandler, but writing records in bulk, when flushed"""
+
+    capacity = 1024
+
+    def __init__(self, stream=None):
+        super().__init__(stream)
+        self.buffer = []
+
+    def emit(self, record):
+        try:
+            self.buffer.append(self.format(record) + self.terminator)
+            if len(self.buffer) >= self.capacity:
+                self.flush()
+        except Exception:
+            self.handleError(record)
+
+    def flush(self):
+        self.acquire()
+        try:
+            if self.buffer:
+                self.stream.write("".join(self.buffer))
+                self.buffer.clear()
+            super().flush()
+        finally:
+            self.release()
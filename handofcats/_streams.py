@@ -0,0 +1,80 @@
+"""redirecting sys.stdout (or sys.stderr) only in the current thread
+
+contextlib.redirect_stdout() replaces sys.stdout for all threads, so the output of the other
+threads is mixed. here, sys.stdout is replaced by the proxy (while it is used), writing to the
+current thread's target (if redirected), otherwise to the original stream.
+"""
+import typing as t
+import collections
+import contextlib
+import io
+import sys
+import threading
+
+
+class ThreadLocalStream(io.TextIOBase):
+    """writing to the current thread's target (if redirected), otherwise to the original stream"""
+
+    def __init__(self, original: t.TextIO) -> None:
+        self.original = original
+        self._local = threading.local()
+
+    def current(self) -> t.TextIO:
+        return getattr(self._local, "target", None) or self.original
+
+    def write(self, s: str) -> int:
+        return self.current().write(s)
+
+    def flush(self) -> None:
+        self.current().flush()
+
+    def isatty(self) -> bool:
+        return self.current().isatty()
+
+    def fileno(self) -> int:
+        return self.current().fileno()  # e.g. for subprocess, faulthandler
+
+    @property
+    def buffer(self) -> t.BinaryIO:  # type: ignore
+        return self.current().buffer  # e.g. sys.stdout.buffer.write(b"...")
+
+    @property
+    def encoding(self) -> str:  # type: ignore
+        return getattr(self.current(), "encoding", None) or "utf-8"
+
+
+_lock = threading.Lock()
+# id(proxy) -> the number of users
+_counts: t.Dict[int, int] = collections.defaultdict(int)
+
+
+@contextlib.contextmanager
+def installed(name: str) -> t.Iterator[ThreadLocalStream]:
+    """replace sys.<name> ("stdout" or "stderr") by the proxy, while it is used"""
+    with _lock:
+        proxy = getattr(sys, name)
+        if not isinstance(proxy, ThreadLocalStream):
+            proxy = ThreadLocalStream(proxy)
+            setattr(sys, name, proxy)
+        _counts[id(proxy)] += 1
+    try:
+        yield proxy
+    finally:
+        with _lock:
+            _counts[id(proxy)] -= 1
+            if _counts[id(proxy)] <= 0:
+                del _counts[id(proxy)]
+                if getattr(sys, name) is proxy:
+                    setattr(sys, name, proxy.original)
+
+
+@contextlib.contextmanager
+def redirected(name: str, target: t.TextIO) -> t.Iterator[ThreadLocalStream]:
+    """redirect sys.<name> to the target, only in the current thread"""
+    with installed(name) as proxy:
+        prev = getattr(proxy._local, "target", None)
+        proxy._local.target = target
+        try:
+            yield proxy
+        finally:
+            proxy._local.target = prev
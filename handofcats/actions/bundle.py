@@ -0,0 +1,207 @@
+"""bundling the ejected command (and its local modules) into a single zipapp
+
+$ handofcats bundle cli.py:hello -o hello.pyz
+$ ./hello.pyz --name foo
+
+the command is ejected by --expose (so handofcats is not needed at runtime),
+the local modules imported by it are vendored, and all modules are precompiled to bytecode.
+(the bytecode is only for the same python version)
+"""
+import typing as t
+import argparse
+import ast
+import contextlib
+import dataclasses
+import io
+import os
+import py_compile
+import stat
+import sys
+import tempfile
+import zipfile
+
+
+def eject(entry_point: str) -> t.Tuple[str, str]:
+    """returns (the ejected code, the target file)"""
+    import inspect
+    from ..cli import load_driver
+    from ..driver import MultiDriver
+
+    # the target's directory is importable, as `python <file>`
+    module_path = entry_point.rsplit(":", 1)[0]
+    script_dir = None
+    if module_path.endswith(".py"):
+        script_dir = os.path.dirname(os.path.abspath(module_path))
+        if script_dir in sys.path:
+            script_dir = None
+        else:
+            sys.path.insert(0, script_dir)
+
+    try:
+        driver = load_driver(entry_point)
+        driver.config = dataclasses.replace(driver.config, fast_exit=False)  # in-process
+        if isinstance(driver, MultiDriver):
+            fn = driver.functions[0]
+        else:
+            fn = driver.fn
+
+        buf = io.StringIO()
+        with contextlib.redirect_stdout(buf):
+            driver.run(["--expose"])
+    finally:
+        if script_dir is not None:
+            sys.path.remove(script_dir)
+    return buf.getvalue(), t.cast(str, inspect.getsourcefile(fn))
+
+
+def find_local_modules(code: str, *, root: str) -> t.Dict[str, str]:
+    """module name -> file path, imported from the code (recursively), and found under root"""
+    found: t.Dict[str, str] = {}
+    stack = [code]
+    while stack:
+        tree = ast.parse(stack.pop())
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                names = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+                names = [node.module]
+                names.extend(f"{node.module}.{alias.name}" for alias in node.names)
+            else:
+                continue
+
+            for name in names:
+                for module_name, path in _resolve_local(name, root=root):
+                    if module_name in found:
+                        continue
+                    found[module_name] = path
+                    with open(path) as rf:
+                        stack.append(rf.read())
+    return found
+
+
+def _resolve_local(name: str, *, root: str) -> t.Iterator[t.Tuple[str, str]]:
+    # "a.b.c" -> a/__init__.py, a/b/__init__.py, a/b/c.py (or a/b/c/__init__.py)
+    parts = name.split(".")
+    for i in range(1, len(parts) + 1):
+        module_name = ".".join(parts[:i])
+        base = os.path.join(root, *parts[:i])
+        if os.path.isfile(os.path.join(base, "__init__.py")):
+            yield module_name, os.path.join(base, "__init__.py")
+        elif os.path.isfile(base + ".py"):
+            yield module_name, base + ".py"
+            return
+        else:
+            return
+
+
+def bundle(
+    entry_point: str,
+    output: str,
+    *,
+    interpreter: t.Optional[str] = "/usr/bin/env python3",
+    include_source: bool = False,
+) -> t.List[str]:
+    """write zipapp, returning the names of archived files"""
+    code, target_file = eject(entry_point)
+    root = os.path.dirname(os.path.abspath(target_file))
+    modules = find_local_modules(code, root=root)
+    modules.pop("__main__", None)
+
+    sources: t.List[t.Tuple[str, str, str]] = [("__main__", "__main__.py", code)]
+    for module_name, path in sorted(modules.items()):
+        if os.path.abspath(path) == os.path.abspath(target_file):
+            continue  # the target itself is __main__
+        with open(path) as rf:
+            sources.append((module_name, path, rf.read()))
+
+    names = []
+    with tempfile.TemporaryDirectory() as d:
+        tmppath = os.path.join(d, "app.pyz")
+        with open(tmppath, "wb") as wf:
+            if interpreter:
+                wf.write(f"#!{interpreter}\n".encode("utf-8"))
+            with zipfile.ZipFile(wf, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+                for module_name, path, source in sources:
+                    arcname = _arcname(module_name, path)
+                    cfile = os.path.join(d, "tmp.pyc")
+                    _compile(source, filename=path, cfile=cfile, tmpdir=d)
+                    zf.write(cfile, arcname + "c")
+                    names.append(arcname + "c")
+                    if include_source:
+                        zf.writestr(arcname, source)
+                        names.append(arcname)
+        os.replace(tmppath, output)
+
+    if interpreter:
+        st = os.stat(output)
+        os.chmod(output, st.st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+    return names
+
+
+def _arcname(module_name: str, path: str) -> str:
+    if module_name == "__main__":
+        return "__main__.py"
+    parts = module_name.split(".")
+    if os.path.basename(path) == "__init__.py":
+        return "/".join([*parts, "__init__.py"])
+    return "/".join(parts) + ".py"
+
+
+def _compile(source: str, *, filename: str, cfile: str, tmpdir: str) -> None:
+    # unchecked hash-based pyc, so the source is not needed (nor checked) at runtime
+    srcfile = os.path.join(tmpdir, "tmp.py")
+    with open(srcfile, "w") as wf:
+        wf.write(source)
+    py_compile.compile(
+        srcfile,
+        cfile=cfile,
+        dfile=filename,
+        doraise=True,
+        invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH,
+    )
+
+
+def main(argv: t.Optional[t.List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="handofcats bundle",
+        description="bundle the ejected command into a single zipapp (with bytecode)",
+    )
+    parser.add_argument(
+        "entry_point",
+        help="target EntryPoint. (format '<file name>:<attr>' or '<file name>')",
+    )
+    parser.add_argument("-o", "--output", required=True, help="output file (.pyz)")
+    parser.add_argument(
+        "-p",
+        "--python",
+        default=None,
+        help="the interpreter of shebang line (default: '/usr/bin/env python3')",
+    )
+    parser.add_argument(
+        "--no-site",
+        action="store_true",
+        help="run with `python -S` (skipping site-packages), the interpreter must be an absolute path",
+    )
+    parser.add_argument(
+        "--include-source", action="store_true", help="include .py files, too"
+    )
+    args = parser.parse_args(argv)
+
+    interpreter = args.python
+    if args.no_site:
+        interpreter = f"{interpreter or sys.executable} -S"
+    elif interpreter is None:
+        interpreter = "/usr/bin/env python3"
+
+    try:
+        names = bundle(
+            args.entry_point,
+            args.output,
+            interpreter=interpreter,
+            include_source=args.include_source,
+        )
+    except argparse.ArgumentTypeError as e:
+        parser.error(str(e))
+    except SyntaxError as e:
+        parser.error(f"ejected code is broken: {e}")
+    print(f"{args.output}: {', '.join(names)}", file=sys.stderr)
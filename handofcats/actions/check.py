@@ -0,0 +1,99 @@
+"""checking the generated code is up to date, by the embedded signature (without code generation)
+
+$ python cli.py --expose --check cli-exposed.py  # exit 1, if it is outdated
+
+the signature is the hash of the target file's source, the functions' signatures, the config
+affecting the generated code (runtime-only fields, such as fast_exit, are not included) and the
+source of the code generator itself, embedded by --expose, as the comment line
+("# handofcats: signature=<hash>").
+"""
+import typing as t
+import hashlib
+import inspect
+import os
+import re
+import sys
+from ..config import Config
+from ..types import TargetFunction
+
+PREFIX = "handofcats: signature="
+_rx = re.compile(r"#\s*" + re.escape(PREFIX) + r"([0-9a-f]+)")
+
+
+def parse_check_option(argv: t.Sequence[str]) -> t.Tuple[t.Optional[str], t.List[str]]:
+    """--check FILE, only parsed with --expose (not to conflict with the command's options)"""
+    import argparse
+
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--check", metavar="FILE", default=None)
+    args, rest_argv = parser.parse_known_args(argv)
+    return args.check, rest_argv
+
+
+def signature_digest(functions: t.Sequence[TargetFunction], *, config: Config) -> str:
+    h = hashlib.sha256()
+
+    # codegen uses the first function's file
+    filename = inspect.getsourcefile(functions[0])
+    if filename is not None:
+        with open(filename, "rb") as rf:
+            h.update(rf.read())
+
+    for fn in functions:
+        h.update(f"{fn.__name__}{inspect.signature(fn)}".encode("utf-8"))
+
+    # only the fields used by code generation (adding the other fields keeps the signatures)
+    codegen_fields = {
+        "ignore_arguments": config.ignore_arguments,
+        "ignore_flags": config.ignore_flags,
+        "typed": config.codegen_config.typed,
+        "use_primitive_parser": config.codegen_config.use_primitive_parser,
+    }
+    h.update(repr(sorted(codegen_fields.items())).encode("utf-8"))
+    h.update(_generator_digest().encode("utf-8"))
+    return h.hexdigest()[:16]
+
+
+_generator_digest_cache: t.Optional[str] = None
+
+
+def _generator_digest() -> str:
+    """hash of handofcats's modules generating the code (the contents, not mtime, stable across checkouts)"""
+    global _generator_digest_cache
+    if _generator_digest_cache is None:
+        h = hashlib.sha256()
+        here = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        for name in ("actions/codegen.py", "driver.py", "injector.py", "accessor.py"):
+            with open(os.path.join(here, *name.split("/")), "rb") as rf:
+                h.update(name.encode("utf-8"))
+                h.update(rf.read())
+        _generator_digest_cache = h.hexdigest()
+    return _generator_digest_cache
+
+
+def find_signature(code: str) -> t.Optional[str]:
+    m = _rx.search(code)
+    return m.group(1) if m is not None else None
+
+
+def run_check(
+    filename: str, *, functions: t.Sequence[TargetFunction], config: Config
+) -> None:
+    """exit 0 if the generated file is up to date, otherwise exit 1"""
+    try:
+        with open(filename) as rf:
+            found = find_signature(rf.read())
+    except OSError as e:
+        print(f"{filename}: error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    expected = signature_digest(functions, config=config)
+    if found is None:
+        print(f"{filename}: signature is not found", file=sys.stderr)
+        sys.exit(1)
+    elif found != expected:
+        print(
+            f"{filename}: outdated (signature={found}, expected={expected}), please regenerate with --expose",
+            file=sys.stderr,
+        )
+        sys.exit(1)
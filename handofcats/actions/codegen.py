@@ -10,6 +10,7 @@ from prestring.python import PythonModule
 from prestring.codeobject import CodeObjectModuleMixin
 from ..config import Config, default_config
 from ..types import TargetFunction, SetupParserFunction
+from . import check
 
 
 class Module(PythonModule, CodeObjectModuleMixin):
@@ -113,6 +114,9 @@ def run_as_single_command(
     if fn.__name__ == outname:
         outname = titleize(outname)  # main -> Main
 
+    # for --expose --check
+    m.stmt(f"# {check.PREFIX}{check.signature_digest([fn], config=config)}")
+
     if typed:
         # import typing as t
         m.toplevel.import_("typing", as_="t")
@@ -220,6 +224,9 @@ def run_as_multi_command(
     if outname in [fn.__name__ for fn in functions]:
         outname = titleize(outname)  # main -> Main
 
+    # for --expose --check
+    m.stmt(f"# {check.PREFIX}{check.signature_digest(functions, config=config)}")
+
     if typed:
         # import typing as t
         m.toplevel.import_("typing", as_="t")
@@ -3,8 +3,18 @@ import logging
 from importlib import import_module
 from types import ModuleType
 import os
-from ..types import TargetFunction, SetupParserFunction
+import sys
+from functools import partial
+from ..types import (
+    TargetFunction,
+    SetupParserFunction,
+    CustomizeSetupFunction,
+    CustomizeActivateFunction,
+    CustomizeWrapFunction,
+)
 from .. import customize
+from .. import tracing
+from .. import caching
 from ..config import Config, default_config
 
 
@@ -50,31 +60,40 @@ def run_as_single_command(
     config: Config = default_config,
 ) -> t.Any:
     m = _FakeModule()
-
-    customizations = []
-    if not config.ignore_expose:
-        customizations.append(customize.first_parser_setup)
-    if not config.ignore_logging:
-        # TODO: include generated code, emitted by `--expose`
-        customizations.append(customize.logging_setup)
-
-    parser, activate_functions = setup_parser(
-        fn,
-        m=m,
-        customizations=customizations,
-        config=config,
-    )
-    args = parser.parse_args(argv)
+    tracer = tracing.get_tracer()
+
+    help_cache = caching.get_help_cache([fn], config=config)
+    if help_cache is not None:
+        if help_cache.print_if_cached(
+            sys.argv[1:] if argv is None else argv, names=[]
+        ):
+            sys.exit(0)
+
+    customizations = _get_customizations(config)
+    with tracer.phase("setup_parser"):
+        parser, activate_functions = setup_parser(
+            fn,
+            m=m,
+            customizations=customizations,
+            config=config,
+        )
+    if help_cache is not None:
+        help_cache.install(parser)
+    with tracer.phase("parse_args"):
+        args = parser.parse_args(argv)
     params = vars(args).copy()
 
-    for activate in activate_functions:
-        activate(params)
+    with tracer.phase("activate"):
+        wrap_functions = _activate_functions(activate_functions, params=params)
 
     fn = _bind_fake_call_if_needed(fn)
-    val = fn(**params)
+    fn = _wrap(fn, wrap_functions)
+    with tracer.phase("call", fn=getattr(fn, "__name__", None)):
+        val = fn(**params)
     if val is None:
         return None
-    return config.cont(val)
+    with tracer.phase("cont"):
+        return config.cont(val)
 
 
 def run_as_multi_command(
@@ -83,34 +102,89 @@ def run_as_multi_command(
     functions: t.List[TargetFunction],
     argv: t.Optional[str] = None,
     config: Config = default_config,
+    names: t.Optional[t.Sequence[str]] = None,
 ) -> t.Any:
     m = _FakeModule()
+    tracer = tracing.get_tracer()
+
+    if names is None:  # sub-commands' names (and aliases)
+        names = [fn.__name__ for fn in functions]
+    help_cache = caching.get_help_cache(functions, config=config, names=names)
+    if help_cache is not None:
+        if help_cache.print_if_cached(
+            sys.argv[1:] if argv is None else argv, names=names
+        ):
+            sys.exit(0)
+
+    customizations = _get_customizations(config)
+    with tracer.phase("setup_parser"):
+        parser, activate_functions = setup_parser(
+            functions,
+            m=m,
+            customizations=customizations,
+            config=config,
+        )
+    if help_cache is not None:
+        help_cache.install(parser)
+    with tracer.phase("parse_args"):
+        args = parser.parse_args(argv)
+    params = vars(args).copy()
+
+    with tracer.phase("activate"):
+        wrap_functions = _activate_functions(activate_functions, params=params)
+
+    fn = params.pop("subcommand")
+    fn = _bind_fake_call_if_needed(fn)
+    fn = _wrap(fn, wrap_functions)
+    with tracer.phase("call", fn=getattr(fn, "__name__", None)):
+        val = fn(**params)
+    if val is None:
+        return None
+    with tracer.phase("cont"):
+        return config.cont(val)
+
 
+def _get_customizations(config: Config) -> t.List[CustomizeSetupFunction]:
     customizations = []
     if not config.ignore_expose:
         customizations.append(customize.first_parser_setup)
     if not config.ignore_logging:
         # TODO: include generated code, emitted by `--expose`
         customizations.append(customize.logging_setup)
-
-    parser, activate_functions = setup_parser(
-        functions,
-        m=m,
-        customizations=customizations,
-        config=config,
-    )
-    args = parser.parse_args(argv)
-    params = vars(args).copy()
-
+    if not config.ignore_profile:
+        customizations.append(customize.profile_setup)
+    if not config.ignore_resource_usage:
+        customizations.append(customize.resource_usage_setup)
+    if config.cache_size is not None:
+        # this must be the last one but sharding (capturing the output of the others)
+        customizations.append(
+            partial(customize.result_cache_setup, max_size=config.cache_size)
+        )
+    if not config.ignore_shard:
+        # the outermost wrapper (the result cache's key is calculated with the sharded params)
+        customizations.append(customize.shard_setup)
+    else:
+        customizations.append(customize.shard_disabled_setup)
+    return customizations
+
+
+def _activate_functions(
+    activate_functions: t.List[CustomizeActivateFunction],
+    *,
+    params: t.Dict[str, t.Any],
+) -> t.List[CustomizeWrapFunction]:
+    wrap_functions = []
     for activate in activate_functions:
-        activate(params)
+        wrap = activate(params)
+        if wrap is not None:
+            wrap_functions.append(wrap)
+    return wrap_functions
 
-    fn = params.pop("subcommand")
-    fn = _bind_fake_call_if_needed(fn)
-    val = fn(**params)
-    if val is None:
-        return None
-    return config.cont(val)
+
+def _wrap(fn: TargetFunction, wrap_functions: t.List[CustomizeWrapFunction]):
+    for wrap in wrap_functions:
+        fn = wrap(fn)
+    return fn
 
 
 def _bind_fake_call_if_needed(fn):
@@ -0,0 +1,163 @@
+"""running several sub-commands concurrently, in one call
+
+$ python cli.py --parallel 4 cmd-a x -- cmd-b y -- cmd-c z  # thread pool
+$ python cli.py --parallel-processes 4 cmd-a x -- cmd-b y  # process pool (forked, the module is not re-imported)
+
+the output of each command is captured, and written per command (in the order of the arguments).
+the exit status is the largest one of the commands' statuses (0, if all of them are succeeded).
+"""
+import typing as t
+import argparse
+import contextlib
+import io
+import multiprocessing
+import os
+import pickle
+import sys
+import time
+import traceback
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from ..config import Config, default_config
+from ..types import TargetFunction
+from .. import customize
+from .. import _streams
+from .pipeline import split_stages, parse_stage
+
+OPTION_NAME = "--parallel"
+PROCESSES_OPTION_NAME = "--parallel-processes"
+
+
+def is_requested(argv: t.Sequence[str]) -> bool:
+    return bool(argv) and argv[0].split("=", 1)[0] in (
+        OPTION_NAME,
+        PROCESSES_OPTION_NAME,
+    )
+
+
+class Outcome(t.NamedTuple):
+    status: int
+    stdout: str
+    stderr: str
+    elapsed: float
+
+
+def call(
+    fn: TargetFunction, params: t.Dict[str, t.Any], cont: t.Callable[[t.Any], t.Any]
+) -> Outcome:
+    """call the command, capturing its output (in threads, or in the worker process)"""
+    out, err = io.StringIO(), io.StringIO()
+
+    st = time.perf_counter()
+    with _streams.redirected("stdout", out), _streams.redirected("stderr", err):
+        try:
+            val = fn(**params)
+            if val is not None:
+                cont(val)
+            status = 0
+        except SystemExit as e:
+            if e.code is None or isinstance(e.code, int):
+                status = e.code or 0
+            else:
+                print(e.code, file=err)
+                status = 1
+        except Exception:
+            traceback.print_exc(file=err)
+            status = 1
+    return Outcome(status, out.getvalue(), err.getvalue(), time.perf_counter() - st)
+
+
+def run_in_parallel(
+    *,
+    get_function: t.Callable[[str], t.Optional[TargetFunction]],
+    argv: t.Sequence[str],
+    config: Config = default_config,
+) -> None:
+    prog = os.path.basename(sys.argv[0])
+
+    argv = list(argv)
+    option = argv.pop(0)
+    if "=" in option:
+        option, value = option.split("=", 1)
+    else:
+        value = argv.pop(0) if argv else ""
+    if not value.isdigit() or int(value) < 1:
+        print(
+            f"{prog}: error: {option}: invalid worker count: {value!r}", file=sys.stderr
+        )
+        sys.exit(2)
+    max_workers = int(value)
+
+    jobs = []
+    for i, stage_argv in enumerate(
+        split_stages(argv, is_command=lambda name: get_function(name) is not None)
+    ):
+        fn = get_function(stage_argv[0]) if stage_argv else None
+        if fn is None:
+            print(
+                f"{prog}: error: parallel: unknown sub-command in {i}: {stage_argv!r}",
+                file=sys.stderr,
+            )
+            sys.exit(2)
+        name = stage_argv[0]
+        try:
+            fn, params, _ = parse_stage(
+                fn, stage_argv[1:], prog=f"{prog} {name}", fed=False
+            )
+        except argparse.ArgumentTypeError as e:
+            print(f"{prog}: error: parallel: {e}", file=sys.stderr)
+            sys.exit(2)
+        jobs.append((name, fn, params))
+
+    if option == PROCESSES_OPTION_NAME:
+        for name, fn, params in jobs:
+            try:
+                pickle.dumps((fn, params, config.cont))
+            except Exception as e:  # e.g. lambda, closure, iterator
+                print(
+                    f"{prog}: error: {option}: {name}: cannot be sent to the worker process"
+                    f" ({e}), use {OPTION_NAME} instead",
+                    file=sys.stderr,
+                )
+                sys.exit(2)
+
+    original_stdout, original_stderr = sys.stdout, sys.stderr
+    executor: Executor
+    with contextlib.ExitStack() as stack:
+        if option == PROCESSES_OPTION_NAME:
+            # forked workers share the imported module (spawn re-imports it, on such platforms)
+            methods = multiprocessing.get_all_start_methods()
+            mp_context = (
+                multiprocessing.get_context("fork") if "fork" in methods else None
+            )
+            executor = ProcessPoolExecutor(
+                max_workers=max_workers, mp_context=mp_context
+            )
+        else:
+            # before the logging's handler is created
+            stack.enter_context(_streams.installed("stdout"))
+            stack.enter_context(_streams.installed("stderr"))
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+
+        if not config.ignore_logging:
+            customize.logging_activate({})  # only by envvars (e.g. LOGGING_LEVEL)
+
+        statuses = []
+        with executor:
+            futures = [
+                executor.submit(call, fn, params, config.cont) for _, fn, params in jobs
+            ]
+            for (name, _, _), future in zip(jobs, futures):
+                outcome = future.result()
+                print(
+                    f"== {name} (status={outcome.status}, {outcome.elapsed:.3f}s) ==",
+                    file=original_stderr,
+                )
+                original_stdout.write(outcome.stdout)
+                original_stdout.flush()
+                original_stderr.write(outcome.stderr)
+                original_stderr.flush()
+                statuses.append(outcome.status)
+
+    status = max(statuses, default=0)
+    if status:
+        sys.exit(status)
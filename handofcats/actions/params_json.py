@@ -0,0 +1,224 @@
+"""calling the function with the params of json object, bypassing argparse
+
+$ python cli.py --params-json params.json
+$ echo '{"name": "foo"}' | python cli.py --params-json -
+$ HANDOFCATS_PARAMS='{"name": "foo"}' python cli.py
+$ python cli.py hello --params-json params.json  # sub-command
+
+the params are validated and coerced against the function's signature (Accessor's Option list).
+the customizations (e.g. --profile, the result cache) are skipped in this mode,
+only logging is activated by envvars (e.g. LOGGING_LEVEL).
+"""
+import typing as t
+import json
+import os
+import sys
+from ..config import Config, default_config
+from ..types import TargetFunction
+from ..injector import Injector, ArrayType, LineIterator
+from ..injector import _has_origin, _is_optional, _is_sequence
+from .. import customize
+from .. import tracing
+
+OPTION_NAME = "--params-json"
+ENVVAR_NAME = "HANDOFCATS_PARAMS"
+
+
+class ParamsError(ValueError):
+    pass
+
+
+def get_params_source(
+    argv: t.Sequence[str],
+) -> t.Tuple[t.Optional[str], bool, t.List[str]]:
+    """returns (json file or json text, is json text from envvar, rest argv)"""
+    argv = list(argv)
+    for i, arg in enumerate(argv):
+        if arg == "--":
+            break  # after "--" is data
+        elif arg == OPTION_NAME and i + 1 < len(argv):
+            return argv[i + 1], False, argv[:i] + argv[i + 2 :]
+        elif arg.startswith(OPTION_NAME + "="):
+            return arg[len(OPTION_NAME) + 1 :], False, argv[:i] + argv[i + 1 :]
+
+    text = os.environ.get(ENVVAR_NAME, "").strip()
+    if text:
+        return text, True, argv
+    return None, False, argv
+
+
+def load_params(source: str, *, from_envvar: bool = False) -> t.Dict[str, t.Any]:
+    if from_envvar:
+        data = json.loads(source)
+    elif source == "-":
+        data = json.load(sys.stdin)
+    else:
+        with open(source) as rf:
+            data = json.load(rf)
+    if not isinstance(data, dict):
+        raise ParamsError(f"params must be a json object, but {type(data).__name__}")
+    return data
+
+
+def coerce_params(
+    fn: TargetFunction,
+    data: t.Dict[str, t.Any],
+    *,
+    injector: t.Optional[Injector] = None,
+) -> t.Dict[str, t.Any]:
+    """validate and coerce the json object, by the types of the function's parameters
+
+    missing optional params are not included (the function's default values are used).
+    missing positional list (or iterator) params are [] (or stdin), same as the command line.
+    """
+    if injector is None:
+        injector = Injector(fn)
+    accessor = injector.accessor
+
+    options = {opt.name: opt for opt in [*accessor.arguments, *accessor.flags]}
+    unexpected = [k for k in data if k not in options]
+    if unexpected:
+        raise ParamsError(f"unexpected params: {', '.join(sorted(unexpected))}")
+
+    params = {}
+    for name, opt in options.items():
+        if name not in data:
+            if not opt.option_name.startswith("-"):
+                missing = _missing_positional(injector, opt)
+                if missing is not None:
+                    params[name] = missing
+                    continue
+            if opt.required and opt.type != bool:
+                raise ParamsError(f"{name}: required")
+            continue
+        params[name] = _coerce(injector, opt, data[name])
+    return params
+
+
+def _missing_positional(injector: Injector, opt) -> t.Any:
+    # the positional list is nargs="*", and the iterator is nargs="?" (default is stdin)
+    if opt.default is not None or not opt.type or opt.type == str:
+        return None
+    kwargs: t.Dict[str, t.Any] = {}
+    injector._handle_type(opt, kwargs)
+    if kwargs.get("action") == "append":
+        return []
+    elif isinstance(kwargs.get("type"), LineIterator):
+        return kwargs["type"]("-")
+    return None
+
+
+def _coerce(injector: Injector, opt, value: t.Any) -> t.Any:
+    if value is None:
+        return None
+
+    # nested types are kept (e.g. t.List[t.List[int]])
+    if _has_origin(opt.type):
+        if _is_optional(opt.type):
+            item_type = [x for x in opt.type.__args__ if x is not type(None)][0]
+            return _coerce(injector, opt._replace(type=item_type), value)
+        elif _is_sequence(opt.type):
+            if not isinstance(value, list):
+                raise ParamsError(f"{opt.name}: list is expected, but {value!r}")
+            item_opt = opt._replace(type=opt.type.__args__[0])
+            return [_coerce(injector, item_opt, x) for x in value]
+
+    kwargs: t.Dict[str, t.Any] = {}
+    if opt.type and opt.type != str:
+        injector._handle_type(opt, kwargs)  # the same types, as argparse's one
+
+    action = kwargs.get("action")
+    if action in ("store_true", "store_false"):
+        if not isinstance(value, bool):
+            raise ParamsError(f"{opt.name}: bool is expected, but {value!r}")
+        return value
+    elif action == "append":
+        if not isinstance(value, list):
+            raise ParamsError(f"{opt.name}: list is expected, but {value!r}")
+        return [_convert(opt, kwargs, x) for x in value]
+    return _convert(opt, kwargs, value)
+
+
+def _convert(opt, kwargs: t.Dict[str, t.Any], value: t.Any) -> t.Any:
+    typ = kwargs.get("type")
+    try:
+        if typ is None:
+            if opt.type == str and not isinstance(value, str):
+                raise ParamsError(f"str is expected, but {value!r}")
+        elif typ is int:
+            if isinstance(value, bool) or not isinstance(value, int):
+                raise ParamsError(f"int is expected, but {value!r}")
+        elif typ is float:
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                raise ParamsError(f"float is expected, but {value!r}")
+            value = float(value)
+        elif isinstance(typ, ArrayType) and isinstance(value, list):
+            value = typ._parse([str(x) for x in value])
+        elif isinstance(typ, LineIterator) and isinstance(value, list):
+            value = iter(value if typ.item_type is str else map(typ.item_type, value))
+        elif isinstance(value, str):
+            value = typ(value)  # e.g. pathlib.Path, datetime.date.fromisoformat
+        else:
+            raise ParamsError(f"str is expected, but {value!r}")
+    except ParamsError as e:
+        raise ParamsError(f"{opt.name}: {e}")
+    except (TypeError, ValueError) as e:  # same as argparse's type= conversion
+        raise ParamsError(f"{opt.name}: invalid value {value!r} ({e})")
+
+    choices = kwargs.get("choices")
+    if choices is not None and value not in choices:
+        raise ParamsError(f"{opt.name}: invalid choice {value!r}")
+    return value
+
+
+def run_as_single_command(
+    *,
+    fn: TargetFunction,
+    argv: t.Sequence[str],
+    prog: t.Optional[str] = None,
+    config: Config = default_config,
+) -> t.Any:
+    from .commandline import _bind_fake_call_if_needed
+
+    tracer = tracing.get_tracer()
+    prog = prog or os.path.basename(sys.argv[0])
+    with tracer.phase("parse_args"):
+        try:
+            source, from_envvar, rest_argv = get_params_source(argv)
+            if source is None or rest_argv:
+                raise ParamsError(f"unexpected arguments: {rest_argv!r}")
+            params = coerce_params(fn, load_params(source, from_envvar=from_envvar))
+        except (ValueError, OSError) as e:  # ParamsError, json.JSONDecodeError
+            print(f"{prog}: error: {OPTION_NAME}: {e}", file=sys.stderr)
+            sys.exit(2)
+
+    if not config.ignore_logging:
+        customize.logging_activate({})  # only by envvars (e.g. LOGGING_LEVEL)
+
+    fn = _bind_fake_call_if_needed(fn)
+    with tracer.phase("call", fn=getattr(fn, "__name__", None)):
+        val = fn(**params)
+    if val is None:
+        return None
+    with tracer.phase("cont"):
+        return config.cont(val)
+
+
+def run_as_multi_command(
+    *,
+    get_function: t.Callable[[str], t.Optional[TargetFunction]],
+    argv: t.Sequence[str],
+    config: Config = default_config,
+) -> t.Any:
+    """the first argument is the sub-command's name"""
+    prog = os.path.basename(sys.argv[0])
+    if not argv or argv[0].startswith("-"):
+        print(f"{prog}: error: {OPTION_NAME}: sub-command is required", file=sys.stderr)
+        sys.exit(2)
+    fn = get_function(argv[0])
+    if fn is None:
+        print(f"{prog}: error: unknown sub-command: {argv[0]!r}", file=sys.stderr)
+        sys.exit(2)
+    return run_as_single_command(
+        fn=fn, argv=argv[1:], prog=f"{prog} {argv[0]}", config=config
+    )
@@ -0,0 +1,207 @@
+"""running sub-commands as a pipeline, in one process
+
+$ python cli.py --pipeline extract a -- transform b -- load c
+$ python cli.py --pipeline-queue 1000 extract a -- transform b -- load c  # a thread per stage
+
+the returned value (or iterator) of each stage is passed to the next stage's first parameter,
+so the first parameter of the following stages is not parsed from argv.
+the stages are separated by `--` followed by a sub-command's name (other `--` is kept in the stage).
+"""
+import typing as t
+import argparse
+import os
+import queue
+import sys
+import threading
+from ..config import Config, default_config
+from ..injector import Injector
+from ..types import TargetFunction
+from .. import customize
+from .. import tracing
+
+SEPARATOR = "--"
+OPTION_NAME = "--pipeline"
+QUEUE_OPTION_NAME = "--pipeline-queue"
+
+Stage = t.Tuple[TargetFunction, t.Dict[str, t.Any], t.Optional[str]]
+
+
+def is_requested(argv: t.Sequence[str]) -> bool:
+    """explicitly, by `--pipeline` (or `--pipeline-queue N`)"""
+    return bool(argv) and argv[0].split("=", 1)[0] in (
+        OPTION_NAME,
+        QUEUE_OPTION_NAME,
+    )
+
+
+def split_stages(
+    argv: t.Sequence[str], *, is_command: t.Callable[[str], bool]
+) -> t.List[t.List[str]]:
+    """split by `--` followed by a sub-command's name"""
+    stages: t.List[t.List[str]] = [[]]
+    for i, arg in enumerate(argv):
+        if arg == SEPARATOR and i + 1 < len(argv) and is_command(argv[i + 1]):
+            stages.append([])
+        else:
+            stages[-1].append(arg)
+    return stages
+
+
+def designated_parameter(fn: TargetFunction) -> t.Optional[str]:
+    """the parameter fed by the previous stage (the first parameter)"""
+    accessor = Injector(fn).accessor
+    for opt in [*accessor.arguments, *accessor.flags]:
+        return t.cast(str, opt.name)
+    return None
+
+
+def parse_stage(
+    fn: TargetFunction, argv: t.Sequence[str], *, prog: str, fed: bool
+) -> Stage:
+    target = designated_parameter(fn) if fed else None
+    if fed and target is None:
+        raise argparse.ArgumentTypeError(
+            f"{prog}: no parameter to receive the previous stage's value"
+        )
+
+    parser = argparse.ArgumentParser(
+        prog=prog,
+        description=fn.__doc__,
+        formatter_class=type(
+            "_HelpFormatter",
+            (argparse.ArgumentDefaultsHelpFormatter, argparse.RawTextHelpFormatter),
+            {},
+        ),
+    )
+    Injector(fn).inject(parser, exclude=() if target is None else (target,))
+    params = vars(parser.parse_args(argv))
+    return fn, params, target
+
+
+def chain(stages: t.Sequence[Stage], *, maxsize: t.Optional[int] = None) -> t.Any:
+    """call each stage with the previous stage's value. if maxsize, iterators are fed by threads"""
+    tracer = tracing.get_tracer()
+    val: t.Any = None
+    for i, (fn, params, target) in enumerate(stages):
+        if target is not None:
+            if maxsize is not None and _is_iterator(val):
+                val = _threaded(val, maxsize=maxsize, name=f"stage{i - 1}")
+            params = {**params, target: val}
+        with tracer.phase("call", fn=getattr(fn, "__name__", None)):
+            val = fn(**params)
+    return val
+
+
+def _is_iterator(val: t.Any) -> bool:
+    return hasattr(val, "__next__") and hasattr(val, "__iter__")
+
+
+class _Raised:
+    def __init__(self, exc: BaseException) -> None:
+        self.exc = exc
+
+
+_END = object()
+
+
+def _threaded(it: t.Iterator[t.Any], *, maxsize: int, name: str) -> t.Iterator[t.Any]:
+    """iterate in another thread, via bounded queue (backpressure)"""
+    q: "queue.Queue[t.Any]" = queue.Queue(maxsize=maxsize)
+    stopped = threading.Event()
+
+    def _put(x: t.Any) -> bool:
+        while not stopped.is_set():
+            try:
+                q.put(x, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False  # the consumer is stopped
+
+    def _produce() -> None:
+        try:
+            for x in it:
+                if not _put(x):
+                    return
+            _put(_END)
+        except BaseException as e:
+            _put(_Raised(e))
+
+    th = threading.Thread(
+        target=_produce, name=f"handofcats-pipeline-{name}", daemon=True
+    )
+    th.start()
+
+    def _consume() -> t.Iterator[t.Any]:
+        try:
+            while True:
+                x = q.get()
+                if x is _END:
+                    return
+                if isinstance(x, _Raised):
+                    raise x.exc
+                yield x
+        finally:
+            stopped.set()  # e.g. the consumer stops early
+
+    return _consume()
+
+
+def run_as_pipeline(
+    *,
+    get_function: t.Callable[[str], t.Optional[TargetFunction]],
+    argv: t.Sequence[str],
+    config: Config = default_config,
+) -> t.Any:
+    prog = os.path.basename(sys.argv[0])
+
+    argv = list(argv)
+    maxsize = None
+    while argv and is_requested(argv):
+        option = argv.pop(0)
+        if option == OPTION_NAME:
+            continue
+        if "=" in option:
+            option, value = option.split("=", 1)
+        else:
+            value = argv.pop(0) if argv else ""
+        if not value.isdigit() or int(value) < 1:
+            print(
+                f"{prog}: error: {option}: invalid queue size: {value!r}",
+                file=sys.stderr,
+            )
+            sys.exit(2)
+        maxsize = int(value)
+
+    stages = []
+    for i, stage_argv in enumerate(
+        split_stages(argv, is_command=lambda name: get_function(name) is not None)
+    ):
+        fn = get_function(stage_argv[0]) if stage_argv else None
+        if fn is None:
+            print(
+                f"{prog}: error: pipeline: unknown sub-command in stage {i}: {stage_argv!r}",
+                file=sys.stderr,
+            )
+            sys.exit(2)
+        try:
+            stages.append(
+                parse_stage(
+                    fn, stage_argv[1:], prog=f"{prog} {stage_argv[0]}", fed=i > 0
+                )
+            )
+        except argparse.ArgumentTypeError as e:
+            print(f"{prog}: error: pipeline: {e}", file=sys.stderr)
+            sys.exit(2)
+
+    if not config.ignore_logging:
+        customize.logging_activate({})  # only by envvars (e.g. LOGGING_LEVEL)
+
+    val = chain(stages, maxsize=maxsize)
+    if val is None:
+        return None
+    if _is_iterator(val):  # the last stage's iterator is consumed here
+        for x in val:
+            config.cont(x)
+        return None
+    return config.cont(val)
@@ -0,0 +1,99 @@
+"""running the script as __main__, with the cached bytecode (python never caches the bytecode of __main__)
+
+$ handofcats run script.py --name foo
+
+or, as shebang line
+
+#!/usr/bin/env -S handofcats run
+
+the cache file is keyed by the path (and python's magic number), and it is overwritten
+when the source is changed (the hash of the source is stored in the header).
+"""
+import typing as t
+import argparse
+import hashlib
+import marshal
+import os
+import sys
+import types
+from importlib.util import MAGIC_NUMBER
+from ..caching import get_cache_dir, write_atomically
+
+
+def get_cache_path(path: str) -> str:
+    h = hashlib.sha256(MAGIC_NUMBER)
+    h.update(f"{path}:{sys.flags.optimize}".encode("utf-8"))
+    return os.path.join(get_cache_dir("bytecode"), f"{h.hexdigest()}.pyc")
+
+
+def load_code(
+    path: str, *, cache: bool = True
+) -> t.Tuple[types.CodeType, t.Optional[str]]:
+    """returns (code object, cached file)"""
+    path = os.path.abspath(path)
+    with open(path, "rb") as rf:
+        source = rf.read()
+    if not cache:
+        return compile(source, path, "exec", dont_inherit=True), None
+
+    cache_path = get_cache_path(path)
+    header = MAGIC_NUMBER + hashlib.sha256(source).digest()
+    try:
+        with open(cache_path, "rb") as rf:
+            data = rf.read()
+        if data[: len(header)] == header:
+            return marshal.loads(data[len(header) :]), cache_path
+    except (OSError, EOFError, ValueError, TypeError):  # missing or broken
+        pass
+
+    code = compile(source, path, "exec", dont_inherit=True)
+    if not sys.dont_write_bytecode:
+        try:  # overwriting the stale one
+            write_atomically(cache_path, header + marshal.dumps(code))
+        except OSError:
+            pass  # cache is best effort
+    return code, cache_path
+
+
+def run_path(path: str, argv: t.Sequence[str], *, cache: bool = True) -> None:
+    """exec the script as __main__ (so, `as_command` runs the command, as `python <script>`)"""
+    code, cache_path = load_code(path, cache=cache)
+
+    module = types.ModuleType("__main__")
+    module.__file__ = os.path.abspath(path)
+    module.__cached__ = cache_path  # type: ignore
+    module.__builtins__ = __builtins__  # type: ignore
+
+    original = (sys.modules["__main__"], sys.argv, sys.path[0] if sys.path else None)
+    sys.modules["__main__"] = module
+    sys.argv = [path, *argv]
+    script_dir = os.path.dirname(os.path.abspath(path))
+    if sys.path:
+        sys.path[0] = script_dir
+    else:
+        sys.path.append(script_dir)
+    try:
+        exec(code, module.__dict__)
+    finally:
+        sys.modules["__main__"], sys.argv = original[0], original[1]
+        if original[2] is not None:
+            sys.path[0] = original[2]
+
+
+def main(argv: t.Optional[t.List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="handofcats run",
+        description="run the script as __main__, with the cached bytecode",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="not using the cache")
+    parser.add_argument("script", help="target script")
+
+    if argv is None:
+        argv = sys.argv[1:]
+
+    # the arguments after the script are passed to the script as is
+    i = 0
+    while i < len(argv) and argv[i].startswith("-"):
+        i += 1
+    args = parser.parse_args(argv[: i + 1])
+    run_path(args.script, argv[i + 1 :], cache=not args.no_cache)
@@ -0,0 +1,243 @@
+"""serving the commands as local HTTP endpoints (importing the module only once)
+
+$ handofcats serve cli.py --port 8080
+$ curl -s -X POST localhost:8080/hello -d '{"name": "foo"}'
+{"result": null, "output": "hello foo\n"}
+
+- POST /<command> -- calling the command with the params of json object (same as --params-json),
+  responding the returned value and the printed output (stdout, captured per request)
+- GET / -- the list of the commands
+- GET /_stats -- the latency stats per command
+"""
+import typing as t
+import argparse
+import collections
+import io
+import json
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from ..driver import Driver, MultiDriver
+from ..injector import Injector
+from ..types import TargetFunction
+from .params_json import coerce_params, ParamsError
+from .. import _streams
+
+
+class Stats:
+    """latency stats per endpoint (percentiles are from the recent samples)"""
+
+    def __init__(self, *, max_samples: int = 1024) -> None:
+        self.max_samples = max_samples
+        self._lock = threading.Lock()
+        self._count: t.Dict[str, int] = collections.Counter()
+        self._errors: t.Dict[str, int] = collections.Counter()
+        self._total: t.Dict[str, float] = collections.Counter()
+        self._max: t.Dict[str, float] = collections.Counter()
+        self._samples: t.Dict[str, t.Deque[float]] = {}
+
+    def add(self, name: str, elapsed: float, *, error: bool = False) -> None:
+        with self._lock:
+            self._count[name] += 1
+            if error:
+                self._errors[name] += 1
+            self._total[name] += elapsed
+            self._max[name] = max(self._max[name], elapsed)
+            samples = self._samples.get(name)
+            if samples is None:
+                samples = self._samples[name] = collections.deque(
+                    maxlen=self.max_samples
+                )
+            samples.append(elapsed)
+
+    def as_dict(self) -> t.Dict[str, t.Dict[str, t.Any]]:
+        with self._lock:
+            d = {}
+            for name, count in self._count.items():
+                samples = sorted(self._samples[name])
+                d[name] = {
+                    "count": count,
+                    "errors": self._errors[name],
+                    "mean_ms": self._total[name] / count * 1000,
+                    "p50_ms": samples[len(samples) // 2] * 1000,
+                    "p99_ms": samples[min(len(samples) - 1, len(samples) * 99 // 100)]
+                    * 1000,
+                    "max_ms": self._max[name] * 1000,
+                }
+            return d
+
+
+class Endpoint:
+    def __init__(self, name: str, fn: TargetFunction) -> None:
+        self.name = name
+        self.fn = fn
+        self.injector = Injector(fn)  # the Option specs are resolved only once
+
+    def __call__(self, data: t.Dict[str, t.Any]) -> t.Any:
+        params = coerce_params(self.fn, data, injector=self.injector)
+        return self.fn(**params)
+
+
+def get_endpoints(driver: t.Union[Driver, MultiDriver]) -> t.Dict[str, Endpoint]:
+    if isinstance(driver, MultiDriver):
+        endpoints = {}
+        for name, fn in driver.registry.entries():
+            endpoints[name] = Endpoint(name, fn)
+            for alias in driver.registry.aliases_of(name):
+                endpoints[alias] = endpoints[name]
+        return endpoints
+    return {driver.fn.__name__: Endpoint(driver.fn.__name__, driver.fn)}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: "Server"
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    @property
+    def timeout(self) -> float:  # type: ignore
+        # idle keep-alive connections are closed, not to hold the workers forever
+        return self.server.keepalive_timeout
+
+    def do_GET(self) -> None:
+        if self.path == "/":
+            endpoints = self.server.endpoints
+            self._send(200, {"commands": sorted(endpoints)})
+        elif self.path == "/_stats":
+            self._send(200, self.server.stats.as_dict())
+        else:
+            self._send(404, {"error": f"not found: {self.path}"})
+
+    def do_POST(self) -> None:
+        name = self.path.lstrip("/")
+        endpoint = self.server.endpoints.get(name)
+        if endpoint is None:
+            self._send(404, {"error": f"unknown command: {name!r}"})
+            return
+
+        length = int(self.headers.get("Content-Length") or 0)
+        st = time.perf_counter()
+        status, body = self._call(endpoint, self.rfile.read(length))
+        self.server.stats.add(
+            endpoint.name, time.perf_counter() - st, error=status != 200
+        )
+        self._send(status, body)
+
+    def _call(self, endpoint: Endpoint, raw: bytes) -> t.Tuple[int, t.Dict[str, t.Any]]:
+        out = io.StringIO()
+        try:
+            data = json.loads(raw or b"{}")
+            if not isinstance(data, dict):
+                raise ParamsError("params must be a json object")
+            # most commands print the output, captured only in this request's thread
+            with _streams.redirected("stdout", out):
+                result = endpoint(data)
+            return 200, {"result": result, "output": out.getvalue()}
+        except (ParamsError, json.JSONDecodeError) as e:
+            return 400, {"error": str(e)}
+        except SystemExit as e:
+            return 500, {"error": f"exit (status={e.code})", "output": out.getvalue()}
+        except Exception as e:
+            self.log_error("%s: %r", endpoint.name, e)
+            return 500, {"error": repr(e), "output": out.getvalue()}
+
+    def _send(self, status: int, body: t.Any) -> None:
+        data = json.dumps(body, default=str).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args: t.Any) -> None:
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class Server(HTTPServer):
+    """http server, handling requests in the thread pool"""
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: t.Tuple[str, int],
+        endpoints: t.Dict[str, Endpoint],
+        *,
+        workers: int = 8,
+        keepalive_timeout: float = 5.0,
+        verbose: bool = False,
+    ) -> None:
+        super().__init__(address, _Handler)
+        self.endpoints = endpoints
+        self.stats = Stats()
+        self.keepalive_timeout = keepalive_timeout
+        self.verbose = verbose
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+
+    def process_request(self, request, client_address) -> None:  # type: ignore
+        self.executor.submit(self._process_request, request, client_address)
+
+    def _process_request(self, request, client_address) -> None:  # type: ignore
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.executor.shutdown(wait=False)
+
+
+def main(argv: t.Optional[t.List[str]] = None) -> None:
+    from ..cli import load_driver
+
+    parser = argparse.ArgumentParser(
+        prog="handofcats serve",
+        description="serve the commands as local HTTP endpoints (POST /<command>)",
+    )
+    parser.add_argument(
+        "entry_point",
+        help="target EntryPoint. (format '<file name>:<attr>' or '<file name>')",
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument(
+        "--workers", type=int, default=8, help="the size of thread pool"
+    )
+    parser.add_argument(
+        "--keepalive-timeout",
+        type=float,
+        default=5.0,
+        help="seconds to close the idle connection",
+    )
+    parser.add_argument("--verbose", action="store_true", help="access log")
+    args = parser.parse_args(argv)
+
+    try:
+        driver = load_driver(args.entry_point)
+    except argparse.ArgumentTypeError as e:
+        parser.error(str(e))
+
+    endpoints = get_endpoints(driver)
+    server = Server(
+        (args.host, args.port),
+        endpoints,
+        workers=args.workers,
+        keepalive_timeout=args.keepalive_timeout,
+        verbose=args.verbose,
+    )
+    host, port = server.server_address[:2]
+    print(
+        f"serving {', '.join(sorted(endpoints))} on http://{host}:{port}",
+        file=sys.stderr,
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
@@ -0,0 +1,156 @@
+"""bulk dry-run validation of recorded argv lines (like FAKE_CALL=1, but in-process)
+
+$ handofcats validate cli.py jobs.txt
+$ handofcats validate cli.py:hello --jobs 4 --skip 2 crontab.txt
+"""
+import typing as t
+import argparse
+import dataclasses
+import shlex
+import sys
+from functools import partial
+from inspect import signature, Signature
+from ..invocation import prepare, Failure, Prepared, Target
+
+Line = t.Tuple[int, str]  # (lineno, line)
+
+
+@dataclasses.dataclass(frozen=True)
+class ValidationError:
+    lineno: int
+    line: str
+    message: str
+
+
+def validate(
+    target: Target, lines: t.Iterable[str], *, skip: int = 0, jobs: int = 1
+) -> t.List[ValidationError]:
+    """check each line (argv) is parsed and bound to the function's signature"""
+    numbered = [
+        (lineno, line)
+        for lineno, line in enumerate(lines, 1)
+        if line.strip() and not line.lstrip().startswith("#")
+    ]
+    # recorded lines may have the built-in options (e.g. --logging)
+    prepared = prepare(target, customized=True)
+    if jobs <= 1 or len(numbered) <= 1:
+        return _validate_lines(prepared, numbered, skip=skip)
+
+    import multiprocessing
+    from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
+    validate_chunk: t.Callable[[t.List[Line], int], t.List[ValidationError]]
+    executor: Executor
+    if "fork" in multiprocessing.get_all_start_methods():
+        # the prepared parser is passed to the forked workers (not pickled), per pool
+        executor = ProcessPoolExecutor(
+            max_workers=jobs,
+            mp_context=multiprocessing.get_context("fork"),
+            initializer=_init_worker,
+            initargs=(prepared,),
+        )
+        validate_chunk = _validate_chunk
+    else:
+        executor = ThreadPoolExecutor(max_workers=jobs)
+        validate_chunk = partial(_validate_chunk, prepared=prepared)
+
+    size = max(1, len(numbered) // (jobs * 4))
+    chunks = [numbered[i : i + size] for i in range(0, len(numbered), size)]
+    errors: t.List[ValidationError] = []
+    with executor:
+        for chunk_errors in executor.map(
+            validate_chunk, chunks, [skip] * len(chunks)
+        ):
+            errors.extend(chunk_errors)
+    return errors
+
+
+# set in each worker process, by the pool's initializer
+_worker_prepared: t.Optional[Prepared] = None
+
+
+def _init_worker(prepared: Prepared) -> None:
+    global _worker_prepared
+    _worker_prepared = prepared
+
+
+def _validate_chunk(
+    chunk: t.List[Line], skip: int, *, prepared: t.Optional[Prepared] = None
+) -> t.List[ValidationError]:
+    prepared = prepared or _worker_prepared
+    assert prepared is not None
+    return _validate_lines(prepared, chunk, skip=skip)
+
+
+def _validate_lines(
+    prepared: Prepared, lines: t.List[Line], *, skip: int = 0
+) -> t.List[ValidationError]:
+    errors = []
+    signatures: t.Dict[t.Any, Signature] = {}
+    for lineno, line in lines:
+        try:
+            argv = shlex.split(line, comments=True)[skip:]
+        except ValueError as e:
+            errors.append(ValidationError(lineno, line, f"shlex: {e}"))
+            continue
+
+        bound = prepared.bind(argv)
+        if isinstance(bound, Failure):
+            message = bound.message or "exit (status={})".format(bound.status)
+            errors.append(ValidationError(lineno, line, message))
+            continue
+
+        fn, params = bound
+        sig = signatures.get(fn)
+        if sig is None:
+            sig = signatures[fn] = signature(fn)
+        try:
+            sig.bind(**params)  # like getcallargs() on FAKE_CALL=1
+        except TypeError as e:
+            errors.append(ValidationError(lineno, line, str(e)))
+    return errors
+
+
+def main(argv: t.Optional[t.List[str]] = None) -> None:
+    from ..cli import load_driver
+
+    parser = argparse.ArgumentParser(
+        prog="handofcats validate",
+        description="validate recorded argv lines (a line per invocation)",
+    )
+    parser.add_argument(
+        "entry_point",
+        help="target EntryPoint. (format '<file name>:<attr>' or '<file name>')",
+    )
+    parser.add_argument("files", nargs="+", help="argv lines file ('-' is stdin)")
+    parser.add_argument("--jobs", "-j", type=int, default=1, help="parallelism")
+    parser.add_argument(
+        "--skip",
+        type=int,
+        default=0,
+        help="skip leading words of each line (e.g. 'python cli.py')",
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        driver = load_driver(args.entry_point)
+    except argparse.ArgumentTypeError as e:
+        parser.error(str(e))
+
+    count = 0
+    for filename in args.files:
+        if filename == "-":
+            lines = sys.stdin.read().splitlines()
+        else:
+            with open(filename) as rf:
+                lines = rf.read().splitlines()
+
+        errors = validate(driver, lines, skip=args.skip, jobs=args.jobs)
+        for err in errors:
+            print(f"{filename}:{err.lineno}: {err.message}")
+            print(f"    {err.line.strip()}")
+        count += len(errors)
+
+    if count > 0:
+        print(f"** {count} error(s) are found **", file=sys.stderr)
+        sys.exit(1)
@@ -0,0 +1,217 @@
+"""watching the source files, and regenerating the ejected code (same as --expose) on changes
+
+$ handofcats watch cli.py src/  # writes cli-exposed.py, ...
+
+the files are polled (by mtime and size), and only the affected files
+(changed, or importing the changed local modules) are regenerated, in this (warm) process.
+"""
+import typing as t
+import argparse
+import ast
+import os
+import sys
+import time
+
+
+class Target(t.NamedTuple):
+    path: str
+    entry_point: str
+    output: str
+    deps: t.FrozenSet[str]  # the local modules imported by the target
+
+
+def detect_entry_point(path: str, source: str) -> t.Optional[str]:
+    """'<file>:<function>' for as_command, '<file>' for as_subcommand, None if not a command"""
+    single = None
+    for node in ast.walk(ast.parse(source, path)):
+        if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            continue
+        for decorator in node.decorator_list:
+            if isinstance(decorator, ast.Call):
+                decorator = decorator.func
+            name = getattr(decorator, "id", getattr(decorator, "attr", None))
+            if name == "as_subcommand":
+                return path
+            elif name in ("as_command", "handofcats"):
+                single = f"{path}:{node.name}"
+    return single
+
+
+class Watcher:
+    def __init__(
+        self,
+        paths: t.Sequence[str],
+        *,
+        output: str = "{stem}-exposed.py",
+        out: t.Optional[t.IO[str]] = None,
+    ) -> None:
+        self.paths = paths
+        self.output = output
+        self._out = out
+        self.targets: t.Dict[str, Target] = {}
+        self._stats: t.Dict[str, t.Tuple[int, int]] = {}
+
+    @property
+    def out(self) -> t.IO[str]:
+        return self._out or sys.stderr  # resolved at call time (e.g. redirected)
+
+    def output_path(self, path: str) -> str:
+        stem = os.path.splitext(os.path.basename(path))[0]
+        return os.path.join(os.path.dirname(path), self.output.format(stem=stem))
+
+    def sources(self) -> t.Iterator[str]:
+        outputs = {target.output for target in self.targets.values()}
+        for path in self.paths:
+            if os.path.isfile(path):
+                yield os.path.abspath(path)
+                continue
+            for root, dirs, files in os.walk(path):
+                dirs[:] = [d for d in dirs if not d.startswith(".")]
+                for name in sorted(files):
+                    filepath = os.path.abspath(os.path.join(root, name))
+                    if name.endswith(".py") and filepath not in outputs:
+                        yield filepath
+
+    def scan(self) -> t.Set[str]:
+        """returns the changed (or added, removed) files, since the last scan"""
+        stats = {}
+        for path in self.sources():
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            stats[path] = (st.st_mtime_ns, st.st_size)
+            for dep in self.targets[path].deps if path in self.targets else ():
+                if dep not in stats and os.path.exists(dep):
+                    dst = os.stat(dep)
+                    stats[dep] = (dst.st_mtime_ns, dst.st_size)
+
+        changed = {k for k, v in stats.items() if self._stats.get(k) != v}
+        changed.update(k for k in self._stats if k not in stats)
+        self._stats = stats
+        return changed
+
+    def update(self, changed: t.Set[str]) -> t.List[Target]:
+        """re-detect the changed files, and returns the affected targets"""
+        from .bundle import find_local_modules
+
+        for path in changed:
+            self.targets.pop(path, None)
+            if not os.path.exists(path) or not path.endswith(".py"):
+                continue
+            try:
+                with open(path) as rf:
+                    source = rf.read()
+                entry_point = detect_entry_point(path, source)
+                if entry_point is None:
+                    continue
+                modules = find_local_modules(source, root=os.path.dirname(path))
+            except SyntaxError as e:
+                print(f"{path}: error: {e}", file=self.out)
+                continue
+            self.targets[path] = Target(
+                path=path,
+                entry_point=entry_point,
+                output=self.output_path(path),
+                deps=frozenset(os.path.abspath(p) for p in modules.values()),
+            )
+        return [
+            target
+            for path, target in self.targets.items()
+            if path in changed or not target.deps.isdisjoint(changed)
+        ]
+
+    def regenerate(self, target: Target) -> t.Optional[float]:
+        """returns the elapsed time, or None (error)"""
+        import handofcats
+        from .bundle import eject
+
+        st = time.perf_counter()
+
+        # re-import the target and its local modules (handofcats and the codegen's state are kept)
+        # (by path, not by name, e.g. json.py next to the target must not evict the stdlib's json)
+        paths = {os.path.abspath(p) for p in (target.path, *target.deps)}
+        for name, module in list(sys.modules.items()):
+            filepath = getattr(module, "__file__", None)
+            if filepath and os.path.abspath(filepath) in paths:
+                del sys.modules[name]
+        handofcats._default_multi_driver = None
+
+        try:
+            code, _ = eject(target.entry_point)
+        except (Exception, SystemExit) as e:
+            print(f"{target.path}: error: {e!r}", file=self.out)
+            return None
+
+        try:
+            with open(target.output) as rf:
+                unchanged = rf.read() == code
+        except OSError:
+            unchanged = False
+        if not unchanged:
+            with open(target.output, "w") as wf:
+                wf.write(code)
+        elapsed = time.perf_counter() - st
+        status = "unchanged" if unchanged else "regenerated"
+        print(
+            f"{status} {os.path.relpath(target.output)} ({elapsed * 1000:.1f}ms)",
+            file=self.out,
+        )
+        return elapsed
+
+    def poll(self) -> t.List[t.Tuple[Target, t.Optional[float]]]:
+        changed = self.scan()
+        if not changed:
+            return []
+        return [(target, self.regenerate(target)) for target in self.update(changed)]
+
+    def run_forever(self, *, interval: float = 0.5, debounce: float = 0.2) -> None:
+        while True:
+            changed = self.scan()
+            if changed:
+                # debounce, waiting until the rapid saves are settled
+                while True:
+                    time.sleep(debounce)
+                    more = self.scan()
+                    if not more:
+                        break
+                    changed |= more
+                for target in self.update(changed):
+                    self.regenerate(target)
+            time.sleep(interval)
+
+
+def main(argv: t.Optional[t.List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="handofcats watch",
+        description="regenerate the ejected code (same as --expose), when the source files are changed",
+    )
+    parser.add_argument("paths", nargs="+", help="files or directories")
+    parser.add_argument(
+        "--output",
+        default="{stem}-exposed.py",
+        help="output file name, next to the source (default: '{stem}-exposed.py')",
+    )
+    parser.add_argument(
+        "--interval", type=float, default=0.5, help="polling interval (seconds)"
+    )
+    parser.add_argument(
+        "--debounce", type=float, default=0.2, help="waiting time for rapid saves"
+    )
+    parser.add_argument(
+        "--once", action="store_true", help="regenerate all, and exit (no watching)"
+    )
+    args = parser.parse_args(argv)
+
+    watcher = Watcher(args.paths, output=args.output)
+    results = watcher.poll()  # at first, all of the targets
+    if args.once:
+        if any(elapsed is None for _, elapsed in results):
+            sys.exit(1)
+        return
+
+    print(f"watching {', '.join(args.paths)} ...", file=sys.stderr)
+    try:
+        watcher.run_forever(interval=args.interval, debounce=args.debounce)
+    except KeyboardInterrupt:
+        pass
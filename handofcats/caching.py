@@ -0,0 +1,278 @@
+"""local file cache (e.g. rendered help messages)
+
+the cache directory is $HANDOFCATS_CACHE_DIR, or $XDG_CACHE_HOME/handofcats (~/.cache/handofcats)
+"""
+import typing as t
+import argparse
+import dataclasses
+import hashlib
+import inspect
+import os
+import sys
+from .config import Config
+from .langhelpers import reify
+from .types import TargetFunction
+
+
+def get_cache_dir(name: str) -> str:
+    root = os.environ.get("HANDOFCATS_CACHE_DIR")
+    if not root:
+        xdg = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+        root = os.path.join(xdg, "handofcats")
+    return os.path.join(root, name)
+
+
+def write_atomically(path: str, data: bytes) -> None:
+    import tempfile
+
+    dirpath = os.path.dirname(path)
+    os.makedirs(dirpath, exist_ok=True)
+    fd, tmppath = tempfile.mkstemp(dir=dirpath, prefix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as wf:
+            wf.write(data)
+        os.replace(tmppath, path)
+    except BaseException:
+        if os.path.exists(tmppath):
+            os.unlink(tmppath)
+        raise
+
+
+def source_digest(functions: t.Iterable[TargetFunction]) -> "hashlib._Hash":
+    """hash of the source files of the functions (and handofcats itself)"""
+    h = hashlib.sha256()
+    h.update(sys.version.encode("utf-8"))
+
+    here = os.path.dirname(os.path.abspath(__file__))
+    for name in ("customize.py", "driver.py", "injector.py", "accessor.py"):
+        st = os.stat(os.path.join(here, name))
+        h.update(f"{name}:{st.st_size}:{st.st_mtime_ns}".encode("utf-8"))
+
+    seen = set()
+    for fn in functions:
+        filename = inspect.getsourcefile(fn)
+        if filename is None or filename in seen:
+            continue
+        seen.add(filename)
+        h.update(filename.encode("utf-8"))
+        with open(filename, "rb") as rf:
+            h.update(rf.read())
+    return h
+
+
+class HelpCache:
+    """rendered help messages, keyed by source hash, config and terminal width"""
+
+    def __init__(
+        self,
+        key: t.Union[str, t.Callable[[], str]],
+        *,
+        directory: t.Optional[str] = None,
+    ) -> None:
+        self._key = key  # or factory, computed only when help is requested
+        self.directory = directory or get_cache_dir("help")
+
+    @reify
+    def key(self) -> str:
+        return self._key() if callable(self._key) else self._key
+
+    def _path(self, name: str) -> str:
+        # name is "" (root parser) or sub-command's name
+        digest = hashlib.sha256(f"{self.key}:{name}".encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{digest}.txt")
+
+    def get(self, name: str) -> t.Optional[str]:
+        try:
+            with open(self._path(name), encoding="utf-8") as rf:
+                return rf.read()
+        except OSError:
+            return None
+
+    def set(self, name: str, text: str) -> None:
+        try:
+            write_atomically(self._path(name), text.encode("utf-8"))
+        except OSError:
+            pass  # cache is best effort
+
+    def print_if_cached(
+        self, argv: t.Sequence[str], *, names: t.Sequence[str]
+    ) -> bool:
+        """print help without building parser, if argv is `-h` (or `<sub-command> -h`)"""
+        name = None
+        if len(argv) == 1 and argv[0] in ("-h", "--help"):
+            name = ""
+        elif len(argv) == 2 and argv[1] in ("-h", "--help") and argv[0] in names:
+            name = argv[0]
+        if name is None:
+            return False
+
+        text = self.get(name)
+        if text is None:
+            return False
+        sys.stdout.write(text)
+        return True
+
+    def install(self, parser: argparse.ArgumentParser, *, name: str = "") -> None:
+        """use cached text in parser.format_help() (also used by usage errors)"""
+        original = parser.format_help
+
+        def format_help() -> str:
+            text = self.get(name)
+            if text is None:
+                text = original()
+                self.set(name, text)
+            return text
+
+        parser.format_help = format_help  # type: ignore
+
+        for action in parser._actions:
+            if isinstance(action, argparse._SubParsersAction):
+                for sub_name, sub_parser in action.choices.items():
+                    self.install(sub_parser, name=sub_name)
+
+
+def get_help_cache(
+    functions: t.Sequence[TargetFunction],
+    *,
+    config: Config,
+    names: t.Sequence[str] = (),
+) -> t.Optional[HelpCache]:
+    """names are the sub-commands' names and aliases (registered names, not fn.__name__)"""
+    enabled = config.help_cache
+    if os.environ.get("HANDOFCATS_HELP_CACHE"):
+        enabled = os.environ["HANDOFCATS_HELP_CACHE"].strip() not in ("", "0")
+    if not enabled:
+        return None
+
+    def _key() -> str:
+        import shutil
+
+        h = source_digest(functions)
+        h.update(repr(dataclasses.replace(config, cont=None)).encode("utf-8"))
+        h.update(repr(list(names)).encode("utf-8"))
+        h.update(str(shutil.get_terminal_size().columns).encode("utf-8"))
+        h.update(os.path.basename(sys.argv[0]).encode("utf-8"))  # default prog
+        return h.hexdigest()
+
+    return HelpCache(_key)
+
+
+class Uncacheable(Exception):
+    pass
+
+
+class ResultCache:
+    """size-bounded output cache, evicted in LRU order (mtime is the last access)"""
+
+    def __init__(self, *, max_size: int, directory: t.Optional[str] = None) -> None:
+        self.max_size = max_size
+        self.directory = directory or get_cache_dir("result")
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.out")
+
+    def get(self, key: str) -> t.Optional[bytes]:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as rf:
+                data = rf.read()
+            os.utime(path)  # touch, for LRU
+            return data
+        except OSError:
+            return None
+
+    def set(self, key: str, data: bytes) -> None:
+        if len(data) > self.max_size:
+            return
+        try:
+            write_atomically(self._path(key), data)
+            self.evict()
+        except OSError:
+            pass  # cache is best effort
+
+    def evict(self) -> None:
+        entries = []
+        total = 0
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if not entry.name.endswith(".out"):
+                    continue
+                st = entry.stat()
+                entries.append((st.st_mtime_ns, st.st_size, entry.path))
+                total += st.st_size
+
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_size:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+            total -= size
+
+    def clear(self) -> None:
+        if not os.path.isdir(self.directory):
+            return
+        for name in os.listdir(self.directory):
+            if name.endswith(".out"):
+                os.unlink(os.path.join(self.directory, name))
+
+
+def result_cache_key(fn: TargetFunction, params: t.Dict[str, t.Any]) -> str:
+    """hash of the function (and its source), params, and the contents of file params (and existing files)
+
+    raising Uncacheable, if params include a value which cannot be hashed (e.g. iterator)
+    """
+    import json
+    import pathlib
+
+    fn = inspect.unwrap(fn)
+    hints = t.get_type_hints(fn)
+    # str arguments are also treated as file paths, if the files exist
+    params = {
+        name: pathlib.Path(val)
+        if isinstance(val, str)
+        and (_is_path_type(hints.get(name)) or os.path.isfile(val))
+        else val
+        for name, val in params.items()
+    }
+
+    try:
+        h = source_digest([fn])
+    except (OSError, TypeError) as e:  # e.g. defined in REPL
+        raise Uncacheable(str(e))
+    h.update(f"{fn.__module__}.{fn.__qualname__}".encode("utf-8"))
+    h.update(
+        json.dumps(params, sort_keys=True, default=_digest_value).encode("utf-8")
+    )
+    return h.hexdigest()
+
+
+def _is_path_type(typ: t.Any) -> bool:
+    import pathlib
+
+    if t.get_origin(typ) is t.Union:  # e.g. t.Optional[pathlib.Path]
+        return any(_is_path_type(x) for x in t.get_args(typ))
+    return isinstance(typ, type) and issubclass(typ, pathlib.PurePath)
+
+
+def _digest_value(val: t.Any) -> t.Any:
+    import pathlib
+
+    if isinstance(val, pathlib.PurePath):
+        path = str(val)
+        if os.path.isfile(path):
+            with open(path, "rb") as rf:
+                return {"path": path, "sha256": hashlib.sha256(rf.read()).hexdigest()}
+        return {"path": path}
+    elif isinstance(val, (tuple, set, frozenset)):
+        return sorted(val, key=repr) if isinstance(val, (set, frozenset)) else list(val)
+    elif isinstance(val, bytes):
+        return hashlib.sha256(val).hexdigest()
+    elif hasattr(val, "tobytes"):  # array.array, numpy.ndarray
+        return [
+            str(getattr(val, "typecode", getattr(val, "dtype", ""))),
+            hashlib.sha256(val.tobytes()).hexdigest(),
+        ]
+    raise Uncacheable(f"{type(val)!r} is not cacheable")
@@ -1,10 +1,13 @@
 import typing as t
+import sys
 import argparse
 import magicalimport
 import dataclasses
 from handofcats import get_default_multi_driver
+from .driver import Driver, MultiDriver
 from types import ModuleType
 from .types import TargetFunction
+from . import tracing
 from logging import getLogger as get_logger
 
 logger = get_logger(__name__)
@@ -22,13 +25,30 @@ def _import_symbol(path, sep=":", logger=logger) -> TargetFunction:
 
 def _import_module(path, logger=logger) -> ModuleType:
     try:
-        return magicalimport.import_module(path, cwd=True)
+        with tracing.get_tracer().phase("import", module=path):
+            return magicalimport.import_module(path, cwd=True)
     except ImportError as e:
         logger.info(str(e), exc_info=True)
         raise argparse.ArgumentTypeError(f"""\x1b[33m{e}\x1b[0m""")
 
 
+# handofcats <action> ...
+ACTIONS = {
+    "validate": "handofcats.actions.validate:main",
+    "serve": "handofcats.actions.serve:main",
+    "bundle": "handofcats.actions.bundle:main",
+    "run": "handofcats.actions.run:main",
+    "watch": "handofcats.actions.watch:main",
+}
+
+
 def main(argv=None):
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv and argv[0] in ACTIONS:
+        action = magicalimport.import_symbol(ACTIONS[argv[0]], sep=":")
+        return action(argv[1:])
+
     parser = argparse.ArgumentParser(
         prog="handofcats",
         add_help=False,
@@ -42,7 +62,8 @@ def main(argv=None):
 
     parser.add_argument(
         "entry_point",
-        help="target EntryPoint. (format '<file name>:<attr>' or '<file name>')",
+        help="target EntryPoint. (format '<file name>:<attr>' or '<file name>')\n"
+        + "or action ({})".format(", ".join(ACTIONS)),
     )
     parser.add_argument(
         "--cont", help="continuation, if not None value is returned, default is print",
@@ -62,47 +83,49 @@ def main(argv=None):
 
     args, rest_argv = parser.parse_known_args(argv)
 
-    try:
-        attr = None
-        if ":" in args.entry_point:
-            module_path, attr = args.entry_point.rsplit(":", 1)
-        else:
-            module_path = args.entry_point
-        module = _import_module(module_path)
-    except argparse.ArgumentTypeError as e:
-        parser.error(e)
-
-    # as single command
-    if attr is not None:
+    # tracing module import, too
+    with tracing.activated():
         try:
-            fn = getattr(module, attr)
-        except AttributeError as e:
-            parser.error(f"""\x1b[33m{e}\x1b[0m""")
-        driver = args.driver(fn)
-        if args.cont is not None:
-            driver.config = dataclasses.replace(
-                driver.config, cont=_import_symbol(args.cont)
+            driver = load_driver(
+                args.entry_point, driver=args.driver, multi_driver=args.multi_driver
             )
+        except argparse.ArgumentTypeError as e:
+            parser.error(e)
 
-        return driver.run(rest_argv)
-
-    # as multi command
-    driver = get_default_multi_driver()
-    if driver is not None:
-        assert isinstance(driver, args.multi_driver)
         if args.cont is not None:
             driver.config = dataclasses.replace(
                 driver.config, cont=_import_symbol(args.cont)
             )
         return driver.run(rest_argv)
 
+
+def load_driver(
+    entry_point: str, *, driver=Driver, multi_driver=MultiDriver
+) -> t.Union[Driver, MultiDriver]:
+    """load driver from entry point ('<file name>:<attr>' or '<file name>')"""
+    attr = None
+    if ":" in entry_point:
+        module_path, attr = entry_point.rsplit(":", 1)
+    else:
+        module_path = entry_point
+    module = _import_module(module_path)
+
+    # as single command
+    if attr is not None:
+        try:
+            fn = getattr(module, attr)
+        except AttributeError as e:
+            raise argparse.ArgumentTypeError(f"""\x1b[33m{e}\x1b[0m""")
+        return driver(fn)
+
+    # as multi command
+    default_driver = get_default_multi_driver()
+    if default_driver is not None:
+        assert isinstance(default_driver, multi_driver)
+        return default_driver
+
     fns = _collect_functions(module)
-    driver = args.multi_driver(fns)
-    if args.cont is not None:
-        driver.config = dataclasses.replace(
-            driver.config, cont=_import_symbol(args.cont)
-        )
-    return driver.run(rest_argv)
+    return multi_driver(fns)
 
 
 def _collect_functions(module: ModuleType) -> t.List[TargetFunction]:
@@ -20,11 +20,22 @@ class Config:
     # use handling options
     ignore_logging: bool = False
     ignore_expose: bool = False
+    ignore_profile: bool = False
+    ignore_resource_usage: bool = False
+    # --shard is opt-in (Config(ignore_shard=False)), not to partition the parameters unexpectedly
+    ignore_shard: bool = True
 
     # use in injector.inject()
     ignore_arguments: bool = False
     ignore_flags: bool = False
 
+    # cache rendered help messages (or HANDOFCATS_HELP_CACHE=1)
+    help_cache: bool = False
+    # cache the output of pure command, max size in bytes (None is disabled)
+    cache_size: t.Optional[int] = None
+    # leave via os._exit() after running, skipping interpreter teardown (None is HANDOFCATS_FAST_EXIT=1)
+    fast_exit: t.Optional[bool] = None
+
     cont: t.Callable[[t.Any], t.Any] = print
     codegen_config: CodegenConfig = dataclasses.field(default_factory=CodegenConfig)
 
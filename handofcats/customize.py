@@ -1,7 +1,10 @@
+import argparse
 import logging
 import os
 import sys
-from functools import partial
+from functools import partial, wraps
+
+logger = logging.getLogger(__name__)
 
 
 def first_parser_setup(parser):
@@ -28,6 +31,14 @@ def first_parser_activate(params):
 def logging_setup(parser, *, debug: bool = False):
     logging_levels = list(logging._nameToLevel.keys())
     parser.add_argument("--logging", choices=logging_levels, default=None)
+    if not is_available(parser, "--logging-queue"):
+        # the command's own parameter (LOGGING_QUEUE=1 is still available)
+        return partial(logging_activate, debug=debug, queue_option=False)
+    parser.add_argument(
+        "--logging-queue",
+        action="store_true",
+        help="logging via queue, formatting and writing in a background thread",
+    )
     return partial(logging_activate, debug=debug)
 
 
@@ -39,6 +50,8 @@ def logging_activate(
     logging_format=None,
     logging_stream=None,
     logging_time=None,  # "relative", "asctime", None
+    logging_queue=False,
+    queue_option=True,
 ):
     time_format_map = {
         "relative": "relative:%(relativeCreated)s	",
@@ -66,13 +79,454 @@ def logging_activate(
         logging_format = os.environ["LOGGING_FORMAT"]
     if os.environ.get("LOGGING_STREAM"):
         logging_stream = getattr(sys, os.environ["LOGGING_STREAM"])
+    if bool(os.environ.get("LOGGING_QUEUE", "").strip()):
+        logging_queue = True
 
     if "logging" in params:
         level = params.pop("logging", None)
         if level is not None:
             logging_level = level
+    if queue_option and params.pop("logging_queue", False):
+        logging_queue = True
 
-    if logging_level is not None:
+    if logging_level is None:
+        return
+    if logging_queue:
+        from ._queue_logging import queue_logging_config
+
+        queue_logging_config(
+            level=logging_level, format=logging_format, stream=logging_stream,
+        )
+    else:
         logging.basicConfig(
             level=logging_level, format=logging_format, stream=logging_stream,
         )
+
+
+def _iter_actions(parser):
+    for action in parser._actions:
+        yield action
+        if isinstance(action, argparse._SubParsersAction):
+            for sub_parser in action.choices.values():
+                yield from _iter_actions(sub_parser)
+
+
+def is_available(parser, option_string):
+    """the option is not used by the command (or sub-commands), as option string or dest"""
+    dest = option_string.lstrip("-").replace("-", "_")
+    for action in _iter_actions(parser):
+        if option_string in action.option_strings or action.dest == dest:
+            return False
+    return True
+
+
+def profile_setup(parser):
+    options = []
+    if is_available(parser, "--profile"):
+        parser.add_argument(
+            "--profile", action="store_true", help="profile with cProfile"
+        )
+        options.append("profile")
+    if is_available(parser, "--profile-output"):
+        parser.add_argument(
+            "--profile-output",
+            default=None,
+            metavar="PSTATS",
+            help="profile with cProfile, and dump stats to the file",
+        )
+        options.append("profile_output")
+    return partial(profile_activate, options=options)
+
+
+def profile_activate(
+    params,
+    *,
+    profile_output=None,
+    profile_top=None,
+    options=("profile", "profile_output"),
+):
+    profile = False
+    if os.environ.get("HANDOFCATS_PROFILE"):
+        profile_output = os.environ["HANDOFCATS_PROFILE"]
+    if os.environ.get("HANDOFCATS_PROFILE_TOP"):
+        profile_top = int(os.environ["HANDOFCATS_PROFILE_TOP"])
+
+    # only the options added by profile_setup() (not the command's parameters)
+    if "profile" in options and params.pop("profile", False):
+        profile = True
+    if "profile_output" in options:
+        output = params.pop("profile_output", None)
+        if output is not None:
+            profile_output = output
+
+    if profile_output is None and not profile:
+        return None
+    if not profile_output and profile_top is None:
+        profile_top = 20  # without output file, showing summary
+    return partial(_profile_wrap, output=profile_output or None, top=profile_top)
+
+
+def _profile_wrap(fn, *, output=None, top=None):
+    import cProfile
+
+    @wraps(fn)
+    def _profiled(**params):
+        profiler = cProfile.Profile()
+        try:
+            return profiler.runcall(fn, **params)
+        finally:
+            _dump_profile(profiler, output=output, top=top)
+
+    return _profiled
+
+
+def _dump_profile(profiler, *, output=None, top=None):
+    import pstats
+
+    if output is not None:
+        profiler.dump_stats(output)
+        print(
+            "** {where}: profile is dumped to {output} **".format(
+                where=__name__, output=output
+            ),
+            file=sys.stderr,
+        )
+    if top:
+        stats = pstats.Stats(profiler, stream=sys.stderr)
+        stats.sort_stats("cumulative").print_stats(top)
+
+
+def resource_usage_setup(parser):
+    if not is_available(parser, "--resource-usage"):
+        # the command's own parameter (HANDOFCATS_RESOURCE_USAGE=1 is still available)
+        return partial(resource_usage_activate, option=False)
+    parser.add_argument(
+        "--resource-usage",
+        action="store_true",
+        help="report resource usage (peak RSS, cpu time) as json, after calling",
+    )
+    return resource_usage_activate
+
+
+def resource_usage_activate(
+    params, *, resource_usage=False, tracemalloc_top=None, output=None, option=True
+):
+    if bool(os.environ.get("HANDOFCATS_RESOURCE_USAGE", "").strip()):
+        resource_usage = True
+    if os.environ.get("HANDOFCATS_RESOURCE_USAGE_OUTPUT"):
+        output = os.environ["HANDOFCATS_RESOURCE_USAGE_OUTPUT"]
+    if os.environ.get("HANDOFCATS_TRACEMALLOC"):
+        tracemalloc_top = int(os.environ["HANDOFCATS_TRACEMALLOC"])
+
+    if option and params.pop("resource_usage", False):
+        resource_usage = True
+
+    if not resource_usage:
+        return None
+    return partial(_resource_usage_wrap, tracemalloc_top=tracemalloc_top, output=output)
+
+
+def _resource_usage_wrap(fn, *, tracemalloc_top=None, output=None):
+    import time
+
+    try:
+        import resource
+    except ImportError:  # e.g. windows
+        resource = None
+
+    @wraps(fn)
+    def _measured(**params):
+        if tracemalloc_top is not None:
+            import tracemalloc
+
+            tracemalloc.start()
+        before = resource.getrusage(resource.RUSAGE_SELF) if resource else None
+        start = time.perf_counter()
+        try:
+            return fn(**params)
+        finally:
+            record = {
+                "fn": getattr(fn, "__name__", None),
+                "wall_time": time.perf_counter() - start,
+            }
+            if resource is not None:
+                after = resource.getrusage(resource.RUSAGE_SELF)
+                record["user_time"] = after.ru_utime - before.ru_utime
+                record["sys_time"] = after.ru_stime - before.ru_stime
+                # ru_maxrss is KiB on linux, bytes on macOS
+                unit = 1 if sys.platform == "darwin" else 1024
+                record["max_rss"] = after.ru_maxrss * unit
+            if tracemalloc_top is not None:
+                record["tracemalloc"] = _tracemalloc_report(tracemalloc_top)
+            _dump_json_line(record, output=output)
+
+    return _measured
+
+
+def _tracemalloc_report(top):
+    import tracemalloc
+
+    snapshot = tracemalloc.take_snapshot()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    stats = snapshot.statistics("lineno")[:top]
+    return {
+        "peak": peak,
+        "top": [
+            {
+                "location": "{}:{}".format(
+                    stat.traceback[0].filename, stat.traceback[0].lineno
+                ),
+                "size": stat.size,
+                "count": stat.count,
+            }
+            for stat in stats
+        ],
+    }
+
+
+def _dump_json_line(record, *, output=None):
+    import json
+
+    if output is None:
+        print(json.dumps(record), file=sys.stderr)
+        return
+    with open(output, "a") as wf:
+        print(json.dumps(record), file=wf)
+
+
+def shard_setup(parser):
+    from .sharding import STRATEGIES
+
+    options = []
+    if is_available(parser, "--shard"):
+        parser.add_argument(
+            "--shard",
+            type=_shard_type,
+            default=None,
+            metavar="I/N",
+            help="process only the I-th of N partitions of the list (or iterator) parameters",
+        )
+        options.append("shard")
+    if is_available(parser, "--shard-by"):
+        parser.add_argument(
+            "--shard-by",
+            choices=STRATEGIES,
+            default=None,
+            help="partitioning by contiguous index range (range, default), or by stable hash of each item (hash)",
+        )
+        options.append("shard_by")
+    if is_available(parser, "--shard-params"):
+        parser.add_argument(
+            "--shard-params",
+            default=None,
+            metavar="NAME[,NAME...]",
+            help="the partitioned parameters (default: the positional ones)",
+        )
+        options.append("shard_params")
+
+    # by default, only the positional parameters (the data), not the option lists (e.g. --tags a b)
+    positionals = sorted(
+        {
+            action.dest
+            for action in _iter_actions(parser)
+            if not action.option_strings
+            and not isinstance(action, argparse._SubParsersAction)
+        }
+    )
+    return partial(
+        shard_activate, names=positionals, options=options, error=parser.error
+    )
+
+
+def shard_activate(
+    params,
+    *,
+    shard=None,
+    strategy="range",
+    names=None,
+    options=("shard", "shard_by", "shard_params"),
+    error=None,
+):
+    from .sharding import STRATEGIES, parse_shard
+
+    def _invalid(message):
+        if error is None:
+            raise ValueError(message)
+        error(message)  # exit with usage, same as the invalid --shard
+
+    if os.environ.get("HANDOFCATS_SHARD"):
+        try:
+            shard = parse_shard(os.environ["HANDOFCATS_SHARD"])
+        except ValueError as e:
+            _invalid(f"HANDOFCATS_SHARD: {e}")
+    if os.environ.get("HANDOFCATS_SHARD_BY"):
+        strategy = os.environ["HANDOFCATS_SHARD_BY"]
+        if strategy not in STRATEGIES:
+            _invalid(
+                f"HANDOFCATS_SHARD_BY: invalid choice: {strategy!r}"
+                f" (choose from {', '.join(STRATEGIES)})"
+            )
+    if os.environ.get("HANDOFCATS_SHARD_PARAMS"):
+        names = _split_names(os.environ["HANDOFCATS_SHARD_PARAMS"])
+
+    # only the options added by shard_setup() (not the command's parameters)
+    if "shard" in options:
+        value = params.pop("shard", None)
+        if value is not None:
+            shard = value
+    if "shard_by" in options:
+        value = params.pop("shard_by", None)
+        if value is not None:
+            strategy = value
+    if "shard_params" in options:
+        value = params.pop("shard_params", None)
+        if value is not None:
+            names = _split_names(value)
+
+    if shard is None:
+        return None
+    if isinstance(shard, str):
+        shard = parse_shard(shard)
+    return partial(_shard_wrap, shard=shard, strategy=strategy, names=names)
+
+
+def shard_disabled_setup(parser):
+    return partial(shard_disabled_activate, error=parser.error)
+
+
+def shard_disabled_activate(params, *, error=None):
+    # not to run the whole data on every host, silently
+    for name in ("HANDOFCATS_SHARD", "HANDOFCATS_SHARD_BY", "HANDOFCATS_SHARD_PARAMS"):
+        if os.environ.get(name):
+            message = f"{name} is set, but sharding is disabled (enabled by Config(ignore_shard=False))"
+            if error is None:
+                raise ValueError(message)
+            error(message)
+    return None
+
+
+def _split_names(value):
+    return [x.strip() for x in value.split(",") if x.strip()]
+
+
+def _shard_type(value):
+    import argparse
+    from .sharding import parse_shard
+
+    try:
+        return parse_shard(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
+def _shard_wrap(fn, *, shard, strategy="range", names=None):
+    from .sharding import shard_params
+
+    @wraps(fn)
+    def _sharded(**params):
+        params = shard_params(params, shard, strategy=strategy, names=names)
+        return fn(**params)
+
+    return _sharded
+
+
+def result_cache_setup(parser, *, max_size):
+    options = []
+    if is_available(parser, "--no-cache"):
+        parser.add_argument(
+            "--no-cache", action="store_true", help="bypass the result cache"
+        )
+        options.append("no_cache")
+    if is_available(parser, "--clear-cache"):
+        parser.add_argument(
+            "--clear-cache", action="store_true", help="clear the result cache"
+        )
+        options.append("clear_cache")
+    return partial(result_cache_activate, max_size=max_size, options=options)
+
+
+def result_cache_activate(
+    params, *, max_size, bypass=False, options=("no_cache", "clear_cache")
+):
+    from .caching import ResultCache
+
+    cache = ResultCache(max_size=max_size)
+    # only the options added by result_cache_setup() (not the command's parameters)
+    if "clear_cache" in options and params.pop("clear_cache", False):
+        cache.clear()
+
+    if bool(os.environ.get("HANDOFCATS_NO_CACHE", "").strip()):
+        bypass = True
+    if "no_cache" in options and params.pop("no_cache", False):
+        bypass = True
+
+    if bypass or bool(os.getenv("FAKE_CALL")):
+        return None
+    return partial(_result_cache_wrap, cache=cache)
+
+
+def _result_cache_wrap(fn, *, cache):
+    import io
+    import pickle
+    from . import _streams
+    from .caching import result_cache_key, Uncacheable
+
+    @wraps(fn)
+    def _cached(**params):
+        try:
+            key = result_cache_key(fn, params)
+        except Uncacheable as e:
+            logger.info("result cache is skipped (%s)", e)
+            return fn(**params)
+
+        data = cache.get(key)
+        if data is not None:
+            # replaying the output, without calling the function
+            output, val = pickle.loads(data)
+            sys.stdout.write(output)
+            return val
+
+        # the output and the returned value are cached (the value is output by cont(), as usual)
+        buf = io.StringIO()
+        with _streams.installed("stdout") as stdout:
+            tee = _Tee(stdout.current(), buf)
+            with _streams.redirected("stdout", tee):
+                val = fn(**params)
+        if tee.binary_written:
+            logger.info("result cache is skipped (binary output)")
+            return val
+        try:
+            data = pickle.dumps((buf.getvalue(), val))
+        except Exception as e:  # e.g. generator, lambda
+            logger.info("result cache is skipped (%s)", e)
+            return val
+        cache.set(key, data)
+        return val
+
+    return _cached
+
+
+class _Tee:
+    def __init__(self, *streams):
+        self.streams = streams
+        self.binary_written = False
+
+    @property
+    def buffer(self):
+        # the binary output is passed through to the first stream, but not captured
+        self.binary_written = True
+        return self.streams[0].buffer
+
+    def isatty(self):
+        return self.streams[0].isatty()
+
+    def write(self, s):
+        for stream in self.streams:
+            stream.write(s)
+        return len(s)
+
+    def flush(self):
+        for stream in self.streams:
+            stream.flush()
@@ -1,5 +1,9 @@
 import typing as t
 import dataclasses
+import itertools
+import os
+import sys
+from functools import partial
 from .injector import Injector
 from .types import (
     TargetFunction,
@@ -10,6 +14,8 @@ from .types import (
 )
 from .config import Config, default_config
 from . import customize
+from . import tracing
+from . import fast_exit
 
 
 class Driver:
@@ -25,6 +31,8 @@ class Driver:
 
     __call__ = register
 
+    @fast_exit.fast_exit_run
+    @tracing.traced_run
     def run(
         self,
         argv=None,
@@ -34,6 +42,13 @@ class Driver:
         fn = self.fn
         config = self.config
 
+        if argv is None:
+            argv = sys.argv[1:]
+        if _params_json_is_requested(argv):
+            from .actions import params_json
+
+            return params_json.run_as_single_command(fn=fn, argv=argv, config=config)
+
         if self.config.ignore_expose:
             rest_argv = argv
         else:
@@ -44,8 +59,6 @@ class Driver:
 
             # code generation is needed
             if fargs.expose:
-                from .actions import codegen
-
                 factory = config.codegen_config.__class__
                 if fargs.simple:
                     factory = config.codegen_config.as_simple
@@ -53,6 +66,14 @@ class Driver:
                     config, codegen_config=factory(inplace=fargs.inplace)
                 )
 
+                from .actions import check
+
+                filename, rest_argv = check.parse_check_option(rest_argv)
+                if filename is not None:
+                    return check.run_check(filename, functions=[fn], config=config)
+
+                from .actions import codegen
+
                 return codegen.run_as_single_command(
                     self.setup_parser,
                     fn=fn,
@@ -131,8 +152,130 @@ class Driver:
         return parser, activate_functions
 
 
+def _params_json_is_requested(argv: t.Sequence[str]) -> bool:
+    # not importing ./actions/params_json.py, if it is not used
+    argv = list(itertools.takewhile(lambda arg: arg != "--", argv))  # after "--" is data
+    if "--expose" in argv:
+        return False  # code generation has priority over the envvar
+    if any(arg == "--params-json" or arg.startswith("--params-json=") for arg in argv):
+        return True
+    return bool(os.environ.get("HANDOFCATS_PARAMS", "").strip())
+
+
+class CommandRegistry:
+    """name -> function, ordered by registration
+
+    lookup (also by alias) and registration are O(1), and duplicated names are detected.
+    """
+
+    def __init__(self) -> None:
+        self._functions: t.Dict[str, TargetFunction] = {}  # name -> function
+        self._names: t.Dict[int, t.List[str]] = {}  # id(function) -> names
+        self._aliases: t.Dict[str, str] = {}  # alias -> name
+
+    def add(
+        self,
+        fn: TargetFunction,
+        *,
+        name: t.Optional[str] = None,
+        aliases: t.Sequence[str] = (),
+    ) -> TargetFunction:
+        if name is None:
+            name = fn.__name__
+        if self._functions.get(name) is fn:
+            return fn  # already registered
+
+        for k in (name, *aliases):
+            if k in self._functions or k in self._aliases:
+                raise ValueError(
+                    f"{k!r} is already registered (by {self.get(k)!r}), adding {fn!r}"
+                )
+
+        self._functions[name] = fn
+        self._names.setdefault(id(fn), []).append(name)  # can be registered twice
+        for alias in aliases:
+            self._aliases[alias] = name
+        return fn
+
+    def remove(self, fn_or_name: t.Union[TargetFunction, str]) -> TargetFunction:
+        """remove the entry by name (or alias), or all entries of the function"""
+        if isinstance(fn_or_name, str):
+            names = [self._aliases.get(fn_or_name, fn_or_name)]
+        else:
+            names = list(self._names.get(id(fn_or_name), ()))
+        if not names or names[0] not in self._functions:
+            raise KeyError(fn_or_name)
+
+        for name in names:
+            fn = self._functions.pop(name)
+            self._names[id(fn)].remove(name)
+            if not self._names[id(fn)]:
+                del self._names[id(fn)]
+            for alias in self.aliases_of(name):
+                del self._aliases[alias]
+        return fn
+
+    def get(self, name: str) -> t.Optional[TargetFunction]:
+        return self._functions.get(self._aliases.get(name, name))
+
+    def name_of(self, fn: TargetFunction) -> str:
+        """the first registered name"""
+        names = self._names.get(id(fn))
+        return names[0] if names else fn.__name__
+
+    def entries(
+        self, functions: t.Optional[t.Iterable[TargetFunction]] = None
+    ) -> t.List[t.Tuple[str, TargetFunction]]:
+        """(name, function) pairs, a function registered twice has two entries"""
+        if functions is None:
+            return list(self._functions.items())
+        entries = []
+        seen = set()
+        for fn in functions:
+            if id(fn) in seen:
+                continue
+            seen.add(id(fn))
+            entries.extend((name, fn) for name in self._names.get(id(fn), [fn.__name__]))
+        return entries
+
+    def aliases_of(self, name: str) -> t.List[str]:
+        # O(number of aliases), only used when building parser
+        return [alias for alias, k in self._aliases.items() if k == name]
+
+    def names(self) -> t.List[str]:
+        """registered names and aliases"""
+        return [*self._functions, *self._aliases]
+
+    def __contains__(self, fn_or_name: t.Union[TargetFunction, str]) -> bool:
+        if isinstance(fn_or_name, str):
+            return self.get(fn_or_name) is not None
+        return id(fn_or_name) in self._names
+
+    def __iter__(self) -> t.Iterator[TargetFunction]:
+        return iter(self._functions.values())
+
+    def __len__(self) -> int:
+        return len(self._functions)
+
+
+class _Aliases:
+    """aliases of sub-command (prestring renders list of str with extra quotes)"""
+
+    emit = None  # for codegen (prestring.codeobject.as_value() uses str())
+
+    def __init__(self, names: t.List[str]) -> None:
+        self.names = names
+
+    def __iter__(self) -> t.Iterator[str]:
+        return iter(self.names)
+
+    def __str__(self) -> str:
+        return repr(self.names)
+
+
 class MultiDriver:
     injector_class = Injector
+    registry_class = CommandRegistry
 
     def __init__(
         self,
@@ -141,18 +284,33 @@ class MultiDriver:
         config: Config = default_config,
     ):
         self.config = config
-        self.functions: t.List[TargetFunction] = functions or []
+        self.registry = self.registry_class()
+        for fn in functions or []:
+            self.registry.add(fn)
 
-    def register(self, fn: TargetFunction) -> TargetFunction:
-        # O(N), but do not mind.
-        if fn in self.functions:
-            return fn
+    @property
+    def functions(self) -> t.Tuple[TargetFunction, ...]:
+        """registered functions (read-only, use register() / unregister())"""
+        return tuple(self.registry)
 
-        self.functions.append(fn)
-        return fn
+    def register(
+        self,
+        fn: t.Optional[TargetFunction] = None,
+        *,
+        name: t.Optional[str] = None,
+        aliases: t.Sequence[str] = (),
+    ) -> TargetFunction:
+        if fn is None:
+            return partial(self.register, name=name, aliases=aliases)
+        return self.registry.add(fn, name=name, aliases=aliases)
 
     __call__ = register
 
+    def unregister(self, fn_or_name: t.Union[TargetFunction, str]) -> TargetFunction:
+        return self.registry.remove(fn_or_name)
+
+    @fast_exit.fast_exit_run
+    @tracing.traced_run
     def run(
         self,
         argv=None,
@@ -162,6 +320,29 @@ class MultiDriver:
         functions = self.functions
         config = self.config
 
+        if argv is None:
+            argv = sys.argv[1:]
+        if _params_json_is_requested(argv):
+            from .actions import params_json
+
+            return params_json.run_as_multi_command(
+                get_function=self.registry.get, argv=argv, config=config
+            )
+        if argv and argv[0].startswith("--parallel"):
+            from .actions import parallel
+
+            if parallel.is_requested(argv):
+                return parallel.run_in_parallel(
+                    get_function=self.registry.get, argv=argv, config=config
+                )
+        if argv and argv[0].startswith("--pipeline"):
+            from .actions import pipeline
+
+            if pipeline.is_requested(argv):
+                return pipeline.run_as_pipeline(
+                    get_function=self.registry.get, argv=argv, config=config
+                )
+
         if config.ignore_expose:
             rest_argv = argv
         else:
@@ -172,14 +353,20 @@ class MultiDriver:
 
             if fargs.expose:
                 # code generation is needed
-                from .actions import codegen
-
                 factory = config.codegen_config.__class__
                 if fargs.simple:
                     factory = config.codegen_config.as_simple
                 config = dataclasses.replace(
                     config, codegen_config=factory(inplace=fargs.inplace)
                 )
+                from .actions import check
+
+                filename, rest_argv = check.parse_check_option(rest_argv)
+                if filename is not None:
+                    return check.run_check(filename, functions=functions, config=config)
+
+                from .actions import codegen
+
                 return codegen.run_as_multi_command(
                     self.setup_parser,
                     functions=functions,
@@ -195,11 +382,12 @@ class MultiDriver:
             functions=functions,
             argv=rest_argv,
             config=config,
+            names=self.registry.names(),
         )
 
     def setup_parser(
         self,
-        functions: t.Optional[t.List[TargetFunction]] = None,
+        functions: t.Optional[t.Sequence[TargetFunction]] = None,
         *,
         m: t.Optional[PrestringModule] = None,
         config: t.Optional[Config] = None,
@@ -240,12 +428,6 @@ class MultiDriver:
             m.unnewline()
             m.stmt("  # type: ignore")
 
-        activate_functions = []
-        for setup in customizations or []:
-            afn = setup(parser)
-            if afn is not None:
-                activate_functions.append(afn)
-
         # subparesrs = parser.add_subparsers(title="subparesrs", dest="subcommand")
         subparsers = m.let(
             "subparsers", parser.add_subparsers(title="subcommands", dest="subcommand")
@@ -255,7 +437,7 @@ class MultiDriver:
         m.setattr(subparsers, "required", True)  # for py3.6
         m.sep()
 
-        for i, target_fn in enumerate(functions):
+        for i, (name, target_fn) in enumerate(self.registry.entries(functions)):
             # fn = <target function>
             fn = m.let("fn", m.symbol(target_fn))
             if i > 0:
@@ -263,12 +445,17 @@ class MultiDriver:
                 m.stmt("  # type: ignore")
 
             # sub_parser = subparsers.add_parser(fn.__name__, help=fn.__doc__)
+            kwargs = {}
+            aliases = self.registry.aliases_of(name)
+            if aliases:
+                kwargs["aliases"] = _Aliases(aliases)
             sub_parser = m.let(
                 "sub_parser",
                 subparsers.add_parser(
-                    m.getattr(fn, "__name__"),
+                    m.getattr(fn, "__name__") if name == target_fn.__name__ else name,
                     help=m.getattr(fn, "__doc__"),
                     formatter_class=parser.formatter_class,
+                    **kwargs,
                 ),
             )
 
@@ -288,4 +475,11 @@ class MultiDriver:
             # sub_parser.set_defaults(subcommand=fn)
             m.stmt(sub_parser.set_defaults(subcommand=fn))
             m.sep()
+
+        # after sub-commands, not to conflict with their parameters
+        activate_functions = []
+        for setup in customizations or []:
+            afn = setup(parser)
+            if afn is not None:
+                activate_functions.append(afn)
         return parser, activate_functions
@@ -0,0 +1,73 @@
+"""fast exit mode for short-lived commands, activated by Config(fast_exit=True) or HANDOFCATS_FAST_EXIT=1
+(Config(fast_exit=False) disables it, even if the envvar is set)
+
+- the objects created before running (e.g. by imports) are frozen (gc.freeze()), and the collector is disabled
+- after running, stdout/stderr are flushed and the atexit hooks are called (including logging.shutdown())
+- and then, the process leaves via os._exit(), skipping the interpreter teardown (deallocating all objects)
+
+non-daemon threads are not joined. running the atexit hooks relies on CPython's atexit._run_exitfuncs()
+(there is no public API), so on the other implementations, it exits normally via sys.exit().
+"""
+import typing as t
+import gc
+import os
+import sys
+from functools import wraps
+from .config import Config
+
+
+def is_enabled(config: Config) -> bool:
+    if config.fast_exit is not None:
+        return config.fast_exit
+    return os.environ.get("HANDOFCATS_FAST_EXIT", "").strip() not in ("", "0")
+
+
+def exit(code: t.Any = 0) -> t.NoReturn:
+    """same as sys.exit(code), but skipping the interpreter teardown"""
+    import atexit
+
+    if code is None:
+        status = 0
+    elif isinstance(code, int):
+        status = code
+    else:
+        print(code, file=sys.stderr)
+        status = 1
+
+    run_exitfuncs = getattr(atexit, "_run_exitfuncs", None)  # CPython only
+    if run_exitfuncs is None:
+        sys.exit(status)  # the hooks are called by the interpreter teardown
+
+    try:
+        run_exitfuncs()
+    finally:
+        for stream in (sys.stdout, sys.stderr):
+            try:
+                stream.flush()
+            except (OSError, ValueError):  # e.g. broken pipe, closed
+                pass
+        os._exit(status)
+
+
+def fast_exit_run(method):
+    """exit after Driver.run() (and MultiDriver.run()), if the fast exit mode is enabled"""
+
+    @wraps(method)
+    def _run(self, *args, **kwargs):
+        if not is_enabled(self.config):
+            return method(self, *args, **kwargs)
+
+        gc.freeze()
+        gc.disable()
+        code: t.Any = 0
+        try:
+            method(self, *args, **kwargs)
+        except SystemExit as e:
+            code = e.code
+        finally:
+            # other exceptions are propagated as usual, with the collector enabled again
+            gc.unfreeze()
+            gc.enable()
+        exit(code)
+
+    return _run
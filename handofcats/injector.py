@@ -1,11 +1,16 @@
 import typing as t
 import typing_extensions as tx
+import argparse
+import array
+import enum
+import os
 import sys
 import warnings
 import itertools
 from logging import getLogger as get_logger
 from .langhelpers import reify
 from .accessor import Accessor
+from . import tracing
 
 logger = get_logger(__name__)
 
@@ -32,69 +37,20 @@ else:
 class Injector:
     """inject arguments to argparse.ArgumentParser from function definition"""
 
-    def __init__(self, fn):
+    def __init__(self, fn, *, registry: t.Optional["TypeRegistry"] = None):
         self.fn = fn
+        self.registry = registry or default_registry
 
     @reify
     def accessor(self):
         return Accessor(self.fn)
 
-    def _handle_type(self, opt, kwargs, *, _nonetype=type(None)):
-        if opt.type == bool:
-            action = "store_true"
-            if opt.default is True:
-                action = "store_false"
-            kwargs.pop("required", None)
-            kwargs.pop("default", None)
-            kwargs["action"] = action
-        elif opt.type in (int, float):
-            kwargs["type"] = opt.type
-        else:
-            from collections.abc import Sequence
-
-            if _has_origin(opt.type):
-                try:
-                    # for Optional
-                    if (
-                        opt.type.__origin__ == t.Union
-                        and _nonetype in opt.type.__args__
-                        and len(opt.type.__args__) == 2
-                    ):
-                        item_type = opt._replace(
-                            type=[t for t in opt.type.__args__ if t is not _nonetype][0]
-                        )
-                        kwargs["required"] = False
-                        self._handle_type(item_type, kwargs)
-
-                    # for Literal type (e.g. tx.Literal["r", "g", "b"])
-                    if _is_literal(opt.type):
-                        kwargs["choices"] = list(opt.type.__args__)
-                        item_type = opt._replace(type=type(opt.type.__args__[0]))
-                        self._handle_type(item_type, kwargs)
-                    # for sequence (e.g. t.List[int], t.Tuple[str])
-                    elif issubclass(opt.type.__origin__, Sequence):
-                        kwargs["action"] = "append"
-                        item_type = opt._replace(type=opt.type.__args__[0])
-                        self._handle_type(item_type, kwargs)
-                except Exception:  # TODO: remove this
-                    logger.info(
-                        "unexpected generic type is found (type=%s)",
-                        opt.type,
-                        exc_info=True,
-                    )
-            elif hasattr(opt.type, "__supertype__"):  # for NewType
-                # choices support (tentative)
-                if hasattr(opt.type, "choices"):
-                    warnings.warn(
-                        "choices is deprecated, use typing_extensions.Literal instead of this"
-                    )
-                    kwargs["choices"] = opt.type.choices
-                origin_type = opt._replace(type=opt.type.__supertype__)
-                self._handle_type(origin_type, kwargs)
-            elif issubclass(opt.type, (list, tuple)):
-                kwargs["action"] = "append"
-            else:
-                logger.info("unexpected type is found (type=%s)", opt.type)
+    def _handle_type(self, opt, kwargs):
+        handler = self.registry.resolve(opt.type)
+        if handler is None:
+            logger.info("unexpected type is found (type=%s)", opt.type)
+            return
+        handler(self, opt, kwargs)
 
     def inject(
         self,
@@ -106,15 +62,21 @@ class Injector:
             t.Union[str, t.Callable[[t.Dict[str, t.Any]], None]]
         ] = "-",  # need by argparse.ArgumentDefaultsHelpFormatter
         callback: t.Callable[[t.Any], t.Any] = id,
+        exclude: t.Container[str] = (),
     ):
-        arguments = [(opt, None) for opt in self.accessor.arguments]
-        flags = [(opt, opt.required) for opt in self.accessor.flags]
+        with tracing.get_tracer().phase(
+            "introspect", fn=getattr(self.fn, "__name__", None)
+        ):
+            arguments = [(opt, None) for opt in self.accessor.arguments]
+            flags = [(opt, opt.required) for opt in self.accessor.flags]
         if ignore_arguments:
             arguments = []
         if ignore_flags:
             flags = []
 
         for opt, required in itertools.chain(arguments, flags):
+            if opt.name in exclude:
+                continue
             kwargs = {}
             if required is not None:
                 kwargs["required"] = required
@@ -125,6 +87,10 @@ class Injector:
             if kwargs.get("action") == "append" and not opt.option_name.startswith("-"):
                 kwargs["nargs"] = "*"
                 kwargs.pop("action")
+            if isinstance(kwargs.get("type"), LineIterator):
+                if not opt.option_name.startswith("-"):
+                    kwargs["nargs"] = "?"
+                    kwargs.setdefault("default", "-")  # stdin
 
             if help_default is not None:
                 if callable(help_default):
@@ -136,6 +102,533 @@ class Injector:
             callback(parser.add_argument(opt.option_name, **kwargs))
 
 
+def _is_ndarray(typ) -> bool:
+    # not importing numpy, if it is not used
+    return (
+        getattr(typ, "__module__", None) == "numpy"
+        and getattr(typ, "__name__", None) == "ndarray"
+    )
+
+
+def _import_numpy_maybe() -> t.Any:
+    # numpy is optional
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+class ArrayType:
+    """argparse's type, converting to array.array (or numpy.ndarray)
+
+    - "1,2,3" or "1 2 3" -- values
+    - "-" -- text from stdin
+    - "@<file>" -- text file, or binary file (if suffix is .bin, or .npy for numpy)
+
+    the values are parsed in bulk, not by each argparse's type= call.
+    """
+
+    emit = None  # for codegen (prestring.codeobject.as_value() uses str())
+
+    def __init__(self, typecode: str = "d", *, use_numpy: bool = False) -> None:
+        self.typecode = typecode  # typecode of array.array, or dtype of numpy
+        self.use_numpy = use_numpy
+        self.__name__ = "array"  # used in argparse's error message
+
+    def __call__(self, value: str) -> t.Any:
+        if value.startswith("@"):
+            filename = value[1:]
+            if not os.path.exists(filename):
+                raise argparse.ArgumentTypeError(f"no such file: {filename!r}")
+            if filename.endswith((".bin", ".npy")):
+                return self._load_binary(filename)
+            with open(filename) as rf:
+                text = rf.read()
+        elif value == "-":
+            text = sys.stdin.read()
+        else:
+            text = value
+        return self._parse(text.replace(",", " ").split())
+
+    def _parse(self, tokens: t.List[str]) -> t.Any:
+        if self.use_numpy:
+            import numpy
+
+            return numpy.array(tokens, dtype=self.typecode)
+
+        numpy = _import_numpy_maybe()
+        if numpy is not None:
+            # converted in bulk (not by each element), and copied as bytes
+            values = numpy.array(tokens, dtype=numpy.dtype(self.typecode))
+            return array.array(self.typecode, values.tobytes())
+
+        item_type = float if self.typecode in ("f", "d") else int
+        return array.array(self.typecode, map(item_type, tokens))
+
+    def _load_binary(self, filename: str) -> t.Any:
+        if self.use_numpy:
+            import numpy
+
+            if filename.endswith(".npy"):
+                return numpy.load(filename)
+            return numpy.fromfile(filename, dtype=self.typecode)
+
+        arr = array.array(self.typecode)
+        with open(filename, "rb") as rf:
+            arr.frombytes(rf.read())
+        return arr
+
+    def __str__(self) -> str:
+        # emitted code by --expose (binary files are not supported)
+        tokens = "(open(v[1:]).read() if v.startswith('@') else __import__('sys').stdin.read() if v == '-' else v).replace(',', ' ').split()"
+        if self.use_numpy:
+            return f"lambda v: __import__('numpy').array({tokens}, dtype={self.typecode!r})"
+        item_type = "float" if self.typecode in ("f", "d") else "int"
+        return f"lambda v: __import__('array').array({self.typecode!r}, map({item_type}, {tokens}))"
+
+
+class _ArrayDefault(array.array):
+    """array.array, but emitted as `array.array(...)` by --expose (and in help)"""
+
+    emit = None  # for codegen (prestring.codeobject.as_value() uses str())
+
+    def __str__(self) -> str:
+        return f"array.array({self.typecode!r}, {self.tolist()!r})"
+
+
+class LineIterator:
+    """argparse's type, converting to the lazy iterator of lines
+
+    - "-" -- stdin
+    - "@<file>" or "<file>" -- file (opened when iterating)
+
+    blank lines are skipped, and each line is converted by item_type.
+    """
+
+    emit = None  # for codegen (prestring.codeobject.as_value() uses str())
+
+    def __init__(self, item_type: t.Callable[[str], t.Any] = str) -> None:
+        if not callable(item_type):
+            item_type = str
+        self.item_type = item_type
+        self.__name__ = "lines"  # used in argparse's error message
+
+    def __call__(self, value: str) -> t.Iterator[t.Any]:
+        if value != "-":
+            filename = value[1:] if value.startswith("@") else value
+            if not os.path.exists(filename):
+                raise argparse.ArgumentTypeError(f"no such file: {filename!r}")
+        return self._iterate(value)
+
+    def _iterate(self, value: str) -> t.Iterator[t.Any]:
+        if value == "-":
+            yield from self._convert(sys.stdin)
+            return
+        with open(value[1:] if value.startswith("@") else value) as rf:
+            yield from self._convert(rf)
+
+    def _convert(self, rf: t.Iterable[str]) -> t.Iterator[t.Any]:
+        lines = filter(None, (line.rstrip("\r\n") for line in rf))
+        if self.item_type is str:
+            return lines
+        return map(self.item_type, lines)
+
+    def __str__(self) -> str:
+        # emitted code by --expose (reading is lazy, but the file is opened eagerly)
+        lines = "filter(None, (line.rstrip('\\r\\n') for line in (__import__('sys').stdin if v == '-' else open(v[1:] if v.startswith('@') else v))))"
+        if self.item_type is not str:
+            lines = f"map({self.item_type.__name__}, {lines})"
+        return f"lambda v: {lines}"
+
+
+Handler = t.Callable[[Injector, t.Any, t.Dict[str, t.Any]], None]
+
+
+class TypeRegistry:
+    """type (or generic origin) -> handler, updating add_argument()'s kwargs
+
+    the resolution is memoized per annotation.
+    """
+
+    def __init__(self) -> None:
+        self._types: t.Dict[t.Any, Handler] = {}  # exact type (and its subclasses)
+        self._lazy_types: t.Dict[str, Handler] = {}  # "<module>:<name>" -> handler
+        self._origins: t.Dict[t.Any, Handler] = {}  # generic origin
+        self._predicates: t.List[t.Tuple[t.Callable[[t.Any], bool], Handler]] = []
+        self._resolved: t.Dict[t.Any, t.Optional[Handler]] = {}
+
+    def register(
+        self,
+        typ: t.Any,
+        handler: t.Optional[Handler] = None,
+        *,
+        converter: t.Optional[t.Callable[[str], t.Any]] = None,
+    ) -> None:
+        """register handler (or converter, used as argparse's type) for the type
+
+        typ can be "<module>:<name>", resolved lazily (after the module is imported)
+        """
+        if handler is None:
+            if converter is None:
+                raise ValueError("handler or converter is required")
+            handler = _ConverterHandler(converter)
+        if isinstance(typ, str):
+            self._lazy_types[typ] = handler
+        else:
+            self._types[typ] = handler
+        self._resolved.clear()
+
+    def register_origin(self, origin: t.Any, handler: Handler) -> None:
+        """register handler for generic type (e.g. t.Iterator[int])"""
+        self._origins[origin] = handler
+        self._resolved.clear()
+
+    def register_if(
+        self, predicate: t.Callable[[t.Any], bool], handler: Handler
+    ) -> None:
+        """register handler for the type matched with predicate (checked in order)"""
+        self._predicates.append((predicate, handler))
+        self._resolved.clear()
+
+    def resolve(self, typ: t.Any) -> t.Optional[Handler]:
+        try:
+            return self._resolved[typ]
+        except KeyError:
+            handler = self._resolved[typ] = self._lookup(typ)
+            return handler
+        except TypeError:  # unhashable
+            return self._lookup(typ)
+
+    def _load_lazy_types(self) -> None:
+        for path in list(self._lazy_types):
+            module_name, _, name = path.partition(":")
+            module = sys.modules.get(module_name)
+            if module is None:  # not used yet
+                continue
+            ob = module
+            for attr in name.split("."):
+                ob = getattr(ob, attr)
+            self._types.setdefault(ob, self._lazy_types.pop(path))
+
+    def _lookup(self, typ: t.Any) -> t.Optional[Handler]:
+        if self._lazy_types:
+            self._load_lazy_types()
+
+        if _has_origin(typ):
+            try:
+                handler = self._origins.get(typ.__origin__)
+            except TypeError:  # unhashable
+                handler = None
+            if handler is not None:
+                return handler
+        elif isinstance(typ, type):
+            # the builtins are the last (e.g. IntEnum is handled as enum.Enum, not as int)
+            mro = sorted(typ.__mro__, key=lambda cls: cls.__module__ == "builtins")
+            for cls in mro:
+                handler = self._types.get(cls)
+                if handler is not None:
+                    return handler
+
+        for predicate, handler in self._predicates:
+            try:
+                if predicate(typ):
+                    return handler
+            except Exception:
+                logger.debug(
+                    "predicate %r is failed (type=%s)", predicate, typ, exc_info=True
+                )
+        return None
+
+
+class _ConverterHandler:
+    def __init__(self, converter: t.Callable[[str], t.Any]) -> None:
+        self.converter = converter
+
+    def __call__(self, injector: Injector, opt, kwargs: t.Dict[str, t.Any]) -> None:
+        kwargs["type"] = self.converter
+        if isinstance(self.converter, Converter) and opt.default is not None:
+            # string default is converted by argparse (and emitted as is, by --expose)
+            kwargs["default"] = str(opt.default)
+
+
+class Converter:
+    """argparse's type, evaluated from the code (the same code is emitted by --expose)"""
+
+    emit = None  # for codegen (prestring.codeobject.as_value() uses str())
+
+    def __init__(
+        self,
+        code: str,
+        *,
+        name: str,
+        errors: t.Tuple[t.Type[Exception], ...] = (),
+    ) -> None:
+        self.code = code
+        self.errors = errors
+        self.__name__ = name  # used in argparse's error message
+
+    @reify
+    def fn(self) -> t.Callable[[str], t.Any]:
+        return eval(self.code)  # e.g. "__import__('decimal').Decimal"
+
+    def __call__(self, value: str) -> t.Any:
+        try:
+            return self.fn(value)
+        except self.errors as e:
+            raise ValueError(str(e))
+
+    def __str__(self) -> str:
+        return self.code
+
+
+class Choices:
+    """choices of argparse, the membership test is O(1), and keeping order for display
+
+    if there are many choices, usage and help show only the leading ones (via metavar).
+    """
+
+    emit = None  # for codegen (prestring.codeobject.as_value() uses str())
+    max_display = 8
+
+    def __init__(self, values: t.Iterable[t.Any]) -> None:
+        self._values = dict.fromkeys(values)  # ordered set
+
+    def __contains__(self, value: t.Any) -> bool:
+        return value in self._values
+
+    def __iter__(self) -> t.Iterator[t.Any]:
+        return iter(self._values)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    @property
+    def metavar(self) -> t.Optional[str]:
+        """truncated metavar, if there are too many choices (otherwise None)"""
+        if len(self._values) <= self.max_display:
+            return None
+        leading = itertools.islice(self._values, self.max_display)
+        rest = len(self._values) - self.max_display
+        return "{%s,...(%d more)}" % (",".join(map(str, leading)), rest)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self._values)!r})"
+
+    def __str__(self) -> str:
+        # emitted code by --expose
+        return f"dict.fromkeys({list(self._values)!r})"
+
+
+class EnumType:
+    """argparse's type, converting to the member of enum (by name, or by value)"""
+
+    emit = None  # for codegen (prestring.codeobject.as_value() uses str())
+
+    def __init__(self, enum_class: t.Type[enum.Enum]) -> None:
+        self.enum_class = enum_class
+        self.__name__ = enum_class.__name__  # used in argparse's error message
+
+    @property
+    def metavar(self) -> str:
+        return "{%s}" % ",".join(self.enum_class.__members__)
+
+    def __call__(self, value: str) -> enum.Enum:
+        member = self.enum_class.__members__.get(value)
+        if member is not None:
+            return member
+        for member in self.enum_class:
+            if str(member.value) == value:
+                return member
+        raise argparse.ArgumentTypeError(
+            f"invalid choice: {value!r} (choose from {self.metavar})"
+        )
+
+    def __str__(self) -> str:
+        # emitted code by --expose (same as __call__, by name, or by str(value))
+        name = self.enum_class.__name__
+        return (
+            f"lambda v: {name}[v] if v in {name}.__members__"
+            f" else {name}(next((m.value for m in {name} if str(m.value) == v), v))"
+        )
+
+
+def _handle_bool(injector: Injector, opt, kwargs: t.Dict[str, t.Any]) -> None:
+    action = "store_true"
+    if opt.default is True:
+        action = "store_false"
+    kwargs.pop("required", None)
+    kwargs.pop("default", None)
+    kwargs["action"] = action
+
+
+def _handle_builtin(injector: Injector, opt, kwargs: t.Dict[str, t.Any]) -> None:
+    kwargs["type"] = opt.type
+
+
+def _handle_list(injector: Injector, opt, kwargs: t.Dict[str, t.Any]) -> None:
+    kwargs["action"] = "append"
+
+
+def _handle_array(injector: Injector, opt, kwargs: t.Dict[str, t.Any]) -> None:
+    typecode = getattr(opt.default, "typecode", "d")
+    kwargs["type"] = ArrayType(typecode)
+    if opt.default is not None:
+        kwargs["default"] = _ArrayDefault(typecode, opt.default)
+
+
+def _handle_ndarray(injector: Injector, opt, kwargs: t.Dict[str, t.Any]) -> None:
+    dtype = str(getattr(opt.default, "dtype", "float64"))
+    kwargs["type"] = ArrayType(dtype, use_numpy=True)
+
+
+def _handle_enum(injector: Injector, opt, kwargs: t.Dict[str, t.Any]) -> None:
+    converter = EnumType(opt.type)
+    kwargs["type"] = converter
+    kwargs["metavar"] = converter.metavar
+    if isinstance(opt.default, enum.Enum):
+        kwargs["default"] = opt.default.name
+
+
+def _is_optional(typ, *, _nonetype=type(None)) -> bool:
+    return (
+        typ.__origin__ == t.Union
+        and _nonetype in typ.__args__
+        and len(typ.__args__) == 2
+    )
+
+
+def _handle_optional(
+    injector: Injector, opt, kwargs: t.Dict[str, t.Any], *, _nonetype=type(None)
+) -> None:
+    item_type = opt._replace(
+        type=[t for t in opt.type.__args__ if t is not _nonetype][0]
+    )
+    kwargs["required"] = False
+    injector._handle_type(item_type, kwargs)
+
+
+# for Literal type (e.g. tx.Literal["r", "g", "b"])
+def _handle_literal(injector: Injector, opt, kwargs: t.Dict[str, t.Any]) -> None:
+    choices = kwargs["choices"] = Choices(opt.type.__args__)
+    if choices.metavar is not None:
+        kwargs["metavar"] = choices.metavar
+    item_type = opt._replace(type=type(opt.type.__args__[0]))
+    injector._handle_type(item_type, kwargs)
+
+
+def _is_sequence(typ) -> bool:
+    from collections.abc import Sequence
+
+    return isinstance(typ.__origin__, type) and issubclass(typ.__origin__, Sequence)
+
+
+# for sequence (e.g. t.List[int], t.Tuple[str])
+def _handle_sequence(injector: Injector, opt, kwargs: t.Dict[str, t.Any]) -> None:
+    kwargs["action"] = "append"
+    item_type = opt._replace(type=opt.type.__args__[0])
+    injector._handle_type(item_type, kwargs)
+
+
+# for numpy.typing.NDArray (e.g. NDArray[np.int32])
+def _handle_ndarray_generic(
+    injector: Injector, opt, kwargs: t.Dict[str, t.Any]
+) -> None:
+    import numpy
+
+    # the bare NDArray has TypeVar (and NDArray[Any] has Any), not concrete dtype
+    dtype_args = getattr(opt.type.__args__[-1], "__args__", None) or [None]
+    scalar_type = dtype_args[0]
+    if isinstance(scalar_type, type) and issubclass(scalar_type, numpy.generic):
+        dtype = scalar_type.__name__
+    else:
+        dtype = "float64"
+    kwargs["type"] = ArrayType(dtype, use_numpy=True)
+
+
+# for iterator (e.g. t.Iterator[int], t.Iterable[str])
+def _handle_iterator(injector: Injector, opt, kwargs: t.Dict[str, t.Any]) -> None:
+    kwargs["type"] = LineIterator(opt.type.__args__[0])
+
+
+def _is_newtype(typ) -> bool:
+    return hasattr(typ, "__supertype__")
+
+
+def _handle_newtype(injector: Injector, opt, kwargs: t.Dict[str, t.Any]) -> None:
+    # choices support (tentative)
+    if hasattr(opt.type, "choices"):
+        warnings.warn(
+            "choices is deprecated, use typing_extensions.Literal instead of this"
+        )
+        choices = kwargs["choices"] = Choices(opt.type.choices)
+        if choices.metavar is not None:
+            kwargs["metavar"] = choices.metavar
+    origin_type = opt._replace(type=opt.type.__supertype__)
+    injector._handle_type(origin_type, kwargs)
+
+
+def _setup_default_registry(registry: TypeRegistry) -> TypeRegistry:
+    from collections.abc import Iterator, Iterable
+
+    registry.register(bool, _handle_bool)
+    registry.register(int, _handle_builtin)
+    registry.register(float, _handle_builtin)
+    registry.register(list, _handle_list)
+    registry.register(tuple, _handle_list)
+    registry.register(array.array, _handle_array)
+    registry.register(enum.Enum, _handle_enum)
+
+    # not importing these modules, until the types are used
+    registry.register(
+        "pathlib:PurePath",
+        converter=Converter("__import__('pathlib').Path", name="Path"),
+    )
+    for name in ("datetime", "date", "time"):
+        registry.register(
+            f"datetime:{name}",
+            converter=Converter(
+                f"__import__('datetime').{name}.fromisoformat", name=name
+            ),
+        )
+    registry.register(
+        "decimal:Decimal",
+        converter=Converter(
+            "__import__('decimal').Decimal",
+            name="Decimal",
+            errors=(ArithmeticError,),  # decimal.InvalidOperation
+        ),
+    )
+    registry.register(
+        "uuid:UUID", converter=Converter("__import__('uuid').UUID", name="UUID")
+    )
+
+    registry.register_origin(Iterator, _handle_iterator)
+    registry.register_origin(Iterable, _handle_iterator)
+    registry.register_if(
+        lambda typ: _has_origin(typ) and _is_optional(typ), _handle_optional
+    )
+    registry.register_if(_is_literal, _handle_literal)
+    registry.register_if(
+        lambda typ: _has_origin(typ) and _is_sequence(typ), _handle_sequence
+    )
+    registry.register_if(
+        lambda typ: _has_origin(typ) and _is_ndarray(typ.__origin__),
+        _handle_ndarray_generic,
+    )
+    registry.register_if(_is_newtype, _handle_newtype)
+    registry.register_if(_is_ndarray, _handle_ndarray)
+    return registry
+
+
+default_registry = _setup_default_registry(TypeRegistry())
+
+
+def register_converter(typ: t.Any, converter: t.Callable[[str], t.Any]) -> None:
+    """use converter as argparse's type, for the parameters annotated with typ"""
+    default_registry.register(typ, converter=converter)
+
+
 def _help_default(kwargs: t.Dict[str, t.Any]):
     """
     append help message generated from default value
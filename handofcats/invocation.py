@@ -0,0 +1,207 @@
+"""programmatic invocation, without exiting
+
+parsers are built once per (target, config), and reused (the recently used ones, up to MAX_CACHE_SIZE).
+the reused parsers are not mutated by parsing, so invoke() can be called concurrently.
+"""
+import typing as t
+import argparse
+import dataclasses
+import threading
+from collections import OrderedDict
+from functools import partial
+from .driver import Driver, MultiDriver
+from .config import Config, default_config
+from .types import TargetFunction, ArgumentParser
+
+
+@dataclasses.dataclass(frozen=True)
+class Failure:
+    """returned by invoke(), instead of exiting"""
+
+    status: int
+    message: str = ""
+    usage: str = ""  # help message, if `-h` is passed
+
+
+class _ParserExit(Exception):
+    def __init__(self, status: int, message: str = "", usage: str = "") -> None:
+        super().__init__(status, message)
+        self.status = status
+        self.message = message
+        self.usage = usage
+
+
+Target = t.Union[TargetFunction, Driver, MultiDriver]
+
+
+class Prepared:
+    """built parser, and parsing argv without exiting"""
+
+    def __init__(
+        self,
+        parser: ArgumentParser,
+        *,
+        fn: t.Optional[TargetFunction] = None,
+        excluded: t.FrozenSet[str] = frozenset(),
+    ) -> None:
+        self.parser = parser
+        self.fn = fn  # None, if multi command
+        self.excluded = excluded  # the built-in options' dests (e.g. "logging")
+
+    def parse(
+        self, argv: t.Sequence[str]
+    ) -> t.Tuple[TargetFunction, t.Dict[str, t.Any]]:
+        """parse argv, raising _ParserExit on error (or -h)"""
+        args = self.parser.parse_args(list(argv))
+        params = vars(args).copy()
+        for name in self.excluded:
+            params.pop(name, None)
+        if self.fn is None:
+            return params.pop("subcommand"), params
+        return self.fn, params
+
+    def bind(
+        self, argv: t.Sequence[str]
+    ) -> t.Union[Failure, t.Tuple[TargetFunction, t.Dict[str, t.Any]]]:
+        try:
+            return self.parse(argv)
+        except _ParserExit as e:
+            return Failure(status=e.status, message=e.message, usage=e.usage)
+
+
+MAX_CACHE_SIZE = 256
+
+# LRU, not to keep the functions (e.g. closures) and their parsers forever
+_cache: "OrderedDict[t.Hashable, Prepared]" = OrderedDict()
+_lock = threading.Lock()
+
+
+def _get_cached(key: t.Hashable) -> t.Optional[Prepared]:
+    with _lock:
+        prepared = _cache.get(key)
+        if prepared is not None:
+            _cache.move_to_end(key)
+        return prepared
+
+
+def prepare(
+    target: Target, *, config: t.Optional[Config] = None, customized: bool = False
+) -> Prepared:
+    """build (or reuse) the parser for the target
+
+    if customized, the built-in options (e.g. --logging) are accepted, and dropped from the params.
+    """
+    if isinstance(target, (Driver, MultiDriver)):
+        driver = target
+        if config is None:
+            config = driver.config
+    else:
+        driver = None
+        if config is None:
+            config = default_config
+
+    if isinstance(driver, MultiDriver):
+        # names and aliases are also the part of the parser
+        registry = driver.registry
+        entries = tuple(
+            (name, fn, tuple(registry.aliases_of(name)))
+            for name, fn in registry.entries()
+        )
+        key: t.Hashable = (driver.__class__, entries, config, customized)
+    elif driver is not None:
+        key = (driver.__class__, driver.fn, config, customized)
+    else:
+        key = (Driver, target, config, customized)
+
+    prepared = _get_cached(key)
+    if prepared is not None:
+        return prepared
+
+    with _lock:
+        prepared = _cache.get(key)
+        if prepared is not None:
+            return prepared
+
+        if driver is None:
+            driver = Driver(t.cast(TargetFunction, target), config=config)
+        excluded: t.Set[str] = set()
+        customizations = []
+        if customized:
+            from .actions.commandline import _get_customizations
+
+            customizations = [
+                partial(_recording_dests, setup=setup, dests=excluded)
+                for setup in _get_customizations(config)
+            ]
+        parser, _ = driver.setup_parser(
+            config=config, customizations=customizations
+        )
+        _make_non_exiting(parser)
+
+        fn = None if isinstance(driver, MultiDriver) else driver.fn
+        prepared = _cache[key] = Prepared(
+            parser, fn=fn, excluded=frozenset(excluded)
+        )
+        while len(_cache) > MAX_CACHE_SIZE:
+            _cache.popitem(last=False)  # least recently used
+        return prepared
+
+
+def invoke(
+    target: Target, argv: t.Sequence[str], *, config: t.Optional[Config] = None
+) -> t.Any:
+    """call the function with argv, returning its value (or Failure)
+
+    customizations (e.g. --logging, --expose) are not included.
+    """
+    from .actions.commandline import _bind_fake_call_if_needed
+
+    bound = prepare(target, config=config).bind(argv)
+    if isinstance(bound, Failure):
+        return bound
+
+    fn, params = bound
+    fn = _bind_fake_call_if_needed(fn)
+    try:
+        return fn(**params)
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            return Failure(status=e.code or 0)
+        return Failure(status=1, message=str(e.code))
+
+
+def _recording_dests(
+    parser: argparse.ArgumentParser,
+    *,
+    setup: t.Callable[..., t.Any],
+    dests: t.Set[str],
+) -> t.Any:
+    """call the customization's setup, recording the dests of the options added by it"""
+    before = {id(action) for action in parser._actions}
+    activate = setup(parser)
+    dests.update(a.dest for a in parser._actions if id(a) not in before)
+    return activate
+
+
+def _make_non_exiting(parser: argparse.ArgumentParser) -> None:
+    def error(message: str) -> t.NoReturn:
+        raise _ParserExit(
+            2, f"{parser.prog}: error: {message}", usage=parser.format_usage()
+        )
+
+    def exit(status: int = 0, message: t.Optional[str] = None) -> t.NoReturn:
+        raise _ParserExit(status, message or "")
+
+    def print_help(file: t.Optional[t.IO[str]] = None) -> None:
+        # `-h` calls parser.print_help() and parser.exit()
+        raise _ParserExit(0, usage=parser.format_help())
+
+    parser.error = error  # type: ignore
+    parser.exit = exit  # type: ignore
+    parser.print_help = print_help  # type: ignore
+    parser.print_usage = print_help  # type: ignore
+
+    for action in parser._actions:
+        if isinstance(action, argparse._SubParsersAction):
+            for sub_parser in action.choices.values():
+                _make_non_exiting(sub_parser)
@@ -0,0 +1,107 @@
+"""pytest plugin, invoking the commands in-process (with the cached parsers)
+
+```
+def test_hello(handofcats_runner):
+    result = handofcats_runner.invoke(hello, ["--name", "foo"])
+    assert result.exit_code == 0
+    assert result.stdout == "hello foo\n"
+```
+
+the parsers are cached per process, so it is safe under pytest-xdist (a process per worker).
+(stdout/stderr are captured by replacing sys.stdout/sys.stderr, so don't invoke concurrently in threads)
+"""
+import typing as t
+import contextlib
+import dataclasses
+import io
+from .config import Config
+from .invocation import Failure, Target, invoke
+
+
+@dataclasses.dataclass(frozen=True)
+class Result:
+    exit_code: int
+    stdout: str
+    stderr: str
+    return_value: t.Any = None
+    # raised by the command (exit_code is 1)
+    exception: t.Optional[BaseException] = None
+
+
+class Runner:
+    def __init__(self, *, config: t.Optional[Config] = None) -> None:
+        self.config = config
+
+    def invoke(
+        self,
+        target: Target,
+        argv: t.Sequence[str] = (),
+        *,
+        config: t.Optional[Config] = None,
+        cont: bool = True,
+    ) -> Result:
+        """call the command with argv, capturing stdout and stderr
+
+        if cont is True, the returned value is also output by config.cont (e.g. print), as the command line.
+        """
+        config = config or self.config
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            try:
+                val = invoke(target, argv, config=config)
+            except Exception as e:
+                return Result(
+                    exit_code=1,
+                    stdout=stdout.getvalue(),
+                    stderr=stderr.getvalue(),
+                    exception=e,
+                )
+
+            if isinstance(val, Failure):
+                if val.status == 0:  # -h
+                    print(val.usage, end="")
+                else:
+                    print(val.usage, end="", file=stderr)
+                    if val.message:
+                        print(val.message, file=stderr)
+                return Result(
+                    exit_code=val.status,
+                    stdout=stdout.getvalue(),
+                    stderr=stderr.getvalue(),
+                )
+
+            if cont and val is not None:
+                _get_cont(target, config)(val)
+        return Result(
+            exit_code=0,
+            stdout=stdout.getvalue(),
+            stderr=stderr.getvalue(),
+            return_value=val,
+        )
+
+
+def _get_cont(target: Target, config: t.Optional[Config]) -> t.Callable[[t.Any], t.Any]:
+    if config is None:
+        config = getattr(target, "config", None)  # Driver, MultiDriver
+    if config is None:
+        return print
+    return config.cont
+
+
+def _import_pytest_maybe() -> t.Any:
+    # pytest is optional (Runner is also usable in the other test frameworks)
+    try:
+        import pytest
+    except ImportError:
+        return None
+    return pytest
+
+
+pytest = _import_pytest_maybe()
+if pytest is not None:
+
+    @pytest.fixture
+    def handofcats_runner() -> Runner:
+        """invoking the commands in-process"""
+        return Runner()
@@ -0,0 +1,89 @@
+"""setuptools integration, ejecting the commands at build time
+
+in setup.py
+
+```
+from handofcats.setuptools_ext import build_py
+
+setup(
+    ...,
+    cmdclass={"build_py": build_py({"mypkg._hello": "mypkg.cli:hello"})},
+    entry_points={"console_scripts": ["hello=mypkg._hello:main"]},
+)
+```
+
+the generated module (mypkg/_hello.py) is the ejected code (same as --expose),
+so the installed command does not import handofcats (nor introspect the function) at runtime.
+"""
+import typing as t
+import contextlib
+import os
+import sys
+
+
+def eject_targets(targets: t.Dict[str, str], *, build_lib: str) -> t.List[str]:
+    """write the ejected code of each entry point ('<module>:<attr>' or '<module>')
+
+    targets is a dict, generated module's name -> entry point.
+    the generated module must be in the same package as the entry point (for relative imports).
+    """
+    import handofcats
+    from .actions.bundle import eject
+
+    outputs = []
+    with _prepend_sys_path(build_lib):
+        for name, entry_point in targets.items():
+            module_name = entry_point.split(":", 1)[0]
+            if name.rpartition(".")[0] != module_name.rpartition(".")[0]:
+                raise ValueError(
+                    f"{name!r} must be in the same package as {entry_point!r}"
+                )
+
+            # as_subcommand() registers the functions to the global driver, at import time
+            sys.modules.pop(module_name, None)
+            handofcats._default_multi_driver = None
+
+            code, _ = eject(entry_point)
+            outpath = os.path.join(build_lib, *name.split(".")) + ".py"
+            os.makedirs(os.path.dirname(outpath), exist_ok=True)
+            with open(outpath, "w") as wf:
+                wf.write(code)
+            outputs.append(outpath)
+    return outputs
+
+
+@contextlib.contextmanager
+def _prepend_sys_path(path: str) -> t.Iterator[None]:
+    sys.path.insert(0, path)
+    try:
+        yield
+    finally:
+        sys.path.remove(path)
+
+
+def build_py(targets: t.Dict[str, str], *, base: t.Optional[type] = None) -> type:
+    """build_py command, writing the ejected modules into build_lib (after copying the packages)"""
+    if base is None:
+        from setuptools.command.build_py import build_py as base
+
+    class build_py_with_ejection(base):  # type: ignore
+        handofcats_targets = dict(targets)
+
+        def run(self) -> None:
+            super().run()
+            if self.dry_run:
+                return
+
+            outputs = eject_targets(self.handofcats_targets, build_lib=self.build_lib)
+            if self.compile or self.optimize > 0:
+                self.byte_compile(outputs)
+
+        def get_outputs(self, *args: t.Any, **kwargs: t.Any) -> t.List[str]:
+            outputs = list(super().get_outputs(*args, **kwargs))
+            outputs.extend(
+                os.path.join(self.build_lib, *name.split(".")) + ".py"
+                for name in self.handofcats_targets
+            )
+            return outputs
+
+    return build_py_with_ejection
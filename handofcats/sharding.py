@@ -0,0 +1,75 @@
+"""deterministic partitioning of the list (or iterator) parameters, for running on N hosts
+
+- "range" -- the I-th contiguous slice (an iterator is materialized)
+- "hash" -- the items whose stable hash (crc32 of str(item)) mod N is I (an iterator is kept lazy)
+
+the shard is "I/N" (1 <= I <= N), e.g. "--shard 2/4" or HANDOFCATS_SHARD=2/4.
+no coordinator is needed, each host processes a disjoint slice of the same input.
+"""
+import typing as t
+import zlib
+from collections.abc import Iterator
+
+STRATEGIES = ("range", "hash")
+
+
+class Shard(t.NamedTuple):
+    index: int  # 0-based
+    total: int
+
+    def __str__(self) -> str:
+        return f"{self.index + 1}/{self.total}"
+
+
+def parse_shard(value: str) -> Shard:
+    """'I/N' -> Shard(I - 1, N)"""
+    i, sep, n = value.partition("/")
+    if not sep or not i.strip().isdigit() or not n.strip().isdigit():
+        raise ValueError(f"invalid shard: {value!r} (expected 'I/N', e.g. '1/4')")
+    index, total = int(i), int(n)
+    if not (1 <= index <= total):
+        raise ValueError(f"invalid shard: {value!r} (1 <= I <= N is required)")
+    return Shard(index - 1, total)
+
+
+def stable_hash(item: t.Any) -> int:
+    # not hash(), randomized per process (PYTHONHASHSEED)
+    data = item if isinstance(item, bytes) else str(item).encode("utf-8")
+    return zlib.crc32(data)
+
+
+def is_shardable(value: t.Any) -> bool:
+    return isinstance(value, (list, tuple, Iterator))
+
+
+def shard_items(items: t.Any, shard: Shard, *, strategy: str = "range") -> t.Any:
+    """returns the items of the shard (list for list/tuple, iterator for iterator)"""
+    if strategy == "hash":
+        if isinstance(items, Iterator):
+            return (x for x in items if stable_hash(x) % shard.total == shard.index)
+        return [x for x in items if stable_hash(x) % shard.total == shard.index]
+    elif strategy == "range":
+        seq = list(items)
+        start = len(seq) * shard.index // shard.total
+        stop = len(seq) * (shard.index + 1) // shard.total
+        if isinstance(items, Iterator):
+            return iter(seq[start:stop])
+        return seq[start:stop]
+    raise ValueError(f"unsupported strategy: {strategy!r} (choices: {STRATEGIES})")
+
+
+def shard_params(
+    params: t.Dict[str, t.Any],
+    shard: Shard,
+    *,
+    strategy: str = "range",
+    names: t.Optional[t.Sequence[str]] = None,
+) -> t.Dict[str, t.Any]:
+    """partitions the designated parameters (if names is None, all list or iterator parameters)"""
+    new_params = params.copy()
+    for name, value in params.items():
+        if names is not None and name not in names:
+            continue
+        if is_shardable(value):
+            new_params[name] = shard_items(value, shard, strategy=strategy)
+    return new_params
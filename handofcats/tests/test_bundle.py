@@ -0,0 +1,73 @@
+import unittest
+import os
+import subprocess
+import sys
+import tempfile
+import textwrap
+
+
+class BundleTests(unittest.TestCase):
+    def _write(self, path, code):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as wf:
+            wf.write(textwrap.dedent(code))
+
+    def test_it(self):
+        import zipfile
+        from handofcats.actions.bundle import bundle
+
+        with tempfile.TemporaryDirectory() as d:
+            self._write(
+                os.path.join(d, "cli.py"),
+                """
+                from handofcats import as_command
+                from mylib.fmt import shout
+
+
+                @as_command
+                def hello(*, name: str = "world") -> None:
+                    print(shout(f"hello {name}"))
+                """,
+            )
+            self._write(os.path.join(d, "mylib", "__init__.py"), "")
+            self._write(
+                os.path.join(d, "mylib", "fmt.py"),
+                """
+                import os.path
+
+
+                def shout(s):
+                    return s.upper() + "!"
+                """,
+            )
+
+            output = os.path.join(d, "hello.pyz")
+            sys.path.insert(0, d)
+            try:
+                names = bundle(os.path.join(d, "cli.py") + ":hello", output)
+            finally:
+                sys.path.remove(d)
+                for name in ("cli", "mylib", "mylib.fmt"):
+                    sys.modules.pop(name, None)
+
+            with self.subTest("archived"):
+                self.assertEqual(
+                    names, ["__main__.pyc", "mylib/__init__.pyc", "mylib/fmt.pyc"]
+                )
+                with zipfile.ZipFile(output) as zf:
+                    self.assertEqual(sorted(zf.namelist()), sorted(names))
+
+            with self.subTest("run, without handofcats and the source"):
+                p = subprocess.run(
+                    [sys.executable, "-S", output, "--name", "foo"],
+                    cwd=tempfile.gettempdir(),
+                    env={"PATH": os.environ.get("PATH", "")},
+                    stdout=subprocess.PIPE,
+                    check=True,
+                    text=True,
+                )
+                self.assertEqual(p.stdout, "HELLO FOO!\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
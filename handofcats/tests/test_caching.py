@@ -0,0 +1,244 @@
+import unittest
+import argparse
+import tempfile
+
+
+class HelpCacheTests(unittest.TestCase):
+    def _makeOne(self, key, *, directory):
+        from handofcats.caching import HelpCache
+
+        return HelpCache(key, directory=directory)
+
+    def _makeParser(self):
+        parser = argparse.ArgumentParser(prog="cli")
+        subparsers = parser.add_subparsers()
+        subparsers.add_parser("hello").add_argument("--name")
+        return parser
+
+    def test_it(self):
+        with tempfile.TemporaryDirectory() as d:
+            target = self._makeOne("k", directory=d)
+            parser = self._makeParser()
+            target.install(parser)
+
+            with self.subTest("cached, when formatted"):
+                self.assertIsNone(target.get(""))
+                text = parser.format_help()
+                self.assertEqual(target.get(""), text)
+
+            with self.subTest("sub-command"):
+                sub_parser = parser._subparsers._group_actions[0].choices["hello"]
+                self.assertIn("--name", sub_parser.format_help())
+                self.assertIn("--name", target.get("hello"))
+
+            with self.subTest("other key is not hit"):
+                self.assertIsNone(self._makeOne("k2", directory=d).get(""))
+
+    def test_print_if_cached(self):
+        import contextlib
+        import io
+
+        with tempfile.TemporaryDirectory() as d:
+            target = self._makeOne("k", directory=d)
+            target.set("hello", "*help*")
+
+            buf = io.StringIO()
+            with contextlib.redirect_stdout(buf):
+                self.assertFalse(target.print_if_cached(["-h"], names=["hello"]))
+                self.assertFalse(
+                    target.print_if_cached(["hello", "x"], names=["hello"])
+                )
+                self.assertTrue(
+                    target.print_if_cached(["hello", "-h"], names=["hello"])
+                )
+            self.assertEqual(buf.getvalue(), "*help*")
+
+    def test_key_is_computed_lazily(self):
+        calls = []
+
+        def key():
+            calls.append(1)
+            return "k"
+
+        with tempfile.TemporaryDirectory() as d:
+            target = self._makeOne(key, directory=d)
+            target.install(self._makeParser())
+            self.assertFalse(target.print_if_cached(["hello", "x"], names=["hello"]))
+            self.assertEqual(calls, [])  # not requested
+
+            self.assertIsNone(target.get(""))
+            self.assertIsNone(target.get("hello"))
+            self.assertEqual(calls, [1])
+
+    def test_key_includes_names(self):
+        from unittest import mock
+        from handofcats.caching import get_help_cache
+        from handofcats.config import Config
+
+        def hello():
+            pass
+
+        config = Config(help_cache=True)
+        with mock.patch.dict("os.environ", {"HANDOFCATS_HELP_CACHE": ""}):
+            keys = [
+                get_help_cache([hello], config=config, names=names).key
+                for names in (["hello"], ["greet"], ["greet", "hi"])
+            ]
+        self.assertEqual(len(set(keys)), 3)
+
+
+class ResultCacheTests(unittest.TestCase):
+    def _makeOne(self, *, max_size, directory):
+        from handofcats.caching import ResultCache
+
+        return ResultCache(max_size=max_size, directory=directory)
+
+    def test_evict(self):
+        import os
+
+        with tempfile.TemporaryDirectory() as d:
+            target = self._makeOne(max_size=10, directory=d)
+            target.set("a", b"aaaa")
+            os.utime(target._path("a"), ns=(1, 1))
+            target.set("b", b"bbbb")
+            os.utime(target._path("b"), ns=(2, 2))
+
+            self.assertEqual(target.get("a"), b"aaaa")  # touched
+            target.set("c", b"cccc")
+
+            self.assertIsNone(target.get("b"))
+            self.assertEqual(target.get("a"), b"aaaa")
+            self.assertEqual(target.get("c"), b"cccc")
+
+            target.clear()
+            self.assertIsNone(target.get("a"))
+
+    def test_key(self):
+        import pathlib
+        from handofcats.caching import result_cache_key, Uncacheable
+
+        def wc(path: pathlib.Path, *, n: int = 0):
+            pass
+
+        with tempfile.NamedTemporaryFile("w") as wf:
+            wf.write("x")
+            wf.flush()
+            k0 = result_cache_key(wc, {"path": wf.name, "n": 0})
+            self.assertEqual(k0, result_cache_key(wc, {"path": wf.name, "n": 0}))
+            self.assertNotEqual(k0, result_cache_key(wc, {"path": wf.name, "n": 1}))
+
+            wf.write("y")
+            wf.flush()
+            self.assertNotEqual(k0, result_cache_key(wc, {"path": wf.name, "n": 0}))
+
+        with self.assertRaises(Uncacheable):
+            result_cache_key(wc, {"path": iter([]), "n": 0})
+
+    def test_key__str_filename(self):
+        from handofcats.caching import result_cache_key
+
+        def wc(filename: str):
+            pass
+
+        with tempfile.NamedTemporaryFile("w") as wf:
+            wf.write("x")
+            wf.flush()
+            k0 = result_cache_key(wc, {"filename": wf.name})
+            wf.write("y")
+            wf.flush()
+            self.assertNotEqual(k0, result_cache_key(wc, {"filename": wf.name}))
+
+    def test_wrapped(self):
+        import contextlib
+        import io
+        from handofcats.customize import _result_cache_wrap
+
+        calls = []
+
+        def add(x: int, y: int) -> int:
+            calls.append((x, y))
+            print("calculating")
+            return x + y
+
+        with tempfile.TemporaryDirectory() as d:
+            fn = _result_cache_wrap(add, cache=self._makeOne(max_size=1000, directory=d))
+            outputs = []
+            for _ in range(2):
+                with contextlib.redirect_stdout(io.StringIO()) as stdout:
+                    self.assertEqual(fn(x=10, y=20), 30)  # the value is returned
+                outputs.append(stdout.getvalue())
+
+        self.assertEqual(calls, [(10, 20)])  # the 2nd call is cached
+        self.assertEqual(outputs, ["calculating\n", "calculating\n"])
+
+    def test_wrapped__captured_only_in_current_thread(self):
+        import contextlib
+        import io
+        import threading
+        from handofcats.customize import _result_cache_wrap
+
+        started = threading.Event()
+        done = threading.Event()
+
+        def other():
+            started.wait()
+            print("other thread")  # not cached
+            done.set()
+
+        def hello() -> None:
+            started.set()
+            done.wait()
+            print("hello")
+
+        th = threading.Thread(target=other)
+        th.start()
+        with tempfile.TemporaryDirectory() as d:
+            cache = self._makeOne(max_size=1000, directory=d)
+            with contextlib.redirect_stdout(io.StringIO()):
+                _result_cache_wrap(hello, cache=cache)()
+                th.join()
+                with contextlib.redirect_stdout(io.StringIO()) as stdout:
+                    _result_cache_wrap(hello, cache=cache)()  # replayed
+        self.assertEqual(stdout.getvalue(), "hello\n")
+
+    def test_wrapped__binary_output(self):
+        import contextlib
+        import io
+        import sys
+        from handofcats.customize import _result_cache_wrap
+
+        calls = []
+
+        def hello() -> None:
+            calls.append(None)
+            sys.stdout.buffer.write(b"hello\n")
+
+        with tempfile.TemporaryDirectory() as d:
+            cache = self._makeOne(max_size=1000, directory=d)
+            for _ in range(2):
+                stdout = io.TextIOWrapper(io.BytesIO())
+                with contextlib.redirect_stdout(stdout):
+                    _result_cache_wrap(hello, cache=cache)()
+                self.assertEqual(stdout.buffer.getvalue(), b"hello\n")
+        self.assertEqual(len(calls), 2)  # not cached
+
+    def test_options__conflicted(self):
+        import os
+        from unittest import mock
+        from handofcats.config import Config
+        from handofcats.driver import Driver
+
+        calls = []
+
+        def run(*, no_cache: bool = False) -> None:
+            calls.append(no_cache)
+
+        with tempfile.TemporaryDirectory() as d:
+            with mock.patch.dict(os.environ, {"HANDOFCATS_CACHE_DIR": d}):
+                driver = Driver(run, config=Config(cache_size=1000))
+                driver.run(["--no-cache"])
+        self.assertEqual(calls, [True])  # the command's parameter
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,126 @@
+import unittest
+import contextlib
+import importlib.util
+import io
+import os
+import tempfile
+import textwrap
+
+
+class ExposeCheckTests(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+
+    def _load(self, code):
+        path = os.path.join(self.tmpdir.name, "cli.py")
+        with open(path, "w") as wf:
+            wf.write(textwrap.dedent(code))
+        spec = importlib.util.spec_from_file_location("_handofcats_check_cli", path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return path, module
+
+    def _run(self, fn, argv):
+        from handofcats.driver import Driver
+
+        buf = io.StringIO()
+        with contextlib.redirect_stdout(buf), contextlib.redirect_stderr(io.StringIO()):
+            Driver(fn).run(argv)
+        return buf.getvalue()
+
+    def test_it(self):
+        code = """
+        def hello(*, name: str = "world", check: bool = False) -> None:
+            print(f"hello {name}", check)
+        """
+        path, module = self._load(code)
+        exposed = os.path.join(self.tmpdir.name, "cli-exposed.py")
+        with open(exposed, "w") as wf:
+            wf.write(self._run(module.hello, ["--expose"]))
+
+        with self.subTest("up to date"):
+            self.assertEqual(
+                self._run(module.hello, ["--expose", "--check", exposed]), ""
+            )
+
+        with self.subTest("the command's own --check option"):
+            self.assertEqual(self._run(module.hello, ["--check"]), "hello world True\n")
+
+        with self.subTest("outdated, by the source"):
+            path, module = self._load(textwrap.dedent(code) + "\n# changed\n")
+            with self.assertRaises(SystemExit) as cm:
+                self._run(module.hello, ["--expose", "--check", exposed])
+            self.assertEqual(cm.exception.code, 1)
+
+        with self.subTest("outdated, by the config"):
+            with self.assertRaises(SystemExit) as cm:
+                self._run(module.hello, ["--expose", "--simple", f"--check={exposed}"])
+            self.assertEqual(cm.exception.code, 1)
+
+        with self.subTest("signature is not found"):
+            with open(exposed, "w") as wf:
+                wf.write("def main():\n    pass\n")
+            with self.assertRaises(SystemExit) as cm:
+                self._run(module.hello, ["--expose", "--check", exposed])
+            self.assertEqual(cm.exception.code, 1)
+
+    def test_runtime_config__not_included(self):
+        from handofcats.actions.check import signature_digest
+        from handofcats.config import Config
+
+        def hello() -> None:
+            pass
+
+        k0 = signature_digest([hello], config=Config())
+        self.assertEqual(
+            k0,
+            signature_digest(
+                [hello], config=Config(fast_exit=False, help_cache=True, cont=repr)
+            ),
+        )
+        self.assertNotEqual(k0, signature_digest([hello], config=Config(ignore_flags=True)))
+
+    def test_generator__included(self):
+        from unittest import mock
+        from handofcats.actions import check
+        from handofcats.config import Config
+
+        def hello() -> None:
+            pass
+
+        k0 = check.signature_digest([hello], config=Config())
+        with mock.patch.object(check, "_generator_digest", return_value="changed"):
+            self.assertNotEqual(k0, check.signature_digest([hello], config=Config()))
+
+    def test_ejected_by_watch(self):
+        import sys
+        import handofcats
+        from handofcats.actions.watch import Watcher
+
+        def _cleanup():
+            handofcats._default_multi_driver = None
+            for name, module in list(sys.modules.items()):
+                filepath = getattr(module, "__file__", None) or ""
+                if filepath.startswith(self.tmpdir.name):
+                    del sys.modules[name]
+
+        self.addCleanup(_cleanup)
+        code = """
+        from handofcats import as_command
+
+
+        @as_command
+        def hello(*, name: str = "world") -> None:
+            print(f"hello {name}")
+        """
+        _, module = self._load(code)
+        results = Watcher([self.tmpdir.name], out=io.StringIO()).poll()
+        self.assertEqual([elapsed is not None for _, elapsed in results], [True])
+
+        exposed = os.path.join(self.tmpdir.name, "cli-exposed.py")
+        self.assertEqual(self._run(module.hello, ["--expose", "--check", exposed]), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
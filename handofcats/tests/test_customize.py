@@ -0,0 +1,97 @@
+import unittest
+import json
+import os.path
+import tempfile
+
+
+class ResourceUsageTests(unittest.TestCase):
+    def _callFUT(self, params, **kwargs):
+        from handofcats.customize import resource_usage_activate
+
+        return resource_usage_activate(params, **kwargs)
+
+    def test_not_activated(self):
+        params = {"resource_usage": False}
+        got = self._callFUT(params)
+        self.assertIsNone(got)
+        self.assertEqual(params, {})
+
+    def test_it(self):
+        def f(*, n: int):
+            return [i for i in range(n)]
+
+        with tempfile.TemporaryDirectory() as d:
+            output = os.path.join(d, "usage.jsonl")
+            wrap = self._callFUT(
+                {"resource_usage": True}, tracemalloc_top=3, output=output
+            )
+            self.assertEqual(wrap(f)(n=10), list(range(10)))
+
+            with open(output) as rf:
+                record = json.loads(rf.read())
+
+        self.assertEqual(record["fn"], "f")
+        self.assertIn("wall_time", record)
+        self.assertLessEqual(len(record["tracemalloc"]["top"]), 3)
+
+    def test_conflicted(self):
+        from handofcats.config import Config
+        from handofcats.driver import Driver
+
+        def f(*, resource_usage: str = "cpu") -> str:
+            return resource_usage
+
+        # the command's own parameter is used, --resource-usage is not added
+        driver = Driver(f, config=Config(cont=lambda x: x))
+        self.assertEqual(driver.run(["--resource-usage", "memory"]), "memory")
+
+
+class QueueLoggingTests(unittest.TestCase):
+    def test_conflicted(self):
+        from handofcats.config import Config
+        from handofcats.driver import Driver
+
+        def f(*, logging_queue: str = "default") -> str:
+            return logging_queue
+
+        # the command's own parameter is used, --logging-queue is not added
+        driver = Driver(f, config=Config(cont=lambda x: x))
+        self.assertEqual(driver.run(["--logging-queue", "high"]), "high")
+
+    def test_flushed_when_stopped(self):
+        import io
+        import logging
+        import queue
+        from handofcats._queue_logging import (
+            _QueueHandler,
+            _QueueListener,
+            _BufferedStreamHandler,
+        )
+
+        stream = io.StringIO()
+        handler = _BufferedStreamHandler(stream)
+        handler.setFormatter(logging.Formatter("%(levelname)s:%(message)s"))
+        q = queue.SimpleQueue()
+        listener = _QueueListener(q, handler)
+
+        logger = logging.getLogger("handofcats.tests.queue")
+        logger.propagate = False
+        logger.setLevel(logging.INFO)
+        qh = _QueueHandler(q)
+        logger.addHandler(qh)
+        try:
+            listener.start()
+            for i in range(3):
+                logger.info("hello %d", i)
+            listener.stop()
+        finally:
+            logger.removeHandler(qh)
+
+        self.assertEqual(
+            stream.getvalue().splitlines(),
+            ["INFO:hello 0", "INFO:hello 1", "INFO:hello 2"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+import unittest
+
+
+def hello() -> None:
+    pass
+
+
+def byebye() -> None:
+    pass
+
+
+class MultiDriverTests(unittest.TestCase):
+    def _makeOne(self, functions=None):
+        from handofcats.driver import MultiDriver
+
+        return MultiDriver(functions)
+
+    def test_register(self):
+        target = self._makeOne([hello])
+        target.register(byebye, aliases=["bye"])
+        target.register(hello)  # registering twice is ignored
+
+        self.assertEqual(target.functions, (hello, byebye))
+        self.assertIs(target.registry.get("bye"), byebye)
+        self.assertIn("byebye", target.registry)
+        self.assertIn(byebye, target.registry)
+
+    def test_register__duplicated(self):
+        def another() -> None:
+            pass
+
+        target = self._makeOne([hello])
+        another.__name__ = "hello"
+        with self.assertRaises(ValueError):
+            target.register(another)
+        with self.assertRaises(ValueError):
+            target.register(byebye, aliases=["hello"])
+
+        target.register(another, name="hello2")
+        self.assertEqual(target.registry.name_of(another), "hello2")
+
+    def test_unregister(self):
+        target = self._makeOne([hello])
+        target.register(byebye, aliases=["bye"])
+        target.unregister("bye")  # by alias
+
+        self.assertEqual(target.functions, (hello,))
+        self.assertNotIn("bye", target.registry)
+        target.register(byebye, name="bye")  # the alias is released
+
+        with self.assertRaises(KeyError):
+            target.unregister("missing")
+
+    def test_functions__read_only(self):
+        target = self._makeOne([hello])
+        with self.assertRaises(AttributeError):
+            target.functions.append(byebye)  # use register()
+
+    def test_register__twice_with_other_name(self):
+        target = self._makeOne([hello])
+        target.register(hello, name="hi")
+
+        parser, _ = target.setup_parser()
+        choices = parser._subparsers._group_actions[0].choices
+        self.assertEqual(list(choices), ["hello", "hi"])
+        self.assertIs(target.registry.get("hi"), hello)
+
+        target.unregister("hi")
+        self.assertEqual(target.registry.names(), ["hello"])
+        target.unregister(hello)
+        self.assertEqual(target.functions, ())
+
+    def test_setup_parser(self):
+        target = self._makeOne([hello])
+        target.register(byebye, name="bye-bye", aliases=["bye"])
+
+        parser, _ = target.setup_parser()
+        for argv in (["hello"], ["bye-bye"], ["bye"]):
+            with self.subTest(argv=argv):
+                args = parser.parse_args(argv)
+                self.assertIn(args.subcommand, (hello, byebye))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import unittest
+import os
+import subprocess
+import sys
+import textwrap
+from unittest import mock
+
+
+class FastExitTests(unittest.TestCase):
+    def _run(self, code, *, env=None):
+        here = os.path.dirname(os.path.abspath(__file__))
+        root = os.path.dirname(os.path.dirname(here))
+        return subprocess.run(
+            [sys.executable, "-c", textwrap.dedent(code)],
+            env={**os.environ, "PYTHONPATH": root, **(env or {})},
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+
+    def test_it(self):
+        code = """
+        import atexit
+        import logging
+        from handofcats.config import Config
+        from handofcats.driver import Driver
+
+        logger = logging.getLogger("x")
+
+
+        def hello(*, status: int = 0) -> str:
+            atexit.register(print, "atexit")
+            logger.warning("logging")
+            if status:
+                raise SystemExit(status)
+            return "hello"
+
+
+        Driver(hello, config=Config(fast_exit=True)).run({argv!r})
+        print("unreachable")
+        """
+        with self.subTest("ok"):
+            p = self._run(code.format(argv=[]))
+            self.assertEqual((p.returncode, p.stdout), (0, "hello\natexit\n"))
+            self.assertIn("logging", p.stderr)
+        with self.subTest("exit status"):
+            p = self._run(code.format(argv=["--status", "3"]))
+            self.assertEqual((p.returncode, p.stdout), (3, "atexit\n"))
+
+    def test_error__gc_is_enabled_again(self):
+        import gc
+        from handofcats.config import Config
+        from handofcats.driver import Driver
+
+        def broken() -> None:
+            raise RuntimeError("broken")
+
+        driver = Driver(broken, config=Config(fast_exit=True))
+        with self.assertRaises(RuntimeError):
+            driver.run([])
+        self.assertTrue(gc.isenabled())
+        self.assertEqual(gc.get_freeze_count(), 0)
+
+    def test_is_enabled(self):
+        from handofcats.config import Config
+        from handofcats.fast_exit import is_enabled
+
+        with mock.patch.dict(os.environ, {"HANDOFCATS_FAST_EXIT": "1"}):
+            self.assertTrue(is_enabled(Config()))
+            self.assertFalse(is_enabled(Config(fast_exit=False)))
+        with mock.patch.dict(os.environ, {"HANDOFCATS_FAST_EXIT": "0"}):
+            self.assertFalse(is_enabled(Config()))
+            self.assertTrue(is_enabled(Config(fast_exit=True)))
+
+
+if __name__ == "__main__":
+    unittest.main()
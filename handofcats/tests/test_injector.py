@@ -228,6 +228,199 @@ class Tests(unittest.TestCase):
 
                 self.assertEqual(got_str, expected_str, "- is got, + is expected")
 
+    def test_iterator(self):
+        import os.path
+        import tempfile
+        from handofcats.injector import LineIterator
+
+        def f(ids: t.Iterator[int], *, names: t.Optional[t.Iterable[str]] = None):
+            pass
+
+        got = self._callFUT(f)
+        with self.subTest("positional, reading stdin by default"):
+            kwargs = got[0]["kwargs"]
+            self.assertIsInstance(kwargs["type"], LineIterator)
+            self.assertEqual((kwargs["nargs"], kwargs["default"]), ("?", "-"))
+        with self.subTest("flag"):
+            kwargs = got[1]["kwargs"]
+            self.assertIsInstance(kwargs["type"], LineIterator)
+            self.assertNotIn("nargs", kwargs)
+
+        with tempfile.TemporaryDirectory() as d:
+            filename = os.path.join(d, "ids.txt")
+            with open(filename, "w") as wf:
+                wf.write("1\n2\n\n3\n")
+            with self.subTest("lazy, and converted"):
+                it = got[0]["kwargs"]["type"](f"@{filename}")
+                self.assertEqual(list(it), [1, 2, 3])
+
+    def test_array(self):
+        import array
+        import os.path
+        import tempfile
+        from handofcats.injector import ArrayType
+
+        def f(xs: array.array, *, ys: array.array = array.array("i")):
+            pass
+
+        got = self._callFUT(f)
+        with self.subTest("typecode is 'd', by default"):
+            convert = got[0]["kwargs"]["type"]
+            self.assertIsInstance(convert, ArrayType)
+            self.assertEqual(convert("1,2 3"), array.array("d", [1.0, 2.0, 3.0]))
+
+        with self.subTest("typecode is from default value"):
+            convert = got[1]["kwargs"]["type"]
+            self.assertEqual(convert("1,2"), array.array("i", [1, 2]))
+
+            with tempfile.TemporaryDirectory() as d:
+                filename = os.path.join(d, "ys.bin")
+                with open(filename, "wb") as wf:
+                    array.array("i", [10, 20]).tofile(wf)
+                self.assertEqual(convert(f"@{filename}"), array.array("i", [10, 20]))
+
+        with self.subTest("invalid value"):
+            with self.assertRaises(ValueError):
+                convert("1,x")
+
+    def test_ndarray__bare(self):
+        try:
+            import numpy
+            from numpy.typing import NDArray
+        except ImportError:
+            self.skipTest("numpy is not installed")
+
+        def f(xs: NDArray, *, ys: NDArray[numpy.int32] = None):
+            pass
+
+        got = self._callFUT(f)
+        with self.subTest("without dtype, float64"):
+            xs = got[0]["kwargs"]["type"]("1,2")
+            self.assertEqual(xs.dtype, numpy.float64)
+            self.assertEqual(xs.tolist(), [1.0, 2.0])
+        with self.subTest("dtype from NDArray[...]"):
+            ys = got[1]["kwargs"]["type"]("1,2")
+            self.assertEqual(ys.dtype, numpy.int32)
+
+    def test_converters(self):
+        import datetime
+        import decimal
+        import enum
+        import pathlib
+
+        class Color(enum.Enum):
+            red = "r"
+            green = "g"
+
+        def f(
+            path: pathlib.Path,
+            *,
+            color: Color = Color.red,
+            at: t.Optional[datetime.date] = None,
+            price: decimal.Decimal = decimal.Decimal("1.5"),
+        ):
+            pass
+
+        got = [h["kwargs"] for h in self._callFUT(f)]
+        with self.subTest("path"):
+            self.assertEqual(got[0]["type"]("x.txt"), pathlib.Path("x.txt"))
+            self.assertEqual(str(got[0]["type"]), "__import__('pathlib').Path")
+        with self.subTest("enum, by name or by value"):
+            self.assertEqual(got[1]["type"]("green"), Color.green)
+            self.assertEqual(got[1]["type"]("g"), Color.green)
+            self.assertEqual(got[1]["default"], "red")  # converted by argparse
+            self.assertEqual(got[1]["metavar"], "{red,green}")
+        with self.subTest("optional date"):
+            self.assertEqual(got[2]["type"]("2020-01-02"), datetime.date(2020, 1, 2))
+            self.assertFalse(got[2]["required"])
+        with self.subTest("decimal, invalid value is ValueError"):
+            self.assertEqual(got[3]["default"], "1.5")
+            with self.assertRaises(ValueError):
+                got[3]["type"]("x")
+
+    def test_int_enum(self):
+        import enum
+
+        class C(enum.IntEnum):
+            zero = 0
+            a = 1
+            b = 2
+
+        class Perm(enum.IntFlag):
+            r = 4
+            w = 2
+
+        def f(*, color: C = C.a, perm: Perm = Perm.r):
+            return color, perm
+
+        got = [h["kwargs"] for h in self._callFUT(f)]
+        with self.subTest("IntEnum, by name or by value"):
+            self.assertEqual(got[0]["type"]("b"), C.b)
+            self.assertEqual(got[0]["type"]("2"), C.b)
+            self.assertEqual(got[0]["type"]("zero"), C.zero)
+            self.assertEqual(got[0]["metavar"], "{zero,a,b}")
+        with self.subTest("IntEnum, emitted by --expose"):
+            convert = eval(str(got[0]["type"]), {"C": C})
+            self.assertEqual(convert("zero"), C.zero)  # falsy member
+            self.assertEqual(convert("0"), C.zero)
+            self.assertEqual(convert("b"), C.b)
+            with self.assertRaises(ValueError):
+                convert("x")
+        with self.subTest("IntFlag"):
+            self.assertEqual(got[1]["type"]("w"), Perm.w)
+            self.assertEqual(got[1]["type"]("4"), Perm.r)
+
+        from handofcats.config import Config
+        from handofcats.driver import Driver
+
+        driver = Driver(f, config=Config(cont=lambda x: x))
+        self.assertEqual(driver.run(["--color", "2", "--perm", "w"]), (C.b, Perm.w))
+
+    def test_registry(self):
+        from handofcats.injector import TypeRegistry, _setup_default_registry
+
+        class Point:
+            def __init__(self, x: int, y: int) -> None:
+                self.x = x
+                self.y = y
+
+        def parse_point(s: str) -> Point:
+            return Point(*map(int, s.split(",")))
+
+        registry = _setup_default_registry(TypeRegistry())
+        with self.subTest("unknown type, memoized"):
+            self.assertIsNone(registry.resolve(Point))
+            self.assertIn(Point, registry._resolved)
+
+        registry.register(Point, converter=parse_point)
+        with self.subTest("registered, and cache is cleared"):
+            handler = registry.resolve(Point)
+            self.assertIsNotNone(handler)
+            self.assertIs(handler, registry.resolve(Point))
+        with self.subTest("generic"):
+            self.assertIsNotNone(registry.resolve(t.List[Point]))
+
+    def test_literal__many_choices(self):
+        import typing_extensions as tx
+        from handofcats.injector import Choices
+
+        Region = tx.Literal[tuple(f"r{i}" for i in range(100))]
+
+        def f(*, region: Region, mode: tx.Literal["r", "w"] = "r"):
+            pass
+
+        got = [h["kwargs"] for h in self._callFUT(f)]
+        with self.subTest("many choices, truncated in usage"):
+            choices = got[0]["choices"]
+            self.assertIsInstance(choices, Choices)
+            self.assertIn("r99", choices)
+            self.assertNotIn("r100", choices)
+            self.assertEqual(list(choices)[:2], ["r0", "r1"])
+            self.assertEqual(got[0]["metavar"], "{r0,r1,r2,r3,r4,r5,r6,r7,...(92 more)}")
+        with self.subTest("a few choices"):
+            self.assertNotIn("metavar", got[1])
+            self.assertEqual(str(got[1]["choices"]), "dict.fromkeys(['r', 'w'])")
+
 
 def debug_print(prefix, x):
     import sys
@@ -0,0 +1,125 @@
+import unittest
+import typing as t
+
+
+class Tests(unittest.TestCase):
+    def _callFUT(self, target, argv, **kwargs):
+        from handofcats.invocation import invoke
+
+        return invoke(target, argv, **kwargs)
+
+    def test_it(self):
+        def add(x: int, y: int, *, verbose: bool = False) -> int:
+            return x + y
+
+        self.assertEqual(self._callFUT(add, ["10", "20"]), 30)
+
+    def test_error(self):
+        from handofcats.invocation import Failure
+
+        def add(x: int, y: int) -> int:
+            return x + y
+
+        got = self._callFUT(add, ["10", "foo"])
+        self.assertIsInstance(got, Failure)
+        self.assertEqual(got.status, 2)
+        self.assertIn("invalid int value", got.message)
+
+    def test_help(self):
+        from handofcats.invocation import Failure
+
+        def hello(*, name: str = "world") -> None:
+            """greeting"""
+
+        got = self._callFUT(hello, ["-h"])
+        self.assertIsInstance(got, Failure)
+        self.assertEqual(got.status, 0)
+        self.assertIn("greeting", got.usage)
+
+    def test_exit_in_function(self):
+        import sys
+        from handofcats.invocation import Failure
+
+        def fail() -> None:
+            sys.exit(3)
+
+        self.assertEqual(self._callFUT(fail, []), Failure(status=3))
+
+    def test_multi_driver(self):
+        from handofcats.driver import MultiDriver
+        from handofcats.invocation import Failure
+
+        def hello(*, name: str = "world") -> str:
+            return f"hello {name}"
+
+        def byebye(name: str) -> str:
+            return f"byebye {name}"
+
+        driver = MultiDriver([hello, byebye])
+        with self.subTest("hello"):
+            self.assertEqual(self._callFUT(driver, ["hello"]), "hello world")
+        with self.subTest("byebye"):
+            self.assertEqual(self._callFUT(driver, ["byebye", "foo"]), "byebye foo")
+        with self.subTest("error in sub-command"):
+            got = self._callFUT(driver, ["byebye"])
+            self.assertIsInstance(got, Failure)
+            self.assertEqual(got.status, 2)
+
+    def test_parser_is_reused(self):
+        from handofcats.invocation import prepare
+        from handofcats.config import Config
+
+        def f(*, name: str) -> None:
+            pass
+
+        self.assertIs(prepare(f), prepare(f))
+        self.assertIsNot(prepare(f), prepare(f, config=Config(ignore_flags=True)))
+
+    def test_cache_is_bounded(self):
+        from unittest import mock
+        from handofcats import invocation
+
+        def make(i):
+            def f(*, name: str) -> str:
+                return f"{i} {name}"
+
+            return f
+
+        with mock.patch.object(invocation, "MAX_CACHE_SIZE", 3):
+            with mock.patch.object(invocation, "_cache", invocation.OrderedDict()):
+                functions = [make(i) for i in range(5)]
+                for fn in functions:
+                    self.assertEqual(
+                        self._callFUT(fn, ["--name", "x"]), f"{functions.index(fn)} x"
+                    )
+                self.assertEqual(len(invocation._cache), 3)
+
+    def test_multi_driver__names_in_key(self):
+        from handofcats.driver import MultiDriver
+
+        def hello(*, name: str = "world") -> str:
+            return f"hello {name}"
+
+        self.assertEqual(self._callFUT(MultiDriver([hello]), ["hello"]), "hello world")
+
+        driver = MultiDriver()
+        driver.register(hello, name="greet")
+        self.assertEqual(self._callFUT(driver, ["greet"]), "hello world")
+
+    def test_concurrent(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        def psum(xs: t.List[int]) -> int:
+            return sum(xs)
+
+        with ThreadPoolExecutor(max_workers=8) as ex:
+            futs = [
+                ex.submit(self._callFUT, psum, [str(x) for x in range(i)])
+                for i in range(100)
+            ]
+            got = [f.result() for f in futs]
+        self.assertEqual(got, [sum(range(i)) for i in range(100)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -33,4 +33,39 @@ class Tests(unittest.TestCase):
 
             self._callFUT(f, argv=["--name", "foo"])
 
+    def test_profile(self):
+        import os.path
+        import tempfile
+
+        def f(*, name: str):
+            return None
+
+        with tempfile.TemporaryDirectory() as d:
+            output = os.path.join(d, "out.pstats")
+            self._callFUT(f, argv=["--name", "foo", "--profile-output", output])
+            self.assertTrue(os.path.exists(output))
+
+    def test_profile__conflicted(self):
+        # the command's own parameter is used, --profile is not added
+        with mustcall(self) as mark:
+
+            def f(*, profile: str = "dev"):
+                self.assertEqual(profile, "prod")
+                mark()
+
+            self._callFUT(f, argv=["--profile", "prod"])
+
+    def test_profile__not_swallowing_positional(self):
+        with mustcall(self) as mark:
+
+            def f(filename: str):
+                self.assertEqual(filename, "input.txt")
+                mark()
+
+            import contextlib
+            import io
+
+            with contextlib.redirect_stderr(io.StringIO()):
+                self._callFUT(f, argv=["--profile", "input.txt"])
+
     # todo: boolean, float, int
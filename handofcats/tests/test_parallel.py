@@ -0,0 +1,129 @@
+import typing as t
+import contextlib
+import io
+import os
+import unittest
+
+
+def hello(*, name: str = "world") -> None:
+    print(f"hello {name}")
+
+
+def add(x: int, y: int) -> int:
+    return x + y
+
+
+def fail() -> None:
+    raise RuntimeError("boom")
+
+
+def bye(*, status: int = 3) -> None:
+    print("bye")
+    raise SystemExit(status)
+
+
+class ParallelTests(unittest.TestCase):
+    def _makeDriver(self):
+        from handofcats.config import Config
+        from handofcats.driver import MultiDriver
+
+        return MultiDriver(
+            [hello, add, fail, bye], config=Config(ignore_logging=True)
+        )
+
+    def _run(self, argv: t.List[str]) -> t.Tuple[t.Optional[int], str, str]:
+        stdout, stderr = io.StringIO(), io.StringIO()
+        status = None
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            try:
+                self._makeDriver().run(argv)
+            except SystemExit as e:
+                status = e.code
+        return status, stdout.getvalue(), stderr.getvalue()
+
+    def test_is_requested(self):
+        from handofcats.actions.parallel import is_requested
+
+        candidates = [
+            (["--parallel", "2", "hello"], True),
+            (["--parallel=2", "hello"], True),
+            (["--parallel-processes", "2", "hello"], True),
+            (["--parallelism", "2"], False),
+            (["hello", "--parallel", "2"], False),
+        ]
+        for argv, expected in candidates:
+            with self.subTest(argv=argv):
+                self.assertEqual(is_requested(argv), expected)
+
+    def test_run__grouped_in_order(self):
+        argv = ["--parallel", "3", "hello", "--name", "foo", "--", "add", "1", "2"]
+        argv.extend(["--", "hello"])
+        status, stdout, stderr = self._run(argv)
+
+        self.assertIsNone(status)
+        self.assertEqual(stdout, "hello foo\n3\nhello world\n")
+        self.assertEqual(
+            [line.split(" (")[0] for line in stderr.splitlines()],
+            ["== hello", "== add", "== hello"],
+        )
+
+    def test_run__aggregate_status(self):
+        argv = ["--parallel=2", "fail", "--", "hello", "--", "bye"]
+        status, stdout, stderr = self._run(argv)
+
+        self.assertEqual(status, 3)
+        self.assertEqual(stdout, "hello world\nbye\n")
+        self.assertIn("== fail (status=1,", stderr)
+        self.assertIn("RuntimeError: boom", stderr)
+        self.assertIn("== bye (status=3,", stderr)
+
+    def test_run__parse_error(self):
+        candidates = [
+            ["--parallel", "2", "hello", "--", "missing"],
+            ["--parallel", "2", "add", "x", "y"],
+            ["--parallel", "0", "hello"],
+        ]
+        for argv in candidates:
+            with self.subTest(argv=argv):
+                status, stdout, _ = self._run(argv)
+                self.assertEqual(status, 2)
+                self.assertEqual(stdout, "")  # nothing is run
+
+    @unittest.skipUnless(hasattr(os, "fork"), "fork is not supported")
+    def test_run__processes(self):
+        argv = ["--parallel-processes", "2", "add", "1", "2", "--", "add", "3", "4"]
+        status, stdout, _ = self._run(argv)
+
+        self.assertIsNone(status)
+        self.assertEqual(stdout, "3\n7\n")
+
+    def test_run__processes__unpicklable(self):
+        from handofcats.config import Config
+        from handofcats.driver import MultiDriver
+
+        driver = MultiDriver([hello], config=Config(cont=lambda x: x))  # lambda
+        stderr = io.StringIO()
+        with contextlib.redirect_stderr(stderr):
+            with self.assertRaises(SystemExit) as cm:
+                driver.run(["--parallel-processes", "2", "hello"])
+        self.assertEqual(cm.exception.code, 2)
+        self.assertIn("hello: cannot be sent to the worker process", stderr.getvalue())
+
+    def test_fileno__delegated(self):
+        import sys
+        from handofcats import _streams
+
+        with _streams.installed("stdout") as proxy:
+            with contextlib.redirect_stdout(proxy):
+                self.assertEqual(sys.stdout.fileno(), proxy.original.fileno())
+
+    def test_buffer__delegated(self):
+        import sys
+        from handofcats import _streams
+
+        out = io.TextIOWrapper(io.BytesIO())
+        with _streams.redirected("stdout", out) as proxy:
+            with contextlib.redirect_stdout(proxy):
+                sys.stdout.buffer.write(b"hello\n")
+                self.assertEqual(sys.stdout.isatty(), out.isatty())
+        self.assertEqual(out.buffer.getvalue(), b"hello\n")
@@ -0,0 +1,100 @@
+import typing as t
+import unittest
+import typing_extensions as tx
+
+
+def run(
+    src: str,
+    *,
+    n: int = 1,
+    ratio: float = 0.5,
+    matrix: t.Optional[t.List[t.List[int]]] = None,
+    mode: tx.Literal["a", "b"] = "a",
+    verbose: bool = False,
+):
+    return (src, n, ratio, matrix, mode, verbose)
+
+
+class CoerceParamsTests(unittest.TestCase):
+    def _callFUT(self, fn, data):
+        from handofcats.actions.params_json import coerce_params
+
+        return coerce_params(fn, data)
+
+    def test_it(self):
+        got = self._callFUT(
+            run, {"src": "x", "ratio": 1, "matrix": [[1, 2], [3]], "verbose": True}
+        )
+        self.assertEqual(
+            got, {"src": "x", "ratio": 1.0, "matrix": [[1, 2], [3]], "verbose": True}
+        )
+
+    def test_missing_positionals(self):
+        import io
+        from unittest import mock
+
+        def f(xs: t.List[int], lines: t.Iterator[int], *, ys: t.List[int]):
+            pass
+
+        with mock.patch("sys.stdin", io.StringIO("1\n2\n")):
+            got = self._callFUT(f, {"ys": [3]})
+            self.assertEqual(got["xs"], [])  # same as the command line (nargs="*")
+            self.assertEqual(list(got["lines"]), [1, 2])  # stdin
+            self.assertEqual(got["ys"], [3])
+
+        from handofcats.actions.params_json import ParamsError
+
+        with self.assertRaises(ParamsError):
+            self._callFUT(f, {})  # option is required
+
+    def test_invalid(self):
+        from handofcats.actions.params_json import ParamsError
+
+        candidates = [
+            ("required", {}),
+            ("unexpected", {"src": "x", "m": 1}),
+            ("int", {"src": "x", "n": "1"}),
+            ("bool is not int", {"src": "x", "n": True}),
+            ("nested", {"src": "x", "matrix": [[1, "2"]]}),
+            ("choices", {"src": "x", "mode": "c"}),
+        ]
+        for msg, data in candidates:
+            with self.subTest(msg):
+                with self.assertRaises(ParamsError):
+                    self._callFUT(run, data)
+
+
+class RunTests(unittest.TestCase):
+    def test_envvar(self):
+        import os
+        from unittest import mock
+        from handofcats.driver import Driver
+
+        config = Driver(run).config
+        driver = Driver(run, config=config.__class__(cont=lambda x: x))
+        with mock.patch.dict(os.environ, {"HANDOFCATS_PARAMS": '{"src": "x", "n": 2}'}):
+            got = driver.run([])
+        self.assertEqual(got, ("x", 2, 0.5, None, "a", False))
+
+    def test_is_requested(self):
+        import os
+        from unittest import mock
+        from handofcats.driver import _params_json_is_requested
+
+        candidates = [
+            (["--params-json", "p.json"], True),
+            (["hello", "--params-json=p.json"], True),
+            (["--", "--params-json"], False),  # data
+            (["x"], False),
+        ]
+        for argv, expected in candidates:
+            with self.subTest(argv=argv):
+                self.assertEqual(_params_json_is_requested(argv), expected)
+
+        with mock.patch.dict(os.environ, {"HANDOFCATS_PARAMS": '{"src": "x"}'}):
+            self.assertTrue(_params_json_is_requested([]))
+            self.assertFalse(_params_json_is_requested(["--expose"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
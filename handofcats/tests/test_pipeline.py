@@ -0,0 +1,92 @@
+import typing as t
+import unittest
+
+
+def extract(n: int) -> t.Iterator[int]:
+    yield from range(n)
+
+
+def transform(xs: t.Iterator[int], *, factor: int = 2) -> t.Iterator[int]:
+    for x in xs:
+        yield x * factor
+
+
+def load(xs: t.Iterator[int]) -> int:
+    return sum(xs)
+
+
+class PipelineTests(unittest.TestCase):
+    def _makeDriver(self):
+        from handofcats.config import Config
+        from handofcats.driver import MultiDriver
+
+        return MultiDriver(
+            [extract, transform, load], config=Config(cont=lambda x: x)
+        )
+
+    def test_is_requested(self):
+        from handofcats.actions.pipeline import is_requested
+
+        candidates = [
+            (["--pipeline", "extract", "1", "--", "load"], True),
+            (["--pipeline-queue=2", "extract", "1", "--", "load"], True),
+            (["extract", "1", "--", "load"], False),  # explicitly
+            (["extract", "--", "1"], False),
+        ]
+        for argv, expected in candidates:
+            with self.subTest(argv=argv):
+                self.assertEqual(is_requested(argv), expected)
+
+    def test_split_stages(self):
+        from handofcats.actions.pipeline import split_stages
+
+        registry = self._makeDriver().registry
+        argv = ["extract", "--", "-1", "--", "load"]  # `--` for positional argument
+        self.assertEqual(
+            split_stages(argv, is_command=registry.__contains__),
+            [["extract", "--", "-1"], ["load"]],
+        )
+
+    def test_run(self):
+        driver = self._makeDriver()
+        argv = ["extract", "10", "--", "transform", "--factor", "3", "--", "load"]
+        with self.subTest("lazy"):
+            self.assertEqual(driver.run(["--pipeline", *argv]), 135)
+        with self.subTest("threaded"):
+            self.assertEqual(driver.run(["--pipeline-queue", "2", *argv]), 135)
+        with self.subTest("not requested"):
+            import contextlib
+            import io
+
+            with contextlib.redirect_stderr(io.StringIO()):
+                with self.assertRaises(SystemExit):
+                    driver.run(argv)
+
+    def test_run__invalid_queue_size(self):
+        import contextlib
+        import io
+
+        driver = self._makeDriver()
+        for value in ("0", "-1", "x"):
+            with self.subTest(value=value):
+                stderr = io.StringIO()
+                with contextlib.redirect_stderr(stderr):
+                    with self.assertRaises(SystemExit) as cm:
+                        driver.run([f"--pipeline-queue={value}", "extract", "1"])
+                self.assertEqual(cm.exception.code, 2)
+                self.assertIn("invalid queue size", stderr.getvalue())
+
+    def test_threaded__error(self):
+        from handofcats.actions.pipeline import chain
+
+        def broken(n: int) -> t.Iterator[int]:
+            yield 1
+            raise RuntimeError("broken")
+
+        stages = [(broken, {"n": 1}, None), (load, {}, "xs")]
+        with self.assertRaises(RuntimeError):
+            chain(stages, maxsize=1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+import unittest
+import sys
+
+
+def hello(*, name: str = "world", status: int = 0) -> str:
+    print("calling", file=sys.stderr)
+    if status:
+        sys.exit(status)
+    return f"hello {name}"
+
+
+def broken() -> None:
+    raise RuntimeError("broken")
+
+
+class RunnerTests(unittest.TestCase):
+    def _makeOne(self):
+        from handofcats.pytest_plugin import Runner
+
+        return Runner()
+
+    def test_it(self):
+        runner = self._makeOne()
+
+        with self.subTest("ok"):
+            result = runner.invoke(hello, ["--name", "foo"])
+            self.assertEqual(
+                (result.exit_code, result.stdout, result.stderr, result.return_value),
+                (0, "hello foo\n", "calling\n", "hello foo"),
+            )
+        with self.subTest("without cont"):
+            result = runner.invoke(hello, [], cont=False)
+            self.assertEqual((result.stdout, result.return_value), ("", "hello world"))
+        with self.subTest("exit"):
+            result = runner.invoke(hello, ["--status", "3"])
+            self.assertEqual((result.exit_code, result.stdout), (3, ""))
+        with self.subTest("usage error"):
+            result = runner.invoke(hello, ["--status", "x"])
+            self.assertEqual(result.exit_code, 2)
+            self.assertIn("invalid int value", result.stderr)
+        with self.subTest("help"):
+            result = runner.invoke(hello, ["-h"])
+            self.assertEqual(result.exit_code, 0)
+            self.assertIn("--name", result.stdout)
+        with self.subTest("exception"):
+            result = runner.invoke(broken)
+            self.assertEqual(result.exit_code, 1)
+            self.assertIsInstance(result.exception, RuntimeError)
+
+    def test_multi_driver(self):
+        from handofcats.driver import MultiDriver
+
+        runner = self._makeOne()
+        result = runner.invoke(MultiDriver([hello, broken]), ["hello"])
+        self.assertEqual((result.exit_code, result.stdout), (0, "hello world\n"))
+
+
+class FixtureTests(unittest.TestCase):
+    def test_it(self):
+        import os
+        import subprocess
+        import tempfile
+        import textwrap
+
+        try:
+            import pytest  # noqa: F401
+        except ImportError:
+            self.skipTest("pytest is not installed")
+
+        code = textwrap.dedent(
+            """
+            def hello(*, name: str = "world") -> str:
+                return f"hello {name}"
+
+            def test_hello(handofcats_runner):
+                result = handofcats_runner.invoke(hello, ["--name", "foo"])
+                assert (result.exit_code, result.stdout) == (0, "hello foo\\n")
+            """
+        )
+        here = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+        with tempfile.TemporaryDirectory() as d:
+            with open(os.path.join(d, "test_hello.py"), "w") as wf:
+                wf.write(code)
+            # loaded explicitly, even if the entry point is not installed
+            cmd = [sys.executable, "-m", "pytest", "-q", "-p", "no:cacheprovider"]
+            cmd.extend(["-p", "no:handofcats", "-p", "handofcats.pytest_plugin"])
+            p = subprocess.run(
+                cmd,
+                cwd=d,
+                env={**os.environ, "PYTHONPATH": os.path.abspath(here)},
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                universal_newlines=True,
+            )
+        self.assertEqual(p.returncode, 0, p.stdout)
+        self.assertIn("1 passed", p.stdout)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import unittest
+import builtins
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import textwrap
+from unittest import mock
+
+
+class RunPathTests(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        d = self.tmpdir.name
+        self.script = os.path.join(d, "hello.py")
+        with open(self.script, "w") as wf:
+            wf.write(
+                textwrap.dedent(
+                    """
+                    from handofcats import as_command
+
+
+                    @as_command
+                    def hello(*, name: str = "world") -> None:
+                        print(f"hello {name}", __name__)
+                    """
+                )
+            )
+        patcher = mock.patch.dict(
+            os.environ, {"HANDOFCATS_CACHE_DIR": os.path.join(d, "cache")}
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.tmpdir.cleanup)
+
+    def _run(self, argv):
+        from handofcats.actions.run import main
+
+        buf = io.StringIO()
+        with contextlib.redirect_stdout(buf):
+            main(argv)
+        return buf.getvalue()
+
+    def test_it(self):
+        from handofcats.actions.run import load_code
+
+        with mock.patch.object(sys, "dont_write_bytecode", False):
+            with self.subTest("run as __main__"):
+                main_module = sys.modules["__main__"]
+                stdout = self._run([self.script, "--name", "foo"])
+                self.assertEqual(stdout, "hello foo __main__\n")
+                self.assertIs(sys.modules["__main__"], main_module)  # restored
+
+            with self.subTest("cached"):
+                _, cache_path = load_code(self.script)
+                self.assertTrue(os.path.exists(cache_path))
+                with mock.patch("builtins.compile") as compile:
+                    load_code(self.script)
+                compile.assert_not_called()
+
+            with self.subTest("re-compiled, if the source is changed"):
+                with open(self.script, "a") as wf:
+                    wf.write("# changed\n")
+                with mock.patch.object(
+                    builtins, "compile", wraps=builtins.compile
+                ) as compile_:
+                    _, new_cache_path = load_code(self.script)
+                    load_code(self.script)
+                self.assertEqual(compile_.call_count, 1)
+                self.assertEqual(cache_path, new_cache_path)  # overwritten
+                self.assertEqual(
+                    os.listdir(os.path.dirname(cache_path)),
+                    [os.path.basename(cache_path)],
+                )
+
+    def test_options_before_script(self):
+        with self.assertRaises(SystemExit) as cm:  # by the script's parser
+            self._run(["--no-cache", self.script, "-h"])
+        self.assertEqual(cm.exception.code, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+import unittest
+import json
+
+
+def add(x: int, y: int = 1) -> int:
+    return x + y
+
+
+def hello(*, name: str = "world") -> None:
+    print(f"hello {name}")
+
+
+class ServeTests(unittest.TestCase):
+    def setUp(self):
+        import threading
+        from handofcats.driver import MultiDriver
+        from handofcats.actions.serve import Server, get_endpoints
+
+        self.server = Server(
+            ("127.0.0.1", 0),
+            get_endpoints(MultiDriver([add, hello])),
+            workers=2,
+            keepalive_timeout=0.2,
+        )
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _request(self, path, data=None):
+        import urllib.error
+        import urllib.request
+
+        host, port = self.server.server_address[:2]
+        req = urllib.request.Request(
+            f"http://{host}:{port}{path}",
+            data=None if data is None else json.dumps(data).encode("utf-8"),
+            method="GET" if data is None else "POST",
+        )
+        try:
+            with urllib.request.urlopen(req, timeout=10) as res:
+                return res.status, json.load(res)
+        except urllib.error.HTTPError as e:
+            return e.code, json.load(e)
+
+    def test_it(self):
+        with self.subTest("call"):
+            self.assertEqual(
+                self._request("/add", {"x": 10}), (200, {"result": 11, "output": ""})
+            )
+        with self.subTest("invalid params"):
+            status, body = self._request("/add", {"x": "10"})
+            self.assertEqual(status, 400)
+            self.assertIn("x:", body["error"])
+        with self.subTest("printed output"):
+            self.assertEqual(
+                self._request("/hello", {"name": "foo"}),
+                (200, {"result": None, "output": "hello foo\n"}),
+            )
+        with self.subTest("unknown command"):
+            self.assertEqual(self._request("/sub", {})[0], 404)
+        with self.subTest("stats"):
+            status, body = self._request("/_stats")
+            self.assertEqual((body["add"]["count"], body["add"]["errors"]), (2, 1))
+
+    def test_output__captured_per_request(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        names = [f"foo{i}" for i in range(8)]
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            got = list(
+                executor.map(
+                    lambda name: self._request("/hello", {"name": name}), names
+                )
+            )
+        self.assertEqual(
+            [body["output"] for _, body in got], [f"hello {name}\n" for name in names]
+        )
+
+    def test_idle_connections__more_than_workers(self):
+        import socket
+
+        conns = []
+        try:
+            for _ in range(3):  # holding the workers (workers=2)
+                conns.append(socket.create_connection(self.server.server_address))
+
+            # idle connections are closed after keepalive_timeout
+            self.assertEqual(self._request("/add", {"x": 1})[1]["result"], 2)
+        finally:
+            for conn in conns:
+                conn.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+import unittest
+import os
+import subprocess
+import sys
+import tempfile
+import textwrap
+
+
+class EjectTargetsTests(unittest.TestCase):
+    package = "_handofcats_ejected_pkg"
+
+    def _write(self, path, code):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as wf:
+            wf.write(textwrap.dedent(code))
+
+    def tearDown(self):
+        import handofcats
+
+        handofcats._default_multi_driver = None
+        for name in list(sys.modules):
+            if name.startswith(self.package):
+                del sys.modules[name]
+
+    def test_it(self):
+        from handofcats.setuptools_ext import eject_targets
+
+        with tempfile.TemporaryDirectory() as build_lib:
+            pkg = os.path.join(build_lib, self.package)
+            self._write(os.path.join(pkg, "__init__.py"), "")
+            self._write(
+                os.path.join(pkg, "util.py"),
+                """
+                def greet(name):
+                    return f"hello {name}"
+                """,
+            )
+            self._write(
+                os.path.join(pkg, "cli.py"),
+                """
+                from handofcats import as_command
+                from .util import greet
+
+
+                @as_command
+                def hello(*, name: str = "world") -> None:
+                    print(greet(name))
+                """,
+            )
+            self._write(
+                os.path.join(pkg, "multi.py"),
+                """
+                from handofcats import as_subcommand
+
+
+                @as_subcommand
+                def bye(*, name: str = "world") -> None:
+                    print(f"bye {name}")
+                """,
+            )
+
+            outputs = eject_targets(
+                {
+                    f"{self.package}._hello": f"{self.package}.cli:hello",
+                    f"{self.package}._multi": f"{self.package}.multi",
+                },
+                build_lib=build_lib,
+            )
+            self.assertEqual(
+                outputs,
+                [os.path.join(pkg, "_hello.py"), os.path.join(pkg, "_multi.py")],
+            )
+
+            code = f"""\
+import sys
+from {self.package}._hello import main
+main(["--name", "foo"])
+from {self.package}._multi import main
+main(["bye"])
+print("handofcats" in sys.modules)
+"""
+            p = subprocess.run(
+                [sys.executable, "-S", "-c", code],
+                cwd=build_lib,
+                env={"PATH": os.environ.get("PATH", "")},
+                stdout=subprocess.PIPE,
+                check=True,
+                text=True,
+            )
+            self.assertEqual(p.stdout, "hello foo\nbye world\nFalse\n")
+
+    def test_other_package(self):
+        from handofcats.setuptools_ext import eject_targets
+
+        with self.assertRaises(ValueError):
+            eject_targets({"other._hello": f"{self.package}.cli:hello"}, build_lib=".")
+
+
+if __name__ == "__main__":
+    unittest.main()
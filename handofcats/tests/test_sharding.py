@@ -0,0 +1,168 @@
+import typing as t
+import os
+import unittest
+from unittest import mock
+
+
+def collect(files: t.List[str], *, ids: t.Optional[t.Iterator[int]] = None) -> t.Any:
+    return {"files": files, "ids": None if ids is None else list(ids)}
+
+
+class ParseShardTests(unittest.TestCase):
+    def _callFUT(self, value):
+        from handofcats.sharding import parse_shard
+
+        return parse_shard(value)
+
+    def test_it(self):
+        from handofcats.sharding import Shard
+
+        self.assertEqual(self._callFUT("1/4"), Shard(0, 4))
+        self.assertEqual(self._callFUT("4/4"), Shard(3, 4))
+        self.assertEqual(str(self._callFUT("2/3")), "2/3")
+
+    def test_invalid(self):
+        for value in ["", "1", "0/4", "5/4", "a/4", "1/-1"]:
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError):
+                    self._callFUT(value)
+
+
+class ShardItemsTests(unittest.TestCase):
+    def _callFUT(self, items, shard, *, strategy):
+        from handofcats.sharding import shard_items
+
+        return shard_items(items, shard, strategy=strategy)
+
+    def test_disjoint_and_covering(self):
+        from handofcats.sharding import Shard, STRATEGIES
+
+        items = [f"item{i}" for i in range(23)]
+        for strategy in STRATEGIES:
+            with self.subTest(strategy=strategy):
+                shards = [
+                    self._callFUT(items, Shard(i, 4), strategy=strategy)
+                    for i in range(4)
+                ]
+                self.assertEqual(sorted(sum(shards, [])), sorted(items))
+                # deterministic
+                self.assertEqual(
+                    shards[1], self._callFUT(items, Shard(1, 4), strategy=strategy)
+                )
+
+    def test_range(self):
+        from handofcats.sharding import Shard
+
+        items = list(range(10))
+        got = [self._callFUT(items, Shard(i, 3), strategy="range") for i in range(3)]
+        self.assertEqual(got, [[0, 1, 2], [3, 4, 5], [6, 7, 8, 9]])
+
+    def test_hash__lazy(self):
+        from handofcats.sharding import Shard
+
+        consumed = []
+
+        def gen():
+            for i in range(100):
+                consumed.append(i)
+                yield i
+
+        got = self._callFUT(gen(), Shard(0, 2), strategy="hash")
+        self.assertEqual(consumed, [])
+        next(got)
+        self.assertLess(len(consumed), 100)
+
+
+class ShardCustomizeTests(unittest.TestCase):
+    def _run(self, argv, *, fn=collect, ignore_shard=False):
+        from handofcats.config import Config
+        from handofcats.driver import Driver
+
+        config = Config(cont=lambda x: x, ignore_shard=ignore_shard)
+        return Driver(fn, config=config).run(argv)
+
+    def test_not_activated(self):
+        got = self._run(["a", "b", "c"])
+        self.assertEqual(got, {"files": ["a", "b", "c"], "ids": None})
+
+    def test_opt_in(self):
+        import contextlib
+        import io
+
+        got = self._run(["a", "b"], ignore_shard=True)
+        self.assertEqual(got, {"files": ["a", "b"], "ids": None})
+
+        with contextlib.redirect_stderr(io.StringIO()):
+            with self.assertRaises(SystemExit):
+                self._run(["a", "--shard", "1/2"], ignore_shard=True)
+
+        # the envvar is not ignored silently
+        with mock.patch.dict(os.environ, {"HANDOFCATS_SHARD": "1/2"}):
+            with contextlib.redirect_stderr(io.StringIO()) as stderr:
+                with self.assertRaises(SystemExit) as cm:
+                    self._run(["a", "b"], ignore_shard=True)
+        self.assertEqual(cm.exception.code, 2)
+        self.assertIn("HANDOFCATS_SHARD is set, but sharding is disabled", stderr.getvalue())
+
+    def test_it(self):
+        got = self._run(["a", "b", "c", "d", "--shard", "2/2"])
+        self.assertEqual(got, {"files": ["c", "d"], "ids": None})
+
+    def test_only_positional__by_default(self):
+        def tag(files: t.List[str], *, tags: t.List[str]) -> t.Any:
+            return {"files": files, "tags": tags}
+
+        argv = ["a", "b", "--tags", "x", "--tags", "y", "--shard", "1/2"]
+        with self.subTest("default"):
+            got = self._run(argv, fn=tag)
+            self.assertEqual(got, {"files": ["a"], "tags": ["x", "y"]})
+        with self.subTest("--shard-params"):
+            got = self._run([*argv, "--shard-params", "tags"], fn=tag)
+            self.assertEqual(got, {"files": ["a", "b"], "tags": ["x"]})
+
+    def test_envvar(self):
+        import tempfile
+
+        with tempfile.TemporaryDirectory() as d:
+            filename = os.path.join(d, "ids.txt")
+            with open(filename, "w") as wf:
+                wf.write("\n".join(str(i) for i in range(6)))
+
+            env = {"HANDOFCATS_SHARD": "1/3", "HANDOFCATS_SHARD_PARAMS": "ids"}
+            with mock.patch.dict(os.environ, env):
+                got = self._run(["a", "b", "c", "--ids", filename])
+        self.assertEqual(got, {"files": ["a", "b", "c"], "ids": [0, 1]})
+
+    def test_conflicted(self):
+        def run(files: t.List[str], *, shard: int = 0) -> t.Any:
+            return {"files": files, "shard": shard}
+
+        got = self._run(["a", "b", "--shard", "1"], fn=run)
+        self.assertEqual(got, {"files": ["a", "b"], "shard": 1})  # the command's one
+
+    def test_invalid(self):
+        import contextlib
+        import io
+
+        with contextlib.redirect_stderr(io.StringIO()) as stderr:
+            with self.assertRaises(SystemExit) as cm:
+                self._run(["a", "--shard", "3/2"])
+        self.assertEqual(cm.exception.code, 2)
+        self.assertIn("invalid shard", stderr.getvalue())
+
+    def test_invalid__envvar(self):
+        import contextlib
+        import io
+
+        candidates = [
+            ({"HANDOFCATS_SHARD": "3/2"}, "HANDOFCATS_SHARD: invalid shard"),
+            ({"HANDOFCATS_SHARD_BY": "x"}, "HANDOFCATS_SHARD_BY: invalid choice"),
+        ]
+        for env, expected in candidates:
+            with self.subTest(env=env):
+                with mock.patch.dict(os.environ, env):
+                    with contextlib.redirect_stderr(io.StringIO()) as stderr:
+                        with self.assertRaises(SystemExit) as cm:
+                            self._run(["a"])
+                self.assertEqual(cm.exception.code, 2)
+                self.assertIn(expected, stderr.getvalue())
@@ -0,0 +1,102 @@
+import unittest
+import json
+import os.path
+import tempfile
+
+
+class Tests(unittest.TestCase):
+    def _makeOne(self, *, format, output):
+        from handofcats.tracing import Tracer
+
+        return Tracer(format=format, output=output)
+
+    def test_json(self):
+        with tempfile.TemporaryDirectory() as d:
+            output = os.path.join(d, "trace.jsonl")
+            target = self._makeOne(format="json", output=output)
+
+            for _ in range(2):
+                with target.phase("run"):
+                    with target.phase("call", fn="f"):
+                        pass
+                target.flush()
+
+            with open(output) as rf:
+                records = [json.loads(line) for line in rf]
+
+        self.assertEqual(len(records), 2)
+        got = [(p["name"], p["args"]) for p in records[0]["phases"]]
+        self.assertEqual(got, [("run", {}), ("call", {"fn": "f"})])
+
+    def test_chrome(self):
+        with tempfile.TemporaryDirectory() as d:
+            output = os.path.join(d, "trace.json")
+            target = self._makeOne(format="chrome", output=output)
+
+            with target.phase("run"):
+                pass
+            target.flush()
+
+            with open(output) as rf:
+                record = json.load(rf)
+
+        self.assertEqual([ev["name"] for ev in record["traceEvents"]], ["run"])
+        self.assertEqual(record["traceEvents"][0]["ph"], "X")
+
+
+class ActivationTests(unittest.TestCase):
+    def setUp(self):
+        from handofcats import tracing
+
+        self._settings = tracing._settings
+        tracing._settings = None
+
+    def tearDown(self):
+        from handofcats import tracing
+
+        tracing._settings = self._settings
+
+    def test_invalid_format__ignored(self):
+        import contextlib
+        import io
+        from unittest import mock
+        from handofcats import tracing
+
+        stderr = io.StringIO()
+        with mock.patch.dict(os.environ, {"HANDOFCATS_TRACE": "1"}):
+            with contextlib.redirect_stderr(stderr):
+                with tracing.activated() as tracer:
+                    self.assertFalse(tracer.enabled)
+        self.assertIn("HANDOFCATS_TRACE='1' is ignored", stderr.getvalue())
+
+    def test_concurrent_runs__recorded_separately(self):
+        from concurrent.futures import ThreadPoolExecutor
+        from unittest import mock
+        from handofcats.config import Config
+        from handofcats.driver import Driver
+
+        def f(*, name: str) -> str:
+            return name
+
+        driver = Driver(f, config=Config(cont=lambda x: x))
+        with tempfile.TemporaryDirectory() as d:
+            output = os.path.join(d, "trace.jsonl")
+            env = {"HANDOFCATS_TRACE": "json", "HANDOFCATS_TRACE_OUTPUT": output}
+            with mock.patch.dict(os.environ, env):
+                with ThreadPoolExecutor(max_workers=4) as executor:
+                    argvs = [["--name", str(i)] for i in range(8)]
+                    results = list(executor.map(driver.run, argvs))
+
+            with open(output) as rf:
+                records = [json.loads(line) for line in rf]
+
+        self.assertEqual(results, [str(i) for i in range(8)])
+        self.assertEqual(len(records), 8)
+        for record in records:
+            names = [p["name"] for p in record["phases"]]
+            self.assertEqual(names.count("run"), 1)
+            self.assertEqual(names.count("call"), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+import unittest
+
+
+def hello(*, name: str = "world") -> None:
+    pass
+
+
+def bye(n: int) -> None:
+    pass
+
+
+class Tests(unittest.TestCase):
+    def _callFUT(self, target, lines, **kwargs):
+        from handofcats.actions.validate import validate
+
+        return validate(target, lines, **kwargs)
+
+    def _makeDriver(self):
+        from handofcats.driver import MultiDriver
+
+        return MultiDriver([hello, bye])
+
+    def test_it(self):
+        lines = [
+            "# comment",
+            "hello --name foo",
+            "",
+            "bye 10",
+            "bye x",
+            "byebye",
+            "hello 'unclosed",
+        ]
+        got = self._callFUT(self._makeDriver(), lines)
+        self.assertEqual([err.lineno for err in got], [5, 6, 7])
+
+    def test_builtin_options(self):
+        lines = [
+            "--logging DEBUG hello --name foo",
+            "--profile hello",
+            "--logging XXX hello",
+        ]
+        got = self._callFUT(self._makeDriver(), lines)
+        self.assertEqual([err.lineno for err in got], [3])
+
+    def test_skip(self):
+        got = self._callFUT(hello, ["python cli.py --name foo"], skip=2)
+        self.assertEqual(got, [])
+
+    def test_parallel(self):
+        lines = ["bye 10"] * 50 + ["bye x"] + ["bye 10"] * 50
+        got = self._callFUT(self._makeDriver(), lines, jobs=2)
+        self.assertEqual([err.lineno for err in got], [51])
+
+    def test_parallel__concurrent_calls(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        # each call has its own target, not overwritten by the others
+        targets = [self._makeDriver(), hello]
+        lines = ["bye 10"] * 20 + ["--name foo"] * 20
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(self._callFUT, target, lines, jobs=2)
+                for target in targets
+            ]
+            got = [[err.lineno for err in f.result()] for f in futures]
+        self.assertEqual(got, [list(range(21, 41)), list(range(1, 21))])
+
+
+if __name__ == "__main__":
+    unittest.main()
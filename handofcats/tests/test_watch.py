@@ -0,0 +1,129 @@
+import unittest
+import io
+import os
+import sys
+import tempfile
+import textwrap
+
+
+class WatcherTests(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+
+    def tearDown(self):
+        import handofcats
+
+        handofcats._default_multi_driver = None
+        for name, module in list(sys.modules.items()):
+            filepath = getattr(module, "__file__", None) or ""
+            if filepath.startswith(self.tmpdir.name):
+                del sys.modules[name]
+
+    def _write(self, name, code, *, mode="w"):
+        path = os.path.join(self.tmpdir.name, name)
+        with open(path, mode) as wf:
+            wf.write(textwrap.dedent(code))
+        return path
+
+    def test_detect_entry_point(self):
+        from handofcats.actions.watch import detect_entry_point
+
+        code = """
+        from handofcats import as_command
+
+
+        @as_command
+        def hello() -> None:
+            pass
+        """
+        self.assertEqual(
+            detect_entry_point("x.py", textwrap.dedent(code)), "x.py:hello"
+        )
+        code = """
+        @as_subcommand(name="bye")
+        def hello() -> None:
+            pass
+        """
+        self.assertEqual(detect_entry_point("x.py", textwrap.dedent(code)), "x.py")
+        self.assertIsNone(detect_entry_point("x.py", "def hello(): pass"))
+
+    def test_poll(self):
+        from handofcats.actions.watch import Watcher
+
+        self._write(
+            "_watched_helpers.py",
+            """
+            def greet(name):
+                return f"hello {name}"
+            """,
+        )
+        cli = self._write(
+            "cli.py",
+            """
+            from handofcats import as_command
+            from _watched_helpers import greet
+
+
+            @as_command
+            def hello(*, name: str = "world") -> None:
+                print(greet(name))
+            """,
+        )
+        other = self._write(
+            "other.py",
+            """
+            from handofcats import as_command
+
+
+            @as_command
+            def bye() -> None:
+                print("bye")
+            """,
+        )
+
+        import types
+
+        out = io.StringIO()
+        watcher = Watcher([self.tmpdir.name], out=out)
+
+        with self.subTest("at first, all"):
+            unrelated = types.ModuleType("other")  # same name as other.py's stem
+            sys.modules["other"] = unrelated
+            try:
+                results = watcher.poll()
+                self.assertIs(sys.modules["other"], unrelated)  # not evicted
+            finally:
+                del sys.modules["other"]
+            self.assertEqual(sorted(target.path for target, _ in results), [cli, other])
+            with open(os.path.join(self.tmpdir.name, "cli-exposed.py")) as rf:
+                self.assertIn("def main(", rf.read())
+
+        with self.subTest("no changes"):
+            self.assertEqual(watcher.poll(), [])
+
+        with self.subTest("only the affected files (importing the changed module)"):
+            self._write("_watched_helpers.py", "# changed\n", mode="a")
+            results = watcher.poll()
+            self.assertEqual([target.path for target, _ in results], [cli])
+            self.assertIn("unchanged", out.getvalue())
+
+        with self.subTest("error"):
+            self._write("other.py", "from handofcats import as_command\n")
+            self._write("cli.py", "\nimport _no_such_module\n", mode="a")
+            results = watcher.poll()
+            self.assertEqual([(t.path, e) for t, e in results], [(cli, None)])
+            self.assertIn("error", out.getvalue())
+
+    def test_out__resolved_at_call_time(self):
+        import contextlib
+        from handofcats.actions.watch import Watcher
+
+        watcher = Watcher([self.tmpdir.name])
+        stderr = io.StringIO()
+        with contextlib.redirect_stderr(stderr):
+            self.assertIs(watcher.out, stderr)
+
+
+if __name__ == "__main__":
+    unittest.main()
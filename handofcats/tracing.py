@@ -0,0 +1,176 @@
+"""phase timing trace, activated by envvar
+
+- HANDOFCATS_TRACE=json -- one json record per run (a line)
+- HANDOFCATS_TRACE=chrome -- chrome's trace event format (chrome://tracing, perfetto)
+- HANDOFCATS_TRACE_OUTPUT=<file> -- output file (default: stderr)
+
+if not activated (or outside of runs), get_tracer() returns a no-op tracer.
+each run (Driver.run()) has its own tracer, so concurrent runs in threads are recorded separately.
+"""
+import typing as t
+import contextlib
+import contextvars
+import json
+import os
+import sys
+import threading
+import time
+from functools import wraps
+
+_nullcontext = contextlib.nullcontext()
+
+
+FORMATS = ("json", "chrome")
+
+
+class Tracer:
+    enabled = True
+
+    def __init__(self, *, format: str = "json", output: t.Optional[str] = None):
+        if format not in FORMATS:
+            raise ValueError(f"unsupported trace format: {format!r}")
+        self.format = format
+        self.output = output
+        self.events: t.List[t.Dict[str, t.Any]] = []
+        self.argv = sys.argv[:]
+
+    @contextlib.contextmanager
+    def phase(self, name: str, **args: t.Any) -> t.Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            self.events.append(
+                {
+                    "name": name,
+                    "start": start,
+                    "duration": end - start,
+                    "tid": threading.get_ident(),
+                    "args": args,
+                }
+            )
+
+    def flush(self) -> None:
+        if not self.events:
+            return
+        events, self.events = self.events, []
+
+        if self.format == "chrome":
+            record = self._as_chrome_trace(events)
+        else:
+            record = self._as_json(events)
+
+        if self.output is None:
+            print(json.dumps(record), file=sys.stderr)
+        elif self.format == "chrome":
+            with open(self.output, "w") as wf:
+                json.dump(record, wf)
+        else:
+            with open(self.output, "a") as wf:
+                wf.write(json.dumps(record) + "\n")  # a line per write (by concurrent runs)
+
+    def _as_json(self, events: t.List[t.Dict[str, t.Any]]) -> t.Dict[str, t.Any]:
+        origin = min(ev["start"] for ev in events)
+        phases = [
+            {
+                "name": ev["name"],
+                "start_ms": (ev["start"] - origin) * 1000,
+                "duration_ms": ev["duration"] * 1000,
+                "args": ev["args"],
+            }
+            for ev in sorted(events, key=lambda ev: ev["start"])
+        ]
+        return {"pid": os.getpid(), "argv": self.argv, "phases": phases}
+
+    def _as_chrome_trace(
+        self, events: t.List[t.Dict[str, t.Any]]
+    ) -> t.Dict[str, t.Any]:
+        pid = os.getpid()
+        trace_events = [
+            {
+                "name": ev["name"],
+                "ph": "X",
+                "ts": ev["start"] * 1_000_000,
+                "dur": ev["duration"] * 1_000_000,
+                "pid": pid,
+                "tid": ev["tid"],
+                "args": ev["args"],
+            }
+            for ev in sorted(events, key=lambda ev: ev["start"])
+        ]
+        return {"traceEvents": trace_events, "otherData": {"argv": self.argv}}
+
+
+class _NullTracer:
+    """no effect"""
+
+    enabled = False
+
+    def phase(self, name: str, **args: t.Any) -> t.ContextManager[None]:
+        return _nullcontext
+
+    def flush(self) -> None:
+        pass
+
+
+_null_tracer = _NullTracer()
+_settings: t.Optional[t.Tuple[t.Optional[str], t.Optional[str]]] = None
+# the tracer of the current run (per thread and per task, not shared by concurrent runs)
+_current: "contextvars.ContextVar[t.Optional[Tracer]]" = contextvars.ContextVar(
+    "handofcats_tracer", default=None
+)
+
+
+def _get_settings() -> t.Tuple[t.Optional[str], t.Optional[str]]:
+    """(format, output), format is None if not activated"""
+    global _settings
+    if _settings is None:
+        fmt: t.Optional[str] = os.environ.get("HANDOFCATS_TRACE", "").strip()
+        if fmt and fmt not in FORMATS:
+            print(
+                f"** {__name__}: HANDOFCATS_TRACE={fmt!r} is ignored (supported: {', '.join(FORMATS)}) **",
+                file=sys.stderr,
+            )
+            fmt = None
+        _settings = (fmt or None, os.environ.get("HANDOFCATS_TRACE_OUTPUT") or None)
+    return _settings
+
+
+def get_tracer() -> t.Union[Tracer, _NullTracer]:
+    """the tracer of the current run, or the no-op tracer (outside of runs, or not activated)"""
+    return _current.get() or _null_tracer
+
+
+@contextlib.contextmanager
+def activated() -> t.Iterator[t.Union[Tracer, _NullTracer]]:
+    """start the new trace (if not started), and flush the record at the end of it"""
+    fmt, output = _get_settings()
+    if fmt is None or _current.get() is not None:
+        yield get_tracer()
+        return
+
+    tracer = Tracer(format=fmt, output=output)
+    token = _current.set(tracer)
+    try:
+        yield tracer
+    finally:
+        _current.reset(token)
+        tracer.flush()
+
+
+def traced_run(method):
+    """trace the whole of Driver.run(), and flush the record at the end of it"""
+
+    @wraps(method)
+    def _run(self, *args, **kwargs):
+        with activated() as tracer:
+            if not tracer.enabled:
+                return method(self, *args, **kwargs)
+            try:
+                with tracer.phase("run", driver=self.__class__.__name__):
+                    return method(self, *args, **kwargs)
+            finally:
+                tracer.flush()  # before fast exit (see ./fast_exit.py)
+
+    return _run
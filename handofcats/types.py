@@ -21,7 +21,11 @@ class ArgumentParser(tx.Protocol):
 TargetFunction = t.Callable[..., t.Any]
 
 
-CustomizeActivateFunction = t.Callable[[t.Dict[str, t.Any]], None]
+# if returning a function, the target function is wrapped by it (e.g. --profile)
+CustomizeWrapFunction = t.Callable[[TargetFunction], TargetFunction]
+CustomizeActivateFunction = t.Callable[
+    [t.Dict[str, t.Any]], t.Optional[CustomizeWrapFunction]
+]
 CustomizeSetupFunction = t.Callable[[ArgumentParser], CustomizeActivateFunction]
 
 
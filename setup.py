@@ -50,5 +50,8 @@ setup(
     entry_points="""
 [console_scripts]
 handofcats=handofcats.cli:main
+
+[pytest11]
+handofcats=handofcats.pytest_plugin
 """,
 )